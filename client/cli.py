@@ -6,7 +6,7 @@ import os
 import math
 from ollama import pull
 
-def ocr_upload(file_path, ocr_cache, prompt, prompt_file=None, model='llama3.1', strategy='llama_vision', storage_profile='default', storage_filename=None, language='en'):
+def ocr_upload(file_path, ocr_cache, prompt, prompt_file=None, model='llama3.1', strategy='llama_vision', storage_profile='default', storage_filename=None, language='en', render_profile=None):
     ocr_url = os.getenv('OCR_UPLOAD_URL', 'http://localhost:8000/ocr/upload')
     files = {'file': open(file_path, 'rb')}
     if not ocr_cache:
@@ -16,6 +16,9 @@ def ocr_upload(file_path, ocr_cache, prompt, prompt_file=None, model='llama3.1',
 
     if storage_filename:
         data['storage_filename'] = storage_filename
+
+    if render_profile:
+        data['render_profile'] = render_profile
     
     print(data) # @todo change to log debug in the future
 
@@ -44,7 +47,7 @@ def ocr_upload(file_path, ocr_cache, prompt, prompt_file=None, model='llama3.1',
         print(f"Failed to upload file: {response.text}")
         return None
 
-def ocr_request(file_path, ocr_cache, prompt, prompt_file=None, model='llama3.1', strategy='llama_vision', storage_profile='default', storage_filename=None, language='en'):
+def ocr_request(file_path, ocr_cache, prompt, prompt_file=None, model='llama3.1', strategy='llama_vision', storage_profile='default', storage_filename=None, language='en', render_profile=None):
     ocr_url = os.getenv('OCR_REQUEST_URL', 'http://localhost:8000/ocr/request')
     with open(file_path, 'rb') as f:
         file_content = base64.b64encode(f.read()).decode('utf-8')
@@ -60,6 +63,9 @@ def ocr_request(file_path, ocr_cache, prompt, prompt_file=None, model='llama3.1'
 
     if storage_filename:
         data['storage_filename'] = storage_filename
+
+    if render_profile:
+        data['render_profile'] = render_profile
     
     if prompt_file:
         try:
@@ -179,6 +185,7 @@ def main():
     ocr_parser.add_argument('--storage_profile', type=str, default='default', help='Storage profile to use for the file')
     ocr_parser.add_argument('--storage_filename', type=str, default=None, help='Storage filename to use for the file. You may use some formatting - see the docs')
     ocr_parser.add_argument('--language', type=str, default='en', help='Language to use for the OCR task')
+    ocr_parser.add_argument('--render_profile', type=str, default=None, help='Render profile (see config/strategies.yaml) used to rasterize the pages')
     #ocr_parser.add_argument('--async_mode', action='store_true', help='Enable async mode for the OCR task')
 
     # Sub-command for uploading a file via file upload - @deprecated - it's a backward compatibility gimmick
@@ -194,6 +201,7 @@ def main():
     ocr_parser.add_argument('--storage_profile', type=str, default='default', help='Storage profile to use for the file')
     ocr_parser.add_argument('--storage_filename', type=str, default=None, help='Storage filename to use for the file. You may use some formatting - see the docs')
     ocr_parser.add_argument('--language', type=str, default='en', help='Language to use for the OCR task')
+    ocr_parser.add_argument('--render_profile', type=str, default=None, help='Render profile (see config/strategies.yaml) used to rasterize the pages')
     #ocr_parser.add_argument('--async_mode', action='store_true', help='Enable async mode for the OCR task')
 
 
@@ -210,6 +218,7 @@ def main():
     ocr_request_parser.add_argument('--storage_profile', type=str, default='default', help='Storage profile to use. You may use some formatting - see the docs')
     ocr_request_parser.add_argument('--storage_filename', type=str, default=None, help='Storage filename to use')
     ocr_request_parser.add_argument('--language', type=str, default='en', help='Language to use for the OCR task')
+    ocr_request_parser.add_argument('--render_profile', type=str, default=None, help='Render profile (see config/strategies.yaml) used to rasterize the pages')
 
     # Sub-command for getting the result
     result_parser = subparsers.add_parser('result', help='Get the OCR result by specified task id.')
@@ -245,7 +254,7 @@ def main():
 
     if args.command == 'ocr' or args.command == 'ocr_upload':
         print(args)
-        result = ocr_upload(args.file, False if args.disable_ocr_cache else args.ocr_cache, args.prompt, args.prompt_file, args.model, args.strategy, args.storage_profile, args.storage_filename, args.language)
+        result = ocr_upload(args.file, False if args.disable_ocr_cache else args.ocr_cache, args.prompt, args.prompt_file, args.model, args.strategy, args.storage_profile, args.storage_filename, args.language, args.render_profile)
         if result is None:
             print("Error uploading file.")
             return
@@ -257,7 +266,7 @@ def main():
             if text_result:
                 print(text_result)
     elif args.command == 'ocr_request':
-        result = ocr_request(args.file, False if args.disable_ocr_cache else args.ocr_cache, args.prompt, args.prompt_file, args.model, args.strategy, args.storage_profile, args.storage_filename, args.language)
+        result = ocr_request(args.file, False if args.disable_ocr_cache else args.ocr_cache, args.prompt, args.prompt_file, args.model, args.strategy, args.storage_profile, args.storage_filename, args.language, args.render_profile)
         if result is None:
             print("Error uploading file.")
             return
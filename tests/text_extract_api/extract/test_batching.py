@@ -0,0 +1,90 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from text_extract_api.extract.batching import BatchPlanner, pad_batch, readtext_batched
+
+
+def page(value: int, height: int, width: int) -> np.ndarray:
+    image = np.full((height, width), 255, np.uint8)
+    image[0, 0] = value
+    return image
+
+
+class FakeReader:
+    """ Reads the value of the top left pixel; batches must be stacked into one array """
+
+    def __init__(self, fail_batches: bool = False, max_pages: int = 16):
+        self.batches = []
+        self.fail_batches = fail_batches
+        self.max_pages = max_pages
+
+    def readtext(self, image, detail=1, batch_size=1):
+        return [str(image[0, 0])]
+
+    def readtext_batched(self, images, detail=1, batch_size=1):
+        if self.fail_batches:
+            raise RuntimeError("cuDNN error: CUDNN_STATUS_INTERNAL_ERROR")
+        if len(images) > self.max_pages:
+            raise RuntimeError("CUDA out of memory. Tried to allocate 2.00 GiB")
+        self.batches.append(np.stack(images).shape)
+        return [[str(image[0, 0])] for image in images]
+
+
+class TestBatching(unittest.TestCase):
+
+    def test_pad_batch(self):
+        padded = pad_batch([page(1, 10, 20), np.zeros((15, 5, 3), np.uint8)])
+        self.assertEqual([image.shape for image in padded], [(15, 20, 3), (15, 20, 3)])
+        self.assertEqual(int(padded[0][0, 0, 0]), 1)
+        self.assertEqual(int(padded[1][14, 19, 0]), 255)
+
+    def test_results_keep_the_page_order(self):
+        reader = FakeReader()
+        images = [page(1, 100, 80), page(2, 300, 200), page(3, 110, 80), page(4, 290, 210)]
+
+        results = readtext_batched(reader, images, BatchPlanner(1 << 40, max_batch_size=2))
+
+        self.assertEqual(results, [["1"], ["2"], ["3"], ["4"]])
+        # Similar sizes end up in the same batch
+        self.assertEqual(reader.batches, [(2, 110, 80), (2, 300, 210)])
+
+    def test_failed_batch_is_read_page_by_page(self):
+        results = readtext_batched(FakeReader(fail_batches=True), [page(1, 10, 10), page(2, 10, 10)],
+                                   BatchPlanner(1 << 40))
+        self.assertEqual(results, [["1"], ["2"]])
+
+    def test_plan_groups_by_size_within_budget(self):
+        planner = BatchPlanner(memory_budget=4 * 100 * 100, bytes_per_pixel=1)
+        shapes = [(100, 100), (2000, 1500), (98, 100), (100, 99), (1990, 1500), (100, 100), (100, 100)]
+        # Small pages together (at most 4 fit), the large ones alone
+        self.assertEqual(planner.plan(shapes), [[2, 3, 0, 5], [6], [4], [1]])
+
+    def test_full_pages_are_batched_within_a_realistic_budget(self):
+        # Half of a 16 GB GPU: letter pages at 300 dpi (ocr_grayscale profile) three at a time, at 200 dpi four
+        planner = BatchPlanner(memory_budget=8 << 30)
+        self.assertEqual([len(batch) for batch in planner.plan([(3300, 2550)] * 4)], [3, 1])
+        self.assertEqual([len(batch) for batch in planner.plan([(2200, 1700)] * 6)], [4, 2])
+
+    def test_from_env(self):
+        with patch.dict(os.environ, {'BATCH_MEMORY_MB': '100', 'GPU_BATCH_SIZE': '4', 'BATCH_BYTES_PER_PIXEL': '1024'}):
+            planner = BatchPlanner.from_env()
+        self.assertEqual((planner.memory_budget, planner.max_batch_size, planner.bytes_per_pixel),
+                         (100 << 20, 4, 1024))
+
+    def test_out_of_memory_splits_the_batch(self):
+        reader = FakeReader(max_pages=2)
+        planner = BatchPlanner(1 << 40, max_batch_size=8)
+        images = [page(index, 100, 100) for index in range(8)]
+
+        results = readtext_batched(reader, images, planner)
+
+        self.assertEqual(results, [[str(index)] for index in range(8)])
+        self.assertEqual(planner.max_batch_size, 2)
+        self.assertEqual([shape[0] for shape in reader.batches], [2, 2, 2, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
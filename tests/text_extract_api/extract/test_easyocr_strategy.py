@@ -0,0 +1,45 @@
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from PIL import Image
+
+from text_extract_api.extract.extract_result import ExtractResult
+from text_extract_api.extract.reader_pool import ReaderPool
+from text_extract_api.extract.strategies.easyocr import EasyOCRStrategy
+from text_extract_api.files.file_formats.image import ImageFileFormat
+
+
+class FakeReader:
+    """ Reads the size of the image """
+
+    def __init__(self, languages, gpu, backend):
+        pass
+
+    def readtext(self, image, detail=1):
+        return [f"{image.shape[1]}x{image.shape[0]}"]
+
+
+def image_format(size: tuple) -> ImageFileFormat:
+    buffer = BytesIO()
+    Image.new("L", size, "white").save(buffer, format="PNG")
+    return ImageFileFormat.from_binary(buffer.getvalue(), "scan.png", "image/png")
+
+
+class TestEasyOCRStrategy(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(ReaderPool, '_shared', ReaderPool(factory=FakeReader, sizer=lambda reader: 0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_image_is_read(self):
+        result = EasyOCRStrategy().extract_text(image_format((60, 40)))
+
+        self.assertIsInstance(result, ExtractResult)
+        self.assertEqual(result.text, "60x40")
+        self.assertEqual([page['page'] for page in result.metadata['pages']], ["scan.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()
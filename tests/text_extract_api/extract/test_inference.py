@@ -0,0 +1,28 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from text_extract_api.extract.inference import InferenceProfile
+
+
+class TestInferenceProfile(unittest.TestCase):
+
+    def test_from_config(self):
+        self.assertIsNone(InferenceProfile.from_config(None))
+        self.assertIsNone(InferenceProfile.from_config({'enabled': False}))
+
+        profile = InferenceProfile.from_config({'threads': 3, 'interop_threads': 1, 'quantize': True})
+        self.assertEqual((profile.threads, profile.interop_threads, profile.inference_mode, profile.quantize),
+                         (3, 1, True, True))
+
+    def test_auto_threads_split_the_cpus_between_workers(self):
+        with patch('text_extract_api.extract.inference.available_cpu_count', return_value=8), \
+                patch.dict(os.environ, {'WORKERS_PER_HOST': '3'}):
+            self.assertEqual(InferenceProfile.from_config(True).threads, 2)
+        with patch('text_extract_api.extract.inference.available_cpu_count', return_value=2), \
+                patch.dict(os.environ, {'WORKERS_PER_HOST': '4'}):
+            self.assertEqual(InferenceProfile.from_config({'threads': 'auto'}).threads, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,163 @@
+import os
+import threading
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from ollama import ResponseError
+from PIL import Image
+
+from text_extract_api.extract import ollama_client
+from text_extract_api.extract.strategies.ollama import OllamaStrategy
+from text_extract_api.files.file_formats.image import ImageFileFormat
+
+MODEL = "llama3.2-vision"
+
+
+def page(number: int, size: tuple = (200, 100)) -> ImageFileFormat:
+    buffer = BytesIO()
+    Image.new("L", size, number).save(buffer, format="PNG")
+    return ImageFileFormat(buffer.getvalue(), f"page_{number}.png", "image/png")
+
+
+class FakeClient:
+    """
+    Stands in for the Ollama client - answers "<page number> " in two chunks.
+
+    A page listed in `after` answers only once the page it maps to has been read, so
+    earlier pages can be made to finish last - the wait times out unless both pages are
+    in flight at once. Fails on the page numbers in `failing_pages`.
+    """
+
+    def __init__(self, failing_pages=(), after=None, timeout: float = 5):
+        self.failing_pages = failing_pages
+        self.after = after or {}
+        self.timeout = timeout
+        self.images = []
+        self.sizes = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._finished = {}
+        self._lock = threading.Lock()
+
+    def chat(self, model, messages, stream=False):
+        self.images.append(messages[0]['images'][0])
+        with Image.open(BytesIO(messages[0]['images'][0])) as image:
+            number = image.getpixel((0, 0))
+            if isinstance(number, tuple):
+                number = number[0]
+            self.sizes[number] = image.size
+        return self._chunks(number)
+
+    def finished(self, number: int) -> threading.Event:
+        with self._lock:
+            return self._finished.setdefault(number, threading.Event())
+
+    def _chunks(self, number: int):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if number in self.after:
+                if not self.finished(self.after[number]).wait(self.timeout):
+                    raise AssertionError(f"Page {self.after[number]} was not read "
+                                         f"while page {number} was in flight")
+            if number in self.failing_pages:
+                raise ResponseError("model runner has unexpectedly stopped")
+            yield {'message': {'content': str(number)}}
+            yield {'message': {'content': " "}}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self.finished(number).set()
+
+
+class TestOllamaStrategy(unittest.TestCase):
+
+    def extract(self, pages, client: FakeClient, **config):
+        strategy = OllamaStrategy()
+        strategy.set_strategy_config(
+            dict({'model': MODEL, 'prompt': 'Read the page'}, **config))
+        states = []
+        strategy.set_update_state_callback(lambda state, meta: states.append(meta))
+
+        def page_images(file_format, pages_metadata=None):
+            for image in pages:
+                pages_metadata.append({'page': image.filename})
+                yield image
+
+        shared_client = 'text_extract_api.extract.strategies.ollama.shared_client'
+        with patch(shared_client, lambda: client), \
+                patch.object(strategy, 'page_images', page_images):
+            result = strategy.extract_text(pages[0])
+        self.assertEqual(len(states), 2 * len(pages))
+        return result
+
+    def test_pages_are_sent_from_memory_on_the_shared_client(self):
+        client = FakeClient()
+        result = self.extract([page(1), page(2)], client)
+        self.assertEqual(result.text, "1 2 ")
+        self.assertEqual(client.sizes, {1: (200, 100), 2: (200, 100)})
+        self.assertTrue(all(isinstance(image, bytes) for image in client.images))
+
+    def test_concurrent_pages_keep_the_page_order(self):
+        # Every page waits for the next one of its window - they finish in reverse order
+        client = FakeClient(after={0: 1, 1: 2, 3: 4, 4: 5})
+        pages = [page(number) for number in range(6)]
+        result = self.extract(pages, client, concurrency=3)
+
+        self.assertEqual(result.text, "0 1 2 3 4 5 ")
+        self.assertEqual([entry['page'] for entry in result.metadata['pages']],
+                         [f"page_{number}.png" for number in range(6)])
+        self.assertGreater(client.max_in_flight, 1)
+        self.assertLessEqual(client.max_in_flight, 3)
+
+    def test_pages_are_read_one_by_one_by_default(self):
+        client = FakeClient()
+        with patch.dict(os.environ, {'OLLAMA_CONCURRENCY': '1'}):
+            self.assertEqual(self.extract([page(1), page(2)], client).text, "1 2 ")
+        self.assertEqual(client.max_in_flight, 1)
+
+    def test_failing_page_fails_the_extraction(self):
+        # Page 1 fails once page 2 has been read, while the pages after it are in flight
+        client = FakeClient(failing_pages=(1,), after={1: 2})
+        pages = [page(number) for number in range(6)]
+        message = f"Failed to generate text with Ollama model {MODEL}"
+        with self.assertRaisesRegex(Exception, message):
+            self.extract(pages, client, concurrency=3)
+
+    def test_pages_are_capped_to_the_model_resolution(self):
+        client = FakeClient()
+        pages = [page(1, (4000, 1000)), page(2, (300, 600))]
+        self.extract(pages, client, concurrency=2,
+                     image={'max_side': 1120, 'format': 'jpeg'})
+        self.assertEqual(client.sizes[1], (1120, 280))
+        # Smaller pages are not upscaled
+        self.assertEqual(client.sizes[2], (300, 600))
+
+    def test_pages_are_capped_to_image_max_side_without_a_target(self):
+        client = FakeClient()
+        with patch.dict(os.environ, {'IMAGE_MAX_SIDE': '2000'}):
+            self.extract([page(1, (4000, 1000))], client)
+        self.assertEqual(client.sizes[1], (2000, 500))
+
+
+class TestOllamaClient(unittest.TestCase):
+
+    def setUp(self):
+        patcher = patch.object(ollama_client, '_client', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_client_is_shared_by_the_process(self):
+        self.assertIs(ollama_client.shared_client(), ollama_client.shared_client())
+
+    def test_timeouts_from_env(self):
+        timeouts = {'OLLAMA_TIMEOUT': '30', 'OLLAMA_CONNECT_TIMEOUT': '5'}
+        with patch.dict(os.environ, timeouts):
+            timeout = ollama_client.shared_client()._client.timeout
+        self.assertEqual((timeout.connect, timeout.read), (5, 30))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import importlib.util
+import unittest
+
+import numpy as np
+
+
+class FakeSession:
+    """ Stands in for an onnxruntime.InferenceSession - doubles its input, or fails """
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.runs = 0
+
+    def get_inputs(self):
+        return [type("Input", (), {"name": "input"})()]
+
+    def run(self, output_names, inputs):
+        self.runs += 1
+        if self.fail:
+            raise RuntimeError("Got invalid dimensions for input")
+        return [inputs["input"] * 2, inputs["input"] + 1]
+
+
+@unittest.skipUnless(importlib.util.find_spec("torch"), "needs torch")
+class TestOnnxModule(unittest.TestCase):
+
+    def setUp(self):
+        import torch
+
+        from text_extract_api.extract.onnx_backend import _OnnxModule
+
+        class TorchRecognizer(torch.nn.Module):
+            calls = 0
+
+            def forward(self, image, text):
+                TorchRecognizer.calls += 1
+                return image * 3
+
+        self.torch = torch
+        self.module_class = _OnnxModule
+        self.recognizer = TorchRecognizer()
+
+    def test_session_outputs_are_tensors(self):
+        module = self.module_class(FakeSession(), self.recognizer)
+        detection, feature = module(self.torch.ones(1, 3, 4, 4))
+        self.assertTrue(np.array_equal(detection.numpy(), np.full((1, 3, 4, 4), 2, np.float32)))
+        self.assertTrue(np.array_equal(feature.numpy(), np.full((1, 3, 4, 4), 2, np.float32)))
+        self.assertEqual(self.recognizer.calls, 0)
+
+    def test_failing_session_falls_back_to_torch(self):
+        session = FakeSession(fail=True)
+        module = self.module_class(session, self.recognizer)
+        for _ in range(2):
+            # The `text` argument of the recognizer reaches the torch module
+            self.assertEqual(module(self.torch.ones(1, 1, 2, 2), None).sum().item(), 12)
+        # Not retried once it failed
+        self.assertEqual(session.runs, 1)
+        self.assertEqual(self.recognizer.calls, 2)
+
+
+
+@unittest.skipUnless(all(importlib.util.find_spec(name) for name in ("torch", "easyocr", "onnx", "onnxruntime")),
+                     "needs torch, easyocr and the `onnx` extra")
+class TestOnnxReader(unittest.TestCase):
+
+    def test_reader_runs_on_onnx_runtime(self):
+        from text_extract_api.extract.onnx_backend import _OnnxModule
+        from text_extract_api.extract.reader_pool import ReaderPool
+
+        reader = ReaderPool(max_readers=1).warm_up("en", backend="onnx")
+        # Not the torch reader the pool falls back to when the export fails
+        self.assertIsInstance(reader.detector, _OnnxModule)
+        self.assertIsInstance(reader.recognizer, _OnnxModule)
+        self.assertIsNotNone(reader.detector.session)
+        self.assertIsNotNone(reader.recognizer.session)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import multiprocessing
+import os
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from text_extract_api.extract.inference import InferenceProfile
+from text_extract_api.extract.page_pool import PageOCRPool
+from text_extract_api.extract.reader_pool import ReaderPool
+from text_extract_api.files.shared_pages import PageBufferPool
+
+
+class FakeReader:
+    """ Reads the value of the top left pixel - earlier pages take longer, so they finish last """
+
+    def __init__(self, languages, gpu, backend):
+        pass
+
+    def readtext(self, image, detail=1):
+        time.sleep((10 - int(image[0, 0])) * 0.005)
+        return [str(image[0, 0])]
+
+
+def page(value: int) -> np.ndarray:
+    image = np.full((8, 8), 255, np.uint8)
+    image[0, 0] = value
+    return image
+
+
+def ocr_page_dying_on_page_two(image, language, backend='torch', tiling_config=None):
+    """ Kills the pool process reading page 2, like the OOM killer; reads it fine in the worker """
+    if int(image[0, 0]) == 2 and multiprocessing.parent_process() is not None:
+        os._exit(1)
+    return [str(image[0, 0])]
+
+
+class TestPageOCRPool(unittest.TestCase):
+
+    def setUp(self):
+        # Threads stand in for the processes, they share the fake readers of this process
+        executor = ThreadPoolExecutor(max_workers=3)
+        self.addCleanup(executor.shutdown)
+        patches = [
+            patch.object(ReaderPool, '_shared', ReaderPool(factory=FakeReader, sizer=lambda reader: 0)),
+            patch.object(PageOCRPool, '_get_executor', lambda pool: executor),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_from_config(self):
+        self.assertIsNone(PageOCRPool.from_config(None))
+        self.assertIsNone(PageOCRPool.from_config({'enabled': False, 'processes': 4}))
+        # A single process gains nothing over reading in the worker
+        self.assertIsNone(PageOCRPool.from_config({'processes': 1}))
+        self.assertEqual(PageOCRPool.from_config({'processes': 3}).processes, 3)
+        self.assertEqual(PageOCRPool.from_config({'processes': 'auto'}, InferenceProfile(threads=6)).processes, 6)
+
+    def test_results_keep_the_page_order(self):
+        results = list(PageOCRPool(processes=3).readtext((page(value) for value in range(10)), 'en'))
+        self.assertEqual(results, [[str(value)] for value in range(10)])
+
+    def test_shared_pages_are_released(self):
+        with PageBufferPool() as page_buffers:
+            results = list(PageOCRPool(processes=2).readtext([page(1), page(2), page(3)], 'en',
+                                                             page_buffers=page_buffers))
+            self.assertEqual(results, [["1"], ["2"], ["3"]])
+            self.assertEqual(len(page_buffers), 0)
+
+
+class TestPageOCRPoolRecovery(unittest.TestCase):
+
+    def tearDown(self):
+        if isinstance(PageOCRPool._executor, Mock):
+            PageOCRPool._executor = None
+        PageOCRPool._reset_executor(PageOCRPool._executor)
+
+    @patch('text_extract_api.extract.page_pool.ocr_page', ocr_page_dying_on_page_two)
+    def test_dead_process_is_replaced(self):
+        pool = PageOCRPool(processes=2, profile=InferenceProfile(threads=2))
+        images = [page(value) for value in range(8)]
+
+        # Pages in flight on the broken pool are read in the worker, the rest on a new pool
+        self.assertEqual(list(pool.readtext(iter(images), 'en')), [[str(value)] for value in range(8)])
+        self.assertEqual(list(pool.readtext([page(5)], 'en')), [["5"]])
+
+    @patch('text_extract_api.extract.page_pool.ocr_page', ocr_page_dying_on_page_two)
+    def test_stale_failure_keeps_the_new_pool(self):
+        broken, replacement = Mock(), Mock()
+        future = Mock()
+        future.result.side_effect = BrokenProcessPool("A child process terminated abruptly")
+        PageOCRPool._executor = replacement
+
+        # A page sent to the pool that broke earlier is read here, the pool replacing it keeps running
+        result = PageOCRPool(processes=2)._result((page(3), None, broken, future), ('en', 'torch', None), None)
+
+        self.assertEqual(result, ["3"])
+        self.assertIs(PageOCRPool._executor, replacement)
+        replacement.shutdown.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
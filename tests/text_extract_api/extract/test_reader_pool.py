@@ -0,0 +1,151 @@
+import io
+import sys
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import yaml
+
+from text_extract_api.extract.reader_pool import ReaderPool
+from text_extract_api.extract.strategies.easyocr import EasyOCRStrategy
+
+
+class FakeReader:
+    def __init__(self, languages, gpu, backend):
+        self.languages = languages
+        self.gpu = gpu
+        self.backend = backend
+        self.images = []
+
+    def readtext(self, image, detail=1):
+        self.images.append(image)
+        return []
+
+
+def easyocr_modules(reader_class, onnx_reader=None) -> dict:
+    """ Stand-ins for easyocr (and the ONNX backend) in sys.modules, for ReaderPool._create_reader """
+    modules = {'easyocr': SimpleNamespace(Reader=reader_class)}
+    if onnx_reader:
+        modules['text_extract_api.extract.onnx_backend'] = SimpleNamespace(onnx_reader=onnx_reader)
+    return modules
+
+
+def pool(**kwargs) -> ReaderPool:
+    return ReaderPool(factory=FakeReader, sizer=lambda reader: 100 * len(reader.languages), **kwargs)
+
+
+def strategy_with(config: dict) -> EasyOCRStrategy:
+    strategy = EasyOCRStrategy()
+    strategy.set_strategy_config(config)
+    return strategy
+
+
+class TestReaderPool(unittest.TestCase):
+
+    def test_language_sets_are_normalized(self):
+        readers = pool()
+        reader = readers.get("en, DE")
+        self.assertIs(readers.get(["de", "en", "en"]), reader)
+        self.assertEqual(reader.languages, ("de", "en"))
+        self.assertIsNot(readers.get("de,en", gpu=True), reader)
+        self.assertEqual(ReaderPool.normalize_languages(""), ("en",))
+
+    def test_backends(self):
+        readers = pool()
+        self.assertEqual(readers.get("en", backend="torch_int8").backend, "torch_int8")
+        self.assertIsNot(readers.get("en"), readers.get("en", backend="torch_int8"))
+        # Quantized and ONNX readers are CPU only
+        self.assertEqual(readers.get("en", gpu=True, backend="torch_int8").backend, "torch")
+        self.assertEqual(readers.get("en", gpu=True, backend="onnx").backend, "torch")
+        with self.assertRaises(ValueError):
+            readers.get("en", backend="tensorrt")
+
+    def test_least_recently_used_reader_is_evicted(self):
+        readers = pool(max_readers=2)
+        readers.get("en")
+        readers.get("de")
+        readers.get("en")
+        readers.get("fr")
+
+        self.assertEqual(len(readers), 2)
+        self.assertIn((("en",), False, "torch"), readers)
+        self.assertNotIn((("de",), False, "torch"), readers)
+
+    def test_memory_limit(self):
+        readers = pool(max_bytes=250)
+        readers.get("en,de")
+        readers.get("fr")
+        self.assertEqual(len(readers), 1)
+        # A reader over the limit on its own is still kept
+        readers.get("en,de,fr")
+        self.assertIn((("de", "en", "fr"), False, "torch"), readers)
+
+    def test_warm_up_runs_an_inference(self):
+        readers = pool()
+        reader = readers.warm_up("en", gpu=True)
+        self.assertIs(readers.get("en", gpu=True), reader)
+        # Some ink for the detector to find, so the recognizer runs too
+        self.assertLess(reader.images[0].min(), 128)
+
+    def test_only_int8_readers_are_quantized(self):
+        created = []
+
+        class Reader:
+            # EasyOCR quantizes CPU models unless told otherwise
+            def __init__(self, languages, gpu=True, quantize=True):
+                created.append((languages, gpu, quantize))
+
+        with patch.dict(sys.modules, easyocr_modules(Reader)):
+            ReaderPool._create_reader(("en",), False, "torch")
+            ReaderPool._create_reader(("en",), False, "torch_int8")
+        self.assertEqual(created, [(["en"], False, False), (["en"], False, True)])
+
+    def test_onnx_reader_is_exported_from_float_models(self):
+        created = []
+
+        class Reader:
+            def __init__(self, languages, gpu=True, quantize=True):
+                created.append(quantize)
+                self.detector = "torch"
+
+        def onnx_reader(reader, threads=None):
+            reader.detector = "onnx"
+            return reader
+
+        with patch.dict(sys.modules, easyocr_modules(Reader, onnx_reader)):
+            reader = ReaderPool._create_reader(("en",), False, "onnx")
+        self.assertEqual(created, [False])
+        self.assertEqual(reader.detector, "onnx")
+
+    def test_onnx_fallback_is_logged(self):
+        class Reader:
+            def __init__(self, languages, gpu=True, quantize=True):
+                self.detector = "torch"
+
+        def onnx_reader(reader, threads=None):
+            raise RuntimeError("Unsupported ONNX opset")
+
+        output = io.StringIO()
+        with patch.dict(sys.modules, easyocr_modules(Reader, onnx_reader)), redirect_stdout(output):
+            reader = ReaderPool._create_reader(("en",), False, "onnx")
+        self.assertEqual(reader.detector, "torch")
+        self.assertIn("running on torch: RuntimeError: Unsupported ONNX opset", output.getvalue())
+
+    def test_backend_of_the_shipped_config(self):
+        with open(Path(__file__).parents[3] / "config" / "strategies.yaml") as f:
+            config = yaml.safe_load(f)['strategies']['easyocr']
+        inference = config['inference']
+        self.assertNotIn('backend', config)
+        self.assertFalse(inference['quantize'])
+        self.assertEqual(ReaderPool.backend_for(strategy_with(config)), "torch")
+
+        # Turning on quantization is enough, no backend to change alongside it
+        quantized = dict(config, inference=dict(inference, quantize=True))
+        self.assertEqual(ReaderPool.backend_for(strategy_with(quantized)), "torch_int8")
+        self.assertEqual(ReaderPool.backend_for(strategy_with(dict(quantized, backend="onnx"))), "onnx")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import importlib.util
+import unittest
+
+from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.file_formats.pdf import PdfFileFormat
+
+
+@unittest.skipUnless(importlib.util.find_spec("requests"), "needs requests")
+class TestRemoteStrategy(unittest.TestCase):
+
+    def strategy(self, config: dict):
+        from text_extract_api.extract.strategies.remote import RemoteStrategy
+
+        strategy = RemoteStrategy()
+        strategy.set_strategy_config(config)
+        return strategy
+
+    def test_images_are_wrapped_into_pdf_by_default(self):
+        self.assertEqual(self.strategy({}).accepted_formats(), (PdfFileFormat,))
+        self.assertEqual(self.strategy({'accept_images': False}).accepted_formats(), (PdfFileFormat,))
+
+    def test_images_are_uploaded_when_the_backend_takes_them(self):
+        self.assertIn(ImageFileFormat, self.strategy({'accept_images': True}).accepted_formats())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from text_extract_api.extract.extract_result import ExtractResult
+from text_extract_api.extract.text_layer import TextLayerExtractor
+from text_extract_api.files.file_formats.pdf import PdfFileFormat
+
+DIGITAL_PAGE = "Invoice number 2024/11 issued for ACME Corporation, payment due within 14 days."
+
+
+class TestTextLayerExtractor(unittest.TestCase):
+
+    def test_from_config(self):
+        self.assertIsNone(TextLayerExtractor.from_config(None))
+        self.assertIsNone(TextLayerExtractor.from_config(False))
+        self.assertIsNone(TextLayerExtractor.from_config({"enabled": False}))
+        self.assertEqual(TextLayerExtractor.from_config({"min_score": 0.9}).min_score, 0.9)
+
+    def test_score(self):
+        extractor = TextLayerExtractor()
+        self.assertGreater(extractor.score(DIGITAL_PAGE), 0.9)
+        self.assertEqual(extractor.score("Page 1"), 0.0)
+        self.assertEqual(extractor.score("(cid:12)(cid:7)" * 10), 0.0)
+        self.assertLess(extractor.score("\ufffd" * 40), 0.1)
+
+    @patch.object(PdfFileFormat, "extract_pages")
+    @patch.object(TextLayerExtractor, "page_texts", return_value=[DIGITAL_PAGE, "", "", DIGITAL_PAGE, ""])
+    def test_only_pages_without_text_are_ocred(self, mock_page_texts, mock_extract_pages):
+        file_format = PdfFileFormat(b"%PDF-1.4", "document.pdf", "application/pdf")
+        strategy = MagicMock(PAGE_SEPARATOR="\n\n")
+        strategy.extract_text.side_effect = [ExtractResult.from_text("ocr 2-3"), ExtractResult.from_text("ocr 5")]
+
+        result = TextLayerExtractor().extract_text(strategy, file_format)
+
+        self.assertEqual([list(call.args[0]) for call in mock_extract_pages.call_args_list], [[1, 2], [4]])
+        self.assertEqual(strategy.extract_text.call_count, 2)
+        self.assertEqual(result.text, "\n\n".join([DIGITAL_PAGE, "ocr 2-3", DIGITAL_PAGE, "ocr 5"]))
+        self.assertEqual([(page['page_number'], page['source']) for page in result.metadata['pages']],
+                         [(1, "text_layer"), (2, "ocr"), (3, "ocr"), (4, "text_layer"), (5, "ocr")])
+
+    @patch.object(PdfFileFormat, "extract_pages")
+    @patch.object(TextLayerExtractor, "page_texts", return_value=[DIGITAL_PAGE, ""])
+    def test_pages_are_joined_like_the_strategy_joins_them(self, mock_page_texts, mock_extract_pages):
+        file_format = PdfFileFormat(b"%PDF-1.4", "document.pdf", "application/pdf")
+        strategy = MagicMock(PAGE_SEPARATOR="\n\n--- PAGE BREAK ---\n\n")
+        strategy.extract_text.return_value = ExtractResult.from_text(
+            "ocr 2", metadata={'pages': [{'page': "document_page_1.jpg", 'rotation': 90}]})
+
+        result = TextLayerExtractor().extract_text(strategy, file_format)
+
+        self.assertEqual(result.text, f"{DIGITAL_PAGE}\n\n--- PAGE BREAK ---\n\nocr 2")
+        # What the strategy recorded about the OCR'd page is kept
+        self.assertEqual(result.metadata['pages'][1],
+                         {'page': "document_page_1.jpg", 'rotation': 90, 'page_number': 2, 'source': "ocr"})
+
+    @patch.object(TextLayerExtractor, "page_texts", return_value=["", ""])
+    def test_scanned_document_goes_to_strategy_whole(self, mock_page_texts):
+        file_format = PdfFileFormat(b"%PDF-1.4", "document.pdf", "application/pdf")
+        strategy = MagicMock()
+        strategy.extract_text.return_value = ExtractResult.from_text("ocr 1-2")
+
+        result = TextLayerExtractor().extract_text(strategy, file_format, "pl")
+
+        strategy.extract_text.assert_called_once_with(file_format, "pl")
+        self.assertEqual([(page['page_number'], page['source']) for page in result.metadata['pages']],
+                         [(1, "ocr"), (2, "ocr")])
+
+
+if __name__ == "__main__":
+    unittest.main()
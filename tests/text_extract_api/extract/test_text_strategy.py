@@ -0,0 +1,44 @@
+import unittest
+
+from text_extract_api.extract.strategies.text import TextStrategy
+from text_extract_api.files.file_formats.file_format import FileFormat
+from text_extract_api.files.file_formats.text import TextFileFormat
+
+
+def extract(binary: bytes, mime_type: str, filename: str = None) -> str:
+    file_format = FileFormat.from_binary(binary, filename=filename, mime_type=mime_type)
+    return TextStrategy().extract_text(file_format).text
+
+
+class TestTextStrategy(unittest.TestCase):
+
+    def test_textual_mime_types_are_text_files(self):
+        for mime_type in ["text/plain", "text/markdown", "text/csv", "application/json", "text/html"]:
+            self.assertIsInstance(FileFormat.from_binary(b"x", mime_type=mime_type), TextFileFormat)
+
+    def test_plain_text_is_decoded_and_normalized(self):
+        binary = "\ufeffz\u0307o\u0301\u0142w\r\nge\u0328\x0cla  \r\n".encode("utf-8")
+        self.assertEqual(extract(binary, "text/plain"), "\u017c\u00f3\u0142w\ng\u0119la")
+
+    def test_legacy_encoding(self):
+        self.assertEqual(extract("Café – crème".encode("cp1252"), "text/plain"), "Café – crème")
+
+    def test_csv_becomes_markdown_table(self):
+        binary = b'name;note\r\nAnna;"a | b"\r\nJan\r\n'
+        self.assertEqual(extract(binary, "text/plain", filename="people.csv"),
+                         "| name | note |\n|---|---|\n| Anna | a \\| b |\n| Jan |  |")
+
+    def test_json_is_pretty_printed(self):
+        self.assertEqual(extract(b'{"a": [1, "\\u017c"]}', "application/json"),
+                         '```json\n{\n  "a": [\n    1,\n    "ż"\n  ]\n}\n```')
+
+    def test_html_visible_text(self):
+        binary = (b"<html><head><title>T</title><style>p {}</style></head><body>"
+                  b"<h1>Title</h1><p>Some <b>bold</b> text&amp;more</p>"
+                  b"<ul><li>one</li><li>two</li></ul><script>var x;</script></body></html>")
+        self.assertEqual(extract(binary, "text/html"),
+                         "# Title\n\nSome bold text&more\n\n- one\n- two")
+
+
+if __name__ == "__main__":
+    unittest.main()
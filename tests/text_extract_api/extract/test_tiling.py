@@ -0,0 +1,91 @@
+import threading
+import unittest
+
+import numpy as np
+
+from text_extract_api.extract.tiling import TiledOCR
+
+
+class FakeReader:
+    """
+    Reads words placed at known page coordinates. Tiles are views of `page`, so the
+    offset of a tile is recovered from its data pointer. Words cut by a tile edge come
+    back truncated (marked with `~`), like a real reader would see them.
+    """
+
+    def __init__(self, page: np.ndarray, words):
+        self.page = page
+        self.words = words
+        self.calls = 0
+        self.threads = set()
+
+    def readtext(self, image, detail=1, width_ths=0.5):
+        self.calls += 1
+        self.threads.add(threading.get_ident())
+        if image is self.page:
+            return [text for _, text in self.words]
+
+        offset = image.__array_interface__['data'][0] - self.page.__array_interface__['data'][0]
+        y0, x0 = divmod(offset, self.page.shape[1])
+        height, width = image.shape
+        detections = []
+        for (left, top, right, bottom), text in self.words:
+            a, b = max(left, x0), max(top, y0)
+            c, d = min(right, x0 + width), min(bottom, y0 + height)
+            if a < c and b < d:
+                box = [[a - x0, b - y0], [c - x0, b - y0], [c - x0, d - y0], [a - x0, d - y0]]
+                detections.append((box, text if (a, c) == (left, right) else text + "~", 0.9))
+        return detections
+
+
+def _words(width, height):
+    rng = np.random.default_rng(0)
+    words = []
+    for line, y in enumerate(range(100, height - 100, 90)):
+        x, index = 50, 0
+        while x < width - 400:
+            word_width = int(rng.integers(60, 300))
+            words.append(((x, y, x + word_width, y + 40), f"w{line}_{index}"))
+            x += word_width + 30
+            index += 1
+    return words
+
+
+class TestTiledOCR(unittest.TestCase):
+
+    def test_tiles_cover_the_image_once(self):
+        tiling = TiledOCR()
+        coverage = np.zeros((6000, 9000), np.uint8)
+        for (x0, y0, x1, y1), (cx0, cy0, cx1, cy1) in tiling.tiles(9000, 6000):
+            self.assertLessEqual(x1 - x0, tiling.tile_size)
+            self.assertTrue(x0 <= cx0 < cx1 <= x1 and y0 <= cy0 < cy1 <= y1)
+            coverage[cy0:cy1, cx0:cx1] += 1
+        self.assertTrue((coverage == 1).all())
+
+    def test_words_are_merged_without_duplicates(self):
+        page = np.zeros((6000, 9000), np.uint8)
+        words = _words(9000, 6000)
+        reader = FakeReader(page, words)
+
+        lines = TiledOCR().readtext(reader, page)
+
+        self.assertGreater(reader.calls, 1)
+        # Tiles are read one after another, on the calling thread
+        self.assertEqual(reader.threads, {threading.get_ident()})
+        self.assertEqual(" ".join(lines).split(), [text for _, text in words])
+        self.assertEqual(len(lines), len({box[1] for box, _ in words}))
+
+    def test_small_image_is_read_whole(self):
+        page = np.zeros((3300, 2550), np.uint8)
+        reader = FakeReader(page, [((10, 10, 50, 30), "whole")])
+        self.assertEqual(TiledOCR().readtext(reader, page), ["whole"])
+        self.assertEqual(reader.calls, 1)
+
+    def test_from_config(self):
+        self.assertIsNone(TiledOCR.from_config(None))
+        self.assertIsNone(TiledOCR.from_config({"enabled": False}))
+        self.assertEqual(TiledOCR.from_config({"tile_size": 2000, "overlap": 200}).tile_size, 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
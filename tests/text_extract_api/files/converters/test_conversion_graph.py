@@ -0,0 +1,101 @@
+import unittest
+
+from text_extract_api.files.converters.conversion_graph import ConversionGraph
+from text_extract_api.files.converters.converter import Converter
+from text_extract_api.files.converters.image_to_pdf import ImageToPdfConverter
+from text_extract_api.files.converters.pdf_to_jpeg import PdfToJpegConverter
+from text_extract_api.files.file_formats.docling import DoclingFileFormat
+from text_extract_api.files.file_formats.file_format import FileFormat
+from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.file_formats.multi_frame_image import MultiFrameImageFileFormat
+from text_extract_api.files.file_formats.pdf import PdfFileFormat
+
+
+class FakeFormat(FileFormat):
+    PAGEABLE = False
+
+    @staticmethod
+    def accepted_mime_types() -> list[str]:
+        return []
+
+    @classmethod
+    def is_pageable(cls) -> bool:
+        return cls.PAGEABLE
+
+
+class FakeConverter(Converter):
+    TARGET = None
+
+    @classmethod
+    def convert(cls, file_format, **options):
+        for page in range(2):
+            yield cls.TARGET(file_format.binary + f">{cls.TARGET.__name__}{page}".encode(), mime_type="fake/x")
+
+
+class Document(FakeFormat):
+    PAGEABLE = True
+
+    @staticmethod
+    def convertible_to():
+        return {Page: DocumentToPage, Bundle: DocumentToBundle}
+
+
+class Page(FakeFormat):
+    @staticmethod
+    def convertible_to():
+        return {Bundle: PageToBundle}
+
+
+class Bundle(FakeFormat):
+    PAGEABLE = True
+
+
+class DocumentToPage(FakeConverter):
+    COST = 1.0
+    TARGET = Page
+
+
+class PageToBundle(FakeConverter):
+    COST = 1.0
+    TARGET = Bundle
+
+
+class DocumentToBundle(FakeConverter):
+    COST = 5.0
+    TARGET = Bundle
+
+
+class TestConversionGraph(unittest.TestCase):
+
+    def test_accepted_format_is_not_converted(self):
+        self.assertEqual(ConversionGraph.cheapest_path(ImageFileFormat, [PdfFileFormat, ImageFileFormat]), [])
+        self.assertEqual(ConversionGraph.cheapest_path(DoclingFileFormat, [FileFormat]), [])
+
+    def test_direct_conversion(self):
+        self.assertEqual(ConversionGraph.cheapest_path(PdfFileFormat, [ImageFileFormat]),
+                         [(ImageFileFormat, PdfToJpegConverter)])
+        self.assertIsNone(ConversionGraph.cheapest_path(DoclingFileFormat, [ImageFileFormat]))
+
+    def test_cheapest_multi_hop_path(self):
+        self.assertEqual(ConversionGraph.cheapest_path(Document, [Bundle]),
+                         [(Page, DocumentToPage), (Bundle, PageToBundle)])
+
+    def test_pages_are_not_split_on_request(self):
+        self.assertEqual(ConversionGraph.cheapest_path(Document, [Bundle], split_pages=False),
+                         [(Bundle, DocumentToBundle)])
+        self.assertEqual(ConversionGraph.cheapest_path(MultiFrameImageFileFormat, [PdfFileFormat, ImageFileFormat],
+                                                       split_pages=False),
+                         [(PdfFileFormat, ImageToPdfConverter)])
+
+    def test_every_produced_file_goes_through_the_next_step(self):
+        document = Document(b"doc", mime_type="fake/x")
+        path = ConversionGraph.cheapest_path(Document, [Bundle])
+
+        results = [result.binary for result in ConversionGraph.convert(document, path)]
+
+        self.assertEqual(results, [b"doc>Page0>Bundle0", b"doc>Page0>Bundle1",
+                                   b"doc>Page1>Bundle0", b"doc>Page1>Bundle1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,185 @@
+import os
+import tempfile
+import unittest
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+import numpy as np
+from PIL import Image
+
+from text_extract_api.files.converters.pdf_to_jpeg import PdfToJpegConverter
+from text_extract_api.files.converters.render_cache import RenderCache
+from text_extract_api.files.converters.render_profile import RenderFormat, RenderProfile
+from text_extract_api.files.file_formats.pdf import PdfFileFormat
+from text_extract_api.files.shared_pages import PageBufferPool
+
+PAGE_COUNT = 5
+RAW = RenderProfile(format=RenderFormat.RAW, grayscale=True)
+
+
+def fake_convert_from_path(pdf_path, dpi, grayscale, first_page, last_page, output_folder, paths_only,
+                           thread_count):
+    """ Stands in for poppler - page N is a small gray image of value N """
+    paths = []
+    for number in range(first_page, last_page + 1):
+        path = os.path.join(output_folder, f"page-{number}.png")
+        Image.fromarray(np.full((40, 30), number, np.uint8)).save(path)
+        paths.append(path)
+    return paths
+
+
+def pdf(content: bytes = b"test") -> PdfFileFormat:
+    return PdfFileFormat(binary_file_content=b"%PDF-1.4 " + content, filename="test.pdf",
+                         mime_type="application/pdf")
+
+
+class BrokenExecutor:
+    """ A process pool whose render process was killed """
+
+    def __init__(self):
+        self.shut_down = False
+
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool("A process in the process pool was terminated abruptly"))
+        return future
+
+    def shutdown(self, wait=True):
+        self.shut_down = True
+
+
+def page_values(pages) -> list:
+    return [int(page.to_numpy()[0, 0]) for page in pages]
+
+
+class FakeRenderingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            patch('text_extract_api.files.converters.pdf_to_jpeg.convert_from_path', fake_convert_from_path),
+            patch('text_extract_api.files.converters.pdf_to_jpeg.pdfinfo_from_path',
+                  lambda path: {"Pages": PAGE_COUNT}),
+            patch.dict(os.environ, {'RENDER_CACHE_PATH': '', 'PDF_RENDER_WINDOW_SIZE': '2'}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def render_pool(self):
+        # Threads stand in for the render processes, they see the fake renderer
+        executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(executor.shutdown)
+        patcher = patch.object(PdfToJpegConverter, '_get_executor', lambda: executor)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        os.environ['PDF_RENDER_PROCESSES'] = '2'
+        self.addCleanup(os.environ.pop, 'PDF_RENDER_PROCESSES')
+        return executor
+
+
+class TestPdfToJpegConverter(FakeRenderingTestCase):
+
+    def test_windows_are_yielded_in_page_order(self):
+        self.render_pool()
+        for profile in (RenderProfile(), RAW):
+            pages = list(PdfToJpegConverter.convert(pdf(), render_profile=profile))
+            self.assertEqual(page_values(pages), [1, 2, 3, 4, 5])
+            self.assertEqual(pages[0].filename, "test.pdf_page_1." + profile.extension)
+
+    def test_rendered_in_process(self):
+        with patch.dict(os.environ, {'PDF_RENDER_PROCESSES': '1'}), \
+                patch.object(PdfToJpegConverter, '_get_executor', side_effect=AssertionError("no pool")):
+            self.assertEqual(page_values(PdfToJpegConverter.convert(pdf(), render_profile=RAW)), [1, 2, 3, 4, 5])
+
+    def test_broken_pool_is_replaced(self):
+        broken = BrokenExecutor()
+        with patch.dict(os.environ, {'PDF_RENDER_PROCESSES': '2'}), \
+                patch.object(PdfToJpegConverter, '_executor', broken):
+            # The windows sent to the dead pool are rendered here
+            self.assertEqual(page_values(PdfToJpegConverter.convert(pdf(), render_profile=RAW)), [1, 2, 3, 4, 5])
+            # Dropped, the next document starts a new pool
+            self.assertIsNone(PdfToJpegConverter._executor)
+        self.assertTrue(broken.shut_down)
+
+    def test_pages_in_flight_stay_within_the_window(self):
+        executor = self.render_pool()
+        submitted = []
+        submit = executor.submit
+
+        def counting_submit(fn, pdf_path, first_page, last_page, *args):
+            submitted.extend(range(first_page, last_page + 1))
+            return submit(fn, pdf_path, first_page, last_page, *args)
+
+        # More render processes than pages in the window
+        with patch.dict(os.environ, {'PDF_RENDER_PROCESSES': '8', 'PDF_RENDER_WINDOW_SIZE': '3'}), \
+                patch.object(executor, 'submit', counting_submit):
+            consumed = 0
+            for _ in PdfToJpegConverter.convert(pdf(), render_profile=RAW):
+                consumed += 1
+                # The page consumed and the ones rendered ahead
+                self.assertLessEqual(len(submitted) - consumed, 3 - 1)
+            self.assertEqual(submitted, [1, 2, 3, 4, 5])
+
+    def test_shared_pages_are_released_once_consumed(self):
+        self.render_pool()
+        with PageBufferPool() as page_buffers:
+            pages = PdfToJpegConverter.convert(pdf(), render_profile=RAW, page_buffers=page_buffers)
+            values = []
+            for page in pages:
+                values.append(int(page.to_numpy()[0, 0]))
+                # Only the page consumed and those rendered ahead - at most a window (of 2) - are held
+                self.assertLessEqual(len(page_buffers), 2)
+            self.assertEqual(values, [1, 2, 3, 4, 5])
+            self.assertEqual(len(page_buffers), 0)
+
+    def test_pages_are_pickled_when_shared_memory_is_full(self):
+        self.render_pool()
+        with patch('text_extract_api.files.shared_pages.shared_memory_available', lambda: 1024), \
+                PageBufferPool() as page_buffers:
+            pages = PdfToJpegConverter.convert(pdf(), render_profile=RAW, page_buffers=page_buffers)
+            self.assertEqual(page_values(pages), [1, 2, 3, 4, 5])
+            self.assertEqual(len(page_buffers), 0)
+
+
+class TestRenderCacheInConversions(FakeRenderingTestCase):
+
+    def setUp(self):
+        super().setUp()
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.cache_path = temp_dir.name
+        environ = patch.dict(os.environ, {'RENDER_CACHE_PATH': self.cache_path})
+        environ.start()
+        self.addCleanup(environ.stop)
+        self.addCleanup(RenderCache._shared.clear)
+
+    def cache_size(self) -> int:
+        return sum(entry.stat().st_size for entry in os.scandir(self.cache_path) if entry.name.endswith('.page'))
+
+    def test_size_limit_holds_across_conversions(self):
+        page_size = len(PdfToJpegConverter._image_to_bytes(Image.fromarray(np.full((40, 30), 1, np.uint8))))
+        with patch.dict(os.environ, {'RENDER_CACHE_MAX_MB': str(4 * page_size / (1024 * 1024))}):
+            for document in (b"first", b"second"):
+                self.assertEqual(len(list(PdfToJpegConverter.convert(pdf(document)))), PAGE_COUNT)
+                self.assertLessEqual(self.cache_size(), RenderCache.shared().max_bytes)
+            self.assertIs(RenderCache.shared(), RenderCache.shared())
+
+        # Recent pages of the second document come from the cache
+        rendered = []
+
+        def counting_convert_from_path(pdf_path, **options):
+            rendered.extend(range(options['first_page'], options['last_page'] + 1))
+            return fake_convert_from_path(pdf_path, **options)
+
+        with patch('text_extract_api.files.converters.pdf_to_jpeg.convert_from_path', counting_convert_from_path):
+            self.assertEqual(page_values(PdfToJpegConverter.convert(pdf(b"second"))), [1, 2, 3, 4, 5])
+        self.assertLess(len(rendered), PAGE_COUNT)
+
+    def test_raw_renders_are_not_cached_by_default(self):
+        self.assertEqual(page_values(PdfToJpegConverter.convert(pdf(), render_profile=RAW)), [1, 2, 3, 4, 5])
+        self.assertEqual(self.cache_size(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
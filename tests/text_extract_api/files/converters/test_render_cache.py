@@ -0,0 +1,91 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from text_extract_api.files.converters.render_cache import RenderCache
+from text_extract_api.files.converters.render_profile import RenderProfile
+
+
+class TestRenderCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.profile = RenderProfile()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_returns_stored_page(self):
+        cache = RenderCache(self.temp_dir.name, 1024)
+        self.assertIsNone(cache.get("hash", 1, self.profile))
+        cache.put("hash", 1, self.profile, b"page-1")
+        self.assertEqual(cache.get("hash", 1, self.profile), b"page-1")
+
+    def test_key_includes_page_and_profile(self):
+        cache = RenderCache(self.temp_dir.name, 1024)
+        cache.put("hash", 1, self.profile, b"page-1")
+        self.assertIsNone(cache.get("hash", 2, self.profile))
+        self.assertIsNone(cache.get("hash", 1, RenderProfile(dpi=300)))
+        self.assertIsNone(cache.get("other", 1, self.profile))
+
+    def test_evicts_least_recently_used(self):
+        cache = RenderCache(self.temp_dir.name, 250)
+        cache.put("hash", 1, self.profile, b"1" * 100)
+        cache.put("hash", 2, self.profile, b"2" * 100)
+
+        # Make page 1 the most recently used one
+        old = time.time() - 60
+        os.utime(cache._entry_path("hash", 2, self.profile), (old, old))
+        self.assertIsNotNone(cache.get("hash", 1, self.profile))
+
+        cache.put("hash", 3, self.profile, b"3" * 100)
+
+        self.assertIsNone(cache.get("hash", 2, self.profile))
+        self.assertIsNotNone(cache.get("hash", 1, self.profile))
+        self.assertIsNotNone(cache.get("hash", 3, self.profile))
+
+    def test_expired_pages_are_not_served(self):
+        cache = RenderCache(self.temp_dir.name, 1024, ttl=3600)
+        cache.put("hash", 1, self.profile, b"page-1")
+        entry_path = cache._entry_path("hash", 1, self.profile)
+
+        # Hits don't extend the retention
+        written = os.stat(entry_path).st_mtime
+        self.assertIsNotNone(cache.get("hash", 1, self.profile))
+        self.assertEqual(os.stat(entry_path).st_mtime, written)
+
+        old = time.time() - 7200
+        os.utime(entry_path, (time.time(), old))
+        self.assertIsNone(cache.get("hash", 1, self.profile))
+        self.assertFalse(os.path.exists(entry_path))
+
+    def test_expired_pages_are_removed_on_write(self):
+        cache = RenderCache(self.temp_dir.name, 1024, ttl=3600)
+        cache.put("hash", 1, self.profile, b"page-1")
+        old = time.time() - 7200
+        os.utime(cache._entry_path("hash", 1, self.profile), (old, old))
+
+        cache._next_purge = 0
+        cache.put("hash", 2, self.profile, b"page-2")
+
+        self.assertFalse(os.path.exists(cache._entry_path("hash", 1, self.profile)))
+        self.assertEqual(cache.get("hash", 2, self.profile), b"page-2")
+
+    def test_from_env_is_opt_in(self):
+        with patch.dict(os.environ, clear=False):
+            os.environ.pop("RENDER_CACHE_PATH", None)
+            self.assertIsNone(RenderCache.from_env())
+
+            os.environ["RENDER_CACHE_PATH"] = ""
+            self.assertIsNone(RenderCache.from_env())
+
+            os.environ["RENDER_CACHE_PATH"] = self.temp_dir.name
+            cache = RenderCache.from_env()
+            self.assertEqual(cache.path, self.temp_dir.name)
+            self.assertEqual(cache.ttl, 24 * 3600)
+
+
+if __name__ == "__main__":
+    unittest.main()
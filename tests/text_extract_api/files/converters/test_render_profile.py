@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch
+
+from text_extract_api.extract.strategies.strategy import Strategy
+from text_extract_api.files.converters.render_profile import RenderFormat, RenderProfile
+
+CONFIG = {'render_profiles': {'default': {'dpi': 300, 'grayscale': True},
+                              'vision': {'dpi': 150, 'format': 'png'}}}
+
+
+class ProfileStrategy(Strategy):
+
+    @classmethod
+    def name(cls) -> str:
+        return "profile_test"
+
+
+def strategy(config=None) -> ProfileStrategy:
+    instance = ProfileStrategy()
+    instance.set_strategy_config(config or {})
+    return instance
+
+
+class TestRenderProfile(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            patch.dict(Strategy._render_profiles, clear=True),
+            patch.object(Strategy, '_read_config', return_value=("strategies.yaml", CONFIG)),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_from_dict(self):
+        profile = RenderProfile.from_dict({'dpi': 150, 'format': 'png'})
+        self.assertEqual((profile.dpi, profile.format), (150, RenderFormat.PNG))
+        with self.assertRaises(ValueError):
+            RenderProfile.from_dict({'resolution': 150})
+
+    def test_default_profile_is_loaded_from_config(self):
+        # No named profile was asked for yet - the default still comes from the config, not the built-in one
+        profile = strategy().render_profile()
+        self.assertEqual((profile.dpi, profile.grayscale), (300, True))
+
+    def test_strategy_and_request_profiles(self):
+        self.assertEqual(strategy({'render_profile': 'vision'}).render_profile().dpi, 150)
+        self.assertEqual(strategy({'render_profile': {'dpi': 100}}).render_profile().dpi, 100)
+
+        overridden = strategy({'render_profile': 'vision'})
+        overridden.set_render_profile('default')
+        self.assertEqual(overridden.render_profile().dpi, 300)
+        overridden.set_render_profile('unknown')
+        with self.assertRaises(ValueError):
+            overridden.render_profile()
+
+
+if __name__ == "__main__":
+    unittest.main()
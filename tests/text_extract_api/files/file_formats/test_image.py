@@ -0,0 +1,134 @@
+import os
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+import numpy as np
+
+from PIL import Image, JpegImagePlugin
+
+from text_extract_api.files.file_formats.image import (ImageFileFormat, ImageProcessor, ImageSupportedExportFormats,
+                                                       ImageTarget)
+
+
+def _image_bytes(mode: str, size: tuple, image_format: str, exif=None) -> bytes:
+    buffer = BytesIO()
+    image = Image.new(mode, size, "white")
+    if exif is not None:
+        image.save(buffer, format=image_format, exif=exif)
+    else:
+        image.save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+class TestImageProcessor(unittest.TestCase):
+
+    def test_unified_image_is_returned_untouched(self):
+        image_bytes = _image_bytes("RGB", (100, 50), "JPEG")
+        result = ImageProcessor.unify_image(image_bytes, ImageSupportedExportFormats.JPEG, max_side=1000)
+        self.assertIs(result, image_bytes)
+
+    def test_png_is_converted_to_rgb_jpeg(self):
+        image_bytes = _image_bytes("P", (100, 50), "PNG")
+        result = ImageProcessor.unify_image(image_bytes, ImageSupportedExportFormats.JPEG, max_side=1000)
+        with Image.open(BytesIO(result)) as image:
+            self.assertEqual(image.format, "JPEG")
+            self.assertEqual(image.mode, "RGB")
+            self.assertEqual(image.size, (100, 50))
+
+    def test_large_image_is_downscaled(self):
+        image_bytes = _image_bytes("RGB", (4000, 3000), "JPEG")
+        result = ImageProcessor.unify_image(image_bytes, ImageSupportedExportFormats.JPEG, max_side=1000)
+        with Image.open(BytesIO(result)) as image:
+            self.assertEqual(image.size, (1000, 750))
+
+    def test_exif_orientation_is_applied(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # rotated 90 degrees
+        image_bytes = _image_bytes("RGB", (100, 50), "JPEG", exif=exif)
+        result = ImageProcessor.unify_image(image_bytes, ImageSupportedExportFormats.JPEG, max_side=1000)
+        with Image.open(BytesIO(result)) as image:
+            self.assertEqual(image.size, (50, 100))
+
+
+class TestImageFileFormat(unittest.TestCase):
+
+    def test_pixels_keep_the_full_resolution(self):
+        page = ImageFileFormat.from_binary(_image_bytes("L", (5000, 400), "PNG"), "drawing.png", "image/png")
+        pixels = page.to_numpy(max_side=0)
+        self.assertEqual(pixels.shape, (400, 5000))
+        self.assertEqual(pixels.dtype, np.uint8)
+
+    def test_large_photo_is_decoded_at_reduced_scale(self):
+        page = ImageFileFormat.from_binary(_image_bytes("RGB", (8064, 6048), "JPEG"), "photo.jpg", "image/jpeg")
+        decoded = []
+        draft = JpegImagePlugin.JpegImageFile.draft
+
+        def spy(image, mode, size):
+            result = draft(image, mode, size)
+            decoded.append(image.size)
+            return result
+
+        with patch.object(JpegImagePlugin.JpegImageFile, "draft", spy):
+            pixels = page.to_numpy(max_side=4000)
+
+        self.assertEqual(pixels.shape, (3000, 4000, 3))
+        # Decoded by the JPEG decoder at half scale, not at 48 MP
+        self.assertEqual(decoded[0], (4032, 3024))
+
+    def test_max_side_defaults_to_the_environment(self):
+        page = ImageFileFormat.from_binary(_image_bytes("L", (5000, 400), "PNG"), "drawing.png", "image/png")
+        with patch.dict(os.environ, {"OCR_IMAGE_MAX_SIDE": "1000"}):
+            self.assertEqual(page.to_numpy().shape, (80, 1000))
+        with patch.dict(os.environ, {"OCR_IMAGE_MAX_SIDE": "0"}):
+            self.assertEqual(page.to_numpy().shape, (400, 5000))
+
+    def test_pixels_are_upright_8_bit(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # rotated 90 degrees
+        page = ImageFileFormat.from_binary(_image_bytes("P", (100, 50), "PNG", exif=exif), "scan.png", "image/png")
+        self.assertEqual(page.to_numpy().shape, (100, 50, 3))
+
+        buffer = BytesIO()
+        Image.fromarray(np.full((10, 10), 40000, np.uint16)).save(buffer, format="PNG")
+        scan = ImageFileFormat.from_binary(buffer.getvalue(), "16bit.png", "image/png")
+        # Scaled, not clipped to white
+        self.assertEqual(int(scan.to_numpy()[0, 0]), 40000 >> 8)
+
+    def test_12_bit_pixels_use_the_full_8_bit_range(self):
+        pixels = np.zeros((10, 10), np.uint16)
+        pixels[:, 5:] = 4095
+        pixels[0, 0] = 2048
+        buffer = BytesIO()
+        Image.fromarray(pixels).save(buffer, format="PNG")
+        scan = ImageFileFormat.from_binary(buffer.getvalue(), "12bit.png", "image/png").to_numpy()
+        self.assertEqual(int(scan[0, 9]), 255)
+        self.assertEqual(int(scan[0, 0]), 128)
+        self.assertEqual(int(scan[1, 0]), 0)
+
+
+class TestImageTarget(unittest.TestCase):
+
+    def test_page_is_fitted_to_the_target(self):
+        target = ImageTarget.from_dict({'max_side': 1120, 'format': 'jpeg', 'quality': 80})
+        page = ImageFileFormat.from_binary(_image_bytes("RGB", (2480, 3508), "PNG"), "page.png", "image/png")
+
+        fitted = target.apply(page)
+
+        self.assertEqual(fitted.mime_type, "image/jpeg")
+        with Image.open(BytesIO(fitted.binary)) as image:
+            self.assertEqual(image.format, "JPEG")
+            # Rounded by the aspect ratio kept
+            self.assertIn(max(image.size), (1119, 1120))
+
+    def test_fitting_page_is_sent_as_it_is(self):
+        page = ImageFileFormat.from_binary(_image_bytes("RGB", (800, 600), "JPEG"), "page.jpg", "image/jpeg")
+        self.assertIs(ImageTarget(max_side=1120).apply(page), page)
+
+    def test_unknown_options(self):
+        with self.assertRaises(ValueError):
+            ImageTarget.from_dict({'max_width': 1120})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from io import BytesIO
+
+import numpy as np
+from PIL import Image
+
+from text_extract_api.files.file_formats.file_format import FileFormat
+from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.file_formats.multi_frame_image import MultiFrameImageFileFormat
+from text_extract_api.files.file_formats.raster_image import RasterImageFileFormat
+
+
+def _fax_tiff(pages: int = 3) -> bytes:
+    frames = [Image.new("1", (1728, 1100), 1) for _ in range(pages)]
+    buffer = BytesIO()
+    frames[0].save(buffer, format="TIFF", save_all=True, append_images=frames[1:], compression="group4",
+                   dpi=(204, 98))
+    return buffer.getvalue()
+
+
+def _scan_tiff() -> bytes:
+    """ A bilevel cover page followed by a 16 bit grayscale scan - light gray with a dark band """
+    pixels = np.full((100, 80), 0xC000, np.uint16)
+    pixels[40:60] = 0x4000
+    buffer = BytesIO()
+    Image.new("1", (80, 100), 1).save(buffer, format="TIFF", save_all=True, append_images=[Image.fromarray(pixels)])
+    return buffer.getvalue()
+
+
+class TestMultiFrameImageFileFormat(unittest.TestCase):
+
+    def test_tiff_is_pageable(self):
+        file_format = FileFormat.from_binary(_fax_tiff(), "fax.tiff")
+        self.assertIsInstance(file_format, MultiFrameImageFileFormat)
+        self.assertTrue(file_format.is_pageable())
+        self.assertEqual(file_format.frame_count, 3)
+
+    def test_every_frame_becomes_a_page(self):
+        file_format = MultiFrameImageFileFormat(_fax_tiff(), "fax.tiff", "image/tiff")
+
+        pages = list(file_format.convert_iter(ImageFileFormat))
+
+        self.assertEqual([page.filename for page in pages],
+                         ["fax.tiff_page_1.png", "fax.tiff_page_2.png", "fax.tiff_page_3.png"])
+        for page in pages:
+            self.assertIsInstance(page, RasterImageFileFormat)
+            # Bilevel frame as 8 bit grayscale, stretched from 204x98 dpi to square pixels
+            self.assertEqual(page.to_numpy().dtype.name, "uint8")
+            self.assertEqual(page.to_numpy().shape, (2290, 1728))
+
+    def test_16_bit_frame_is_scaled_to_8_bit(self):
+        file_format = MultiFrameImageFileFormat(_scan_tiff(), "scan.tiff", "image/tiff")
+
+        cover, scan = (page.to_numpy() for page in file_format.convert_iter(ImageFileFormat))
+
+        self.assertEqual(cover.min(), 255)
+        # Not clipped to white - the band stays readable
+        self.assertEqual(scan.dtype.name, "uint8")
+        self.assertEqual((scan[0, 0], scan[50, 0]), (192, 64))
+
+    def test_frames_are_decoded_lazily(self):
+        file_format = MultiFrameImageFileFormat(_fax_tiff(), "fax.tiff", "image/tiff")
+        pages = file_format.convert_iter(ImageFileFormat)
+        self.assertEqual(next(pages).filename, "fax.tiff_page_1.png")
+
+
+if __name__ == "__main__":
+    unittest.main()
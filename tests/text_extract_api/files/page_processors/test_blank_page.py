@@ -0,0 +1,62 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from text_extract_api.files.file_formats.raster_image import RasterImageFileFormat
+from text_extract_api.files.page_processors.blank_page import BlankPageDetector
+from text_extract_api.files.page_processors.pipeline import PagePipeline
+
+
+def _blank_page() -> np.ndarray:
+    return np.full((1650, 1275), 250, np.uint8)
+
+
+def _text_page() -> np.ndarray:
+    page = _blank_page()
+    for y in range(200, 1400, 60):
+        cv2.putText(page, "Lorem ipsum dolor sit amet", (100, y), cv2.FONT_HERSHEY_SIMPLEX, 1.2, 0, 2)
+    return page
+
+
+class TestBlankPageDetector(unittest.TestCase):
+
+    def test_blank_page(self):
+        self.assertTrue(BlankPageDetector().is_blank(_blank_page()))
+
+    def test_scanner_noise_and_borders_are_ignored(self):
+        page = _blank_page()
+        rng = np.random.default_rng(0)
+        page = np.clip(page + rng.normal(0, 4, page.shape), 0, 255).astype(np.uint8)
+        page[:, :30] = 0
+        self.assertTrue(BlankPageDetector().is_blank(page))
+
+    def test_text_page(self):
+        self.assertFalse(BlankPageDetector().is_blank(_text_page()))
+
+    def test_pipeline_drops_blank_pages(self):
+        pipeline = PagePipeline.from_config({"skip_blank_pages": True})
+        pages = [RasterImageFileFormat(_text_page(), "1.png"), RasterImageFileFormat(_blank_page(), "2.png")]
+        self.assertEqual([page.filename for page in pipeline.process(pages)], ["1.png"])
+
+    def test_pipeline_processes_pages_as_they_come(self):
+        pipeline = PagePipeline.from_config({"skip_blank_pages": True})
+        rendered = []
+
+        def render():
+            for number, page in enumerate([_blank_page(), _text_page(), _text_page()], start=1):
+                rendered.append(number)
+                yield RasterImageFileFormat(page, f"{number}.png")
+
+        pages = pipeline.process(render())
+        self.assertEqual(next(pages).filename, "2.png")
+        # The third page is not rendered before the second one is taken
+        self.assertEqual(rendered, [1, 2])
+
+    def test_disabled(self):
+        self.assertIsNone(BlankPageDetector.from_config({"skip_blank_pages": {"enabled": False}}))
+        self.assertIsNone(BlankPageDetector.from_config({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
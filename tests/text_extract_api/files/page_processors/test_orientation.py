@@ -0,0 +1,49 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from text_extract_api.files.file_formats.raster_image import RasterImageFileFormat
+from text_extract_api.files.page_processors.orientation import OrientationDetector
+from text_extract_api.files.page_processors.pipeline import PagePipeline
+
+WORDS = ("the quick brown fox jumps over the lazy dog while people keep reading long lines of "
+         "printed text about good things that happened here before they could get home").split()
+
+
+def _text_page() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    page = np.full((1650, 1275), 250, np.uint8)
+    for y in range(150, 1500, 36):
+        line = " ".join(rng.choice(WORDS, 8))
+        cv2.putText(page, line, (80, y), cv2.FONT_HERSHEY_SIMPLEX, 0.9, 0, 2)
+    return page
+
+
+class TestOrientationDetector(unittest.TestCase):
+
+    def test_detects_every_rotation(self):
+        page = _text_page()
+        detector = OrientationDetector()
+        for turns in range(4):
+            with self.subTest(turns=turns):
+                rotated = np.ascontiguousarray(np.rot90(page, -turns))
+                self.assertEqual(detector.detect(rotated), turns)
+
+    def test_blank_page_is_left_alone(self):
+        self.assertEqual(OrientationDetector().detect(np.full((800, 600), 250, np.uint8)), 0)
+
+    def test_rotation_is_recorded(self):
+        pipeline = PagePipeline.from_config({"orientation": True})
+        upright = RasterImageFileFormat(_text_page(), "1.png")
+        upside_down = RasterImageFileFormat(np.ascontiguousarray(np.rot90(_text_page(), 2)), "2.png")
+
+        pages = list(pipeline.process([upright, upside_down]))
+
+        self.assertIs(pages[0], upright)
+        self.assertEqual(pages[1].metadata, {"rotation": 180})
+        np.testing.assert_array_equal(pages[1].to_numpy(), _text_page())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+
+import cv2
+import numpy as np
+
+from text_extract_api.files.file_formats.raster_image import RasterImageFileFormat
+from text_extract_api.files.page_processors.preprocessor import Preprocessor
+
+WORDS = ("the quick brown fox jumps over the lazy dog while people keep reading long lines of "
+         "printed text about good things that happened here before they could get home").split()
+
+
+def _text_page(font_scale: float = 0.9, thickness: int = 2) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    page = np.full((1650, 1275), 250, np.uint8)
+    line_height = int(40 * font_scale) + 4
+    for y in range(150, 1500, line_height):
+        line = " ".join(rng.choice(WORDS, 8))
+        cv2.putText(page, line, (80, y), cv2.FONT_HERSHEY_SIMPLEX, font_scale, 0, thickness)
+    return page
+
+
+def _process(image: np.ndarray, **options) -> np.ndarray:
+    options = dict(dict(deskew=False, crop_borders=False, target_text_height=0), **options)
+    return Preprocessor(**options).process(RasterImageFileFormat(image, "1.png")).to_numpy()
+
+
+class TestPreprocessor(unittest.TestCase):
+
+    def test_skew_is_detected(self):
+        preprocessor = Preprocessor()
+        for angle in (-3, 2, 4.5):
+            with self.subTest(angle=angle):
+                skewed = Preprocessor.rotate(_text_page(), angle)
+                self.assertAlmostEqual(preprocessor.detect_skew(skewed), -angle, delta=0.5)
+
+    def test_page_is_deskewed(self):
+        page = _process(Preprocessor.rotate(_text_page(), 3), deskew=True)
+        self.assertEqual(page.shape, (1650, 1275))
+        self.assertAlmostEqual(Preprocessor().detect_skew(page), 0, delta=0.5)
+
+    def test_scanner_borders_are_cropped(self):
+        page = np.full((1650, 1275), 250, np.uint8)
+        cv2.putText(page, "hello world text", (300, 800), cv2.FONT_HERSHEY_SIMPLEX, 2, 0, 3)
+        scanned = page.copy()
+        scanned[:30], scanned[-30:], scanned[:, :25], scanned[:, -25:] = 0, 0, 0, 0
+
+        cropped = _process(scanned, crop_borders=True)
+
+        # The text and a small margin around it, no border left
+        self.assertLess(cropped.shape[0], 100)
+        self.assertLess(cropped.shape[1], 600)
+        self.assertTrue((cropped < 128).any())
+        for edge in (cropped[0], cropped[-1], cropped[:, 0], cropped[:, -1]):
+            self.assertTrue((edge > 128).all())
+        np.testing.assert_array_equal(cropped, _process(page, crop_borders=True))
+
+    def test_text_is_rescaled_to_the_target_height(self):
+        large_text = _text_page(font_scale=2.0, thickness=3)
+        self.assertAlmostEqual(Preprocessor(target_text_height=16).text_scale(large_text), 0.5, delta=0.1)
+
+        page = _process(large_text, target_text_height=16)
+        self.assertAlmostEqual(page.shape[0] / large_text.shape[0], 0.5, delta=0.1)
+        # Close enough to the target already - not resampled
+        self.assertEqual(_process(large_text, target_text_height=32).shape, large_text.shape)
+
+    def test_binarized_page_is_black_and_white(self):
+        page = _process(_text_page(), binarize=True)
+        self.assertEqual(set(np.unique(page)), {0, 255})
+
+    def test_everything_disabled_keeps_the_page(self):
+        page = _text_page()
+        np.testing.assert_array_equal(_process(page), page)
+        # Color pages come out grayscale
+        np.testing.assert_array_equal(_process(cv2.cvtColor(page, cv2.COLOR_GRAY2RGB)), page)
+
+    def test_blank_page_is_left_alone(self):
+        blank = np.full((800, 600), 250, np.uint8)
+        np.testing.assert_array_equal(Preprocessor().process(RasterImageFileFormat(blank, "1.png")).to_numpy(), blank)
+
+    def test_from_config(self):
+        self.assertIsNone(Preprocessor.from_config({}))
+        self.assertIsNone(Preprocessor.from_config({"preprocessing": {"enabled": False, "deskew": True}}))
+        preprocessor = Preprocessor.from_config({"preprocessing": {"binarize": True, "target_text_height": 0}})
+        self.assertTrue(preprocessor.binarize)
+        self.assertEqual(preprocessor.target_text_height, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+import errno
+import multiprocessing
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+
+from text_extract_api.files.shared_pages import PageBufferPool, SharedPage
+
+
+def _render(value: int) -> SharedPage:
+    return SharedPage.write(np.full((300, 200), value, np.uint8))
+
+
+def _exists(page: SharedPage) -> bool:
+    try:
+        with page.attach():
+            return True
+    except FileNotFoundError:
+        return False
+
+
+class TestPageBufferPool(unittest.TestCase):
+
+    def test_pages_written_by_another_process(self):
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+            pages = list(executor.map(_render, [1, 2]))
+
+        with PageBufferPool() as pool:
+            for page in pages:
+                pool.adopt(page)
+            view = pool.view(pages[1])
+            self.assertEqual(view.shape, (300, 200))
+            self.assertEqual(int(view[10, 10]), 2)
+            del view
+
+        self.assertFalse(any(_exists(page) for page in pages))
+
+    def test_reference_counting(self):
+        pool = PageBufferPool()
+        page = pool.put(np.arange(12, dtype=np.uint16).reshape(3, 4))
+        pool.retain(page)
+
+        pool.release(page)
+        with page.attach() as view:
+            self.assertEqual(int(view[2, 3]), 11)
+
+        pool.release(page)
+        self.assertFalse(_exists(page))
+        self.assertEqual(len(pool), 0)
+
+    def test_view_outlives_release(self):
+        with PageBufferPool() as pool:
+            page = pool.put(np.full((100, 100), 7, np.uint8))
+            view = pool.view(page)
+            pool.release(page)
+        # Unlinked, but the memory stays mapped while the array is alive
+        self.assertEqual(int(view[50, 50]), 7)
+        self.assertFalse(_exists(page))
+
+    def test_page_not_fitting_into_shared_memory(self):
+        with patch('text_extract_api.files.shared_pages.shared_memory_available', lambda: 1 << 20):
+            with self.assertRaises(OSError) as raised:
+                SharedPage.write(np.zeros((1000, 1000), np.uint8))
+        self.assertEqual(raised.exception.errno, errno.ENOSPC)
+
+    def test_unknown_page(self):
+        with PageBufferPool() as pool:
+            with self.assertRaises(ValueError):
+                pool.view(SharedPage("missing", (1,), "|u1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
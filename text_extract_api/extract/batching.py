@@ -0,0 +1,179 @@
+import os
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from text_extract_api.resources import available_memory_bytes
+
+# Peak detector memory per input pixel, from the CRAFT feature maps (float32, inference only): the
+# first VGG stage holds two 64 channel maps at full resolution (convolution and batch norm output),
+# the input tensor and its normalized copy 3 channels each. Later stages and the decoder work at half
+# resolution or less. Allocator overhead is left to the budget fraction; the planner halves batches
+# that still don't fit anyway.
+DETECTOR_BYTES_PER_PIXEL = (2 * 64 + 2 * 3) * 4
+# EasyOCR shrinks larger detector inputs to this side (`canvas_size`)
+CANVAS_SIZE = 2560
+
+
+class BatchPlanner:
+    """
+    Groups pages into detector batches: pages of similar dimensions go together, so padding them
+    to a common size wastes little, and every batch fits the memory budget - small receipts go
+    many at a time, large scans one by one. A batch failing to allocate halves the budget for
+    the rest of the document.
+
+        planner = BatchPlanner.from_env(gpu=True)
+        for batch in planner.plan([image.shape[:2] for image in images]):
+            ...
+    """
+
+    def __init__(self, memory_budget: int, max_batch_size: int = 16, max_padding: float = 0.25,
+                 bytes_per_pixel: int = DETECTOR_BYTES_PER_PIXEL):
+        self.memory_budget = memory_budget
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_padding = max_padding
+        self.bytes_per_pixel = bytes_per_pixel
+
+    @classmethod
+    def from_env(cls, gpu: bool = False) -> "BatchPlanner":
+        """
+        GPU_BATCH_SIZE - most pages in a batch (default 16)
+        BATCH_MEMORY_FRACTION - share of the free GPU memory (RAM on CPU) batches may take (default 0.5)
+        BATCH_MEMORY_MB - fixed memory budget instead
+        BATCH_BYTES_PER_PIXEL - estimated detector memory per page pixel (default 536, see DETECTOR_BYTES_PER_PIXEL)
+        """
+        budget_mb = os.getenv('BATCH_MEMORY_MB', '')
+        if budget_mb:
+            budget = int(float(budget_mb) * 1024 * 1024)
+        else:
+            available = available_memory_bytes(gpu)
+            fraction = float(os.getenv('BATCH_MEMORY_FRACTION', '0.5'))
+            # Unknown - assume a modest machine
+            budget = int((available if available is not None else 2 << 30) * fraction)
+        return cls(budget, max_batch_size=int(os.getenv('GPU_BATCH_SIZE', '16')),
+                   bytes_per_pixel=int(os.getenv('BATCH_BYTES_PER_PIXEL', str(DETECTOR_BYTES_PER_PIXEL))))
+
+    def batch_bytes(self, height: int, width: int, count: int) -> int:
+        """ Estimated detector memory of `count` pages padded to height x width """
+        scale = min(1.0, CANVAS_SIZE / max(height, width, 1))
+        return int(height * width * scale * scale * count * self.bytes_per_pixel)
+
+    def plan(self, shapes: Sequence[Tuple[int, int]]) -> List[List[int]]:
+        """ Indices of `shapes` (height, width) grouped into batches """
+        order = sorted(range(len(shapes)), key=lambda index: tuple(shapes[index][:2]))
+        batches: List[List[int]] = []
+        batch: List[int] = []
+        height = width = area = 0
+
+        for index in order:
+            page_height, page_width = shapes[index][:2]
+            if batch:
+                padded_height, padded_width = max(height, page_height), max(width, page_width)
+                count = len(batch) + 1
+                padded_area = padded_height * padded_width * count
+                fits = (
+                    count <= self.max_batch_size
+                    and padded_area <= (area + page_height * page_width) * (1 + self.max_padding)
+                    and self.batch_bytes(padded_height, padded_width, count) <= self.memory_budget
+                )
+                if not fits:
+                    batches.append(batch)
+                    batch, height, width, area = [], 0, 0, 0
+
+            batch.append(index)
+            height, width = max(height, page_height), max(width, page_width)
+            area += page_height * page_width
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def back_off(self, batch_size: int) -> None:
+        """ A batch of `batch_size` pages did not fit - later batches get at most half of it """
+        self.max_batch_size = max(1, min(self.max_batch_size, batch_size // 2))
+        self.memory_budget //= 2
+        print(f"Batch did not fit into memory, lowering the batch size to {self.max_batch_size}")
+
+
+def pad_batch(images: List[np.ndarray]) -> List[np.ndarray]:
+    """
+    Pads the images with white to the largest height and width of the batch, so EasyOCR can
+    stack them into a single detector input. Images stay anchored at the top left corner,
+    the padding only adds blank paper to the right and bottom.
+    """
+    color = any(image.ndim == 3 for image in images)
+    height = max(image.shape[0] for image in images)
+    width = max(image.shape[1] for image in images)
+
+    padded = []
+    for image in images:
+        if color and image.ndim == 2:
+            image = np.repeat(image[:, :, np.newaxis], 3, axis=2)
+        if image.shape[:2] != (height, width):
+            canvas = np.full((height, width) + image.shape[2:], 255, dtype=image.dtype)
+            canvas[:image.shape[0], :image.shape[1]] = image
+            image = canvas
+        padded.append(image)
+    return padded
+
+
+def readtext_batched(reader, images: List[np.ndarray], planner: BatchPlanner,
+                     recognition_batch_size: int = 16) -> List[List[str]]:
+    """
+    `reader.readtext(image, detail=0)` for many pages with batched inference: pages grouped by
+    the planner are padded to the same size and detected in one forward pass, the text boxes
+    found on a page are recognized `recognition_batch_size` at a time. Results are in the order
+    of `images`.
+    """
+    results: List[List[str]] = [[] for _ in images]
+    pending = planner.plan([image.shape[:2] for image in images])
+
+    while pending:
+        indices = pending.pop(0)
+        batch = [images[index] for index in indices]
+        try:
+            if len(batch) == 1:
+                batch_results = [reader.readtext(batch[0], detail=0, batch_size=recognition_batch_size)]
+            else:
+                batch_results = reader.readtext_batched(pad_batch(batch), detail=0,
+                                                        batch_size=recognition_batch_size)
+        except Exception as e:
+            if _is_out_of_memory(e) and len(batch) > 1:
+                # Retry in halves, and plan the remaining pages within the lowered budget
+                _release_gpu_memory()
+                planner.back_off(len(batch))
+                remaining = [index for batch_indices in pending for index in batch_indices]
+                half = len(indices) // 2
+                pending = [indices[:half], indices[half:]] + ([
+                    [remaining[i] for i in planned]
+                    for planned in planner.plan([images[index].shape[:2] for index in remaining])
+                ] if remaining else [])
+                continue
+            print(f"Batched OCR of {len(batch)} images failed, reading them one by one: {e}")
+            batch_results = [_readtext_or_empty(reader, image) for image in batch]
+
+        for index, result in zip(indices, batch_results):
+            results[index] = result
+
+    return results
+
+
+def _is_out_of_memory(error: Exception) -> bool:
+    return isinstance(error, MemoryError) or 'out of memory' in str(error).lower()
+
+
+def _release_gpu_memory() -> None:
+    try:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
+
+
+def _readtext_or_empty(reader, image: np.ndarray) -> List[str]:
+    try:
+        return reader.readtext(image, detail=0)
+    except Exception as e:
+        print(f"Error processing image in batch: {e}")
+        return []
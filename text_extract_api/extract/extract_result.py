@@ -1,4 +1,4 @@
-from typing import Callable, Any
+from typing import Callable, Any, Dict, Optional
 
 """
 IMPORTANT INFORMATION ABOUT THIS CLASS:
@@ -19,7 +19,8 @@ class ExtractResult:
     def __init__(
         self,
         value: Any,
-        text_gatherer: Callable[[Any], str] = None
+        text_gatherer: Callable[[Any], str] = None,
+        metadata: Optional[Dict] = None
     ):
         """
         Initializes a UnifiedText instance.
@@ -28,6 +29,8 @@ class ExtractResult:
             value (Any): The object containing or representing the text.
             text_gatherer (Callable[[Any], str], optional): A callable that extracts text
                 from the `data`. Defaults to the `_default_text_gatherer`.
+            metadata (Dict, optional): Facts about the extraction (device used, per page
+                information such as the applied rotation, ...).
 
         Raises:
             ValueError: If `text_gatherer` is not callable or not provided when `value` is not a string.
@@ -55,10 +58,11 @@ class ExtractResult:
 
         self.value = value
         self.text_gatherer = text_gatherer or self._default_text_gatherer
+        self.metadata = metadata or {}
 
     @staticmethod
-    def from_text(value: str) -> 'ExtractResult':
-        return ExtractResult(value)
+    def from_text(value: str, metadata: Optional[Dict] = None) -> 'ExtractResult':
+        return ExtractResult(value, metadata=metadata)
 
     @property
     def text(self) -> str:
@@ -0,0 +1,106 @@
+import os
+from contextlib import nullcontext
+from typing import Dict, Optional, Union
+
+from text_extract_api.resources import available_cpu_count
+
+
+class InferenceProfile:
+    """
+    How torch based models run in a worker process: CPU threads, `torch.inference_mode`
+    and dynamic int8 quantization of the EasyOCR models (CPU readers only).
+
+    Torch defaults to one thread per core in every process, so several workers on one host
+    oversubscribe the cores; `threads: auto` splits the CPUs available to the container
+    (cgroup quota aware) between the WORKERS_PER_HOST worker processes (default 1).
+
+    Configured per strategy in `config/strategies.yaml`, applied at worker start:
+
+        inference:
+           threads: auto         # intra-op threads (torch and OpenCV), or a number
+           interop_threads: 1    # inter-op threads, torch default when missing
+           inference_mode: true  # run models under torch.inference_mode
+           quantize: false       # dynamic int8 quantization of CPU readers
+
+    Thread counts are process wide - strategies sharing a worker should share the profile.
+    """
+    _applied: Optional["InferenceProfile"] = None
+
+    def __init__(self, threads: Union[int, str, None] = 'auto', interop_threads: Optional[int] = None,
+                 inference_mode: bool = True, quantize: bool = False):
+        if threads == 'auto':
+            threads = max(1, available_cpu_count() // max(1, int(os.getenv('WORKERS_PER_HOST', '1'))))
+        self.threads = int(threads) if threads else None
+        self.interop_threads = int(interop_threads) if interop_threads else None
+        self.inference_mode = inference_mode
+        self.quantize = quantize
+
+    @classmethod
+    def from_config(cls, config: Union[bool, Dict, None]) -> Optional["InferenceProfile"]:
+        """ Returns None when the strategy runs with torch defaults """
+        if isinstance(config, bool) or config is None:
+            return cls() if config else None
+        if not config.get('enabled', True):
+            return None
+        return cls(
+            threads=config.get('threads', 'auto'),
+            interop_threads=config.get('interop_threads'),
+            inference_mode=bool(config.get('inference_mode', True)),
+            quantize=bool(config.get('quantize', False)),
+        )
+
+    @classmethod
+    def current(cls) -> Optional["InferenceProfile"]:
+        """ The profile applied in this worker process, if any """
+        return cls._applied
+
+    def apply(self) -> None:
+        """ Sets the thread pools of this process; call before the models are loaded """
+        applied = InferenceProfile._applied
+        if applied is not None and applied != self:
+            print(f"Inference profile {self} replaces {applied} applied earlier in this worker")
+        InferenceProfile._applied = self
+
+        if self.threads:
+            # Child processes (e.g. OpenMP in numpy) read the limit from the environment
+            os.environ['OMP_NUM_THREADS'] = str(self.threads)
+            try:
+                import cv2
+                cv2.setNumThreads(self.threads)
+            except ImportError:
+                pass
+
+        try:
+            import torch
+        except ImportError:
+            return
+        if self.threads:
+            torch.set_num_threads(self.threads)
+        if self.interop_threads:
+            try:
+                torch.set_num_interop_threads(self.interop_threads)
+            except RuntimeError as e:
+                # Only possible before torch starts any parallel work
+                print(f"Could not set torch inter-op threads: {e}")
+        print(f"Applied inference profile {self}")
+
+    def context(self):
+        """ Context for running the models - torch.inference_mode when enabled """
+        if not self.inference_mode:
+            return nullcontext()
+        try:
+            import torch
+        except ImportError:
+            return nullcontext()
+        return torch.inference_mode()
+
+    @staticmethod
+    def context_of(profile: Optional["InferenceProfile"]):
+        return profile.context() if profile else nullcontext()
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, InferenceProfile) and vars(self) == vars(other)
+
+    def __repr__(self) -> str:
+        return (f"InferenceProfile(threads={self.threads}, interop_threads={self.interop_threads}, "
+                f"inference_mode={self.inference_mode}, quantize={self.quantize})")
@@ -0,0 +1,39 @@
+import os
+import threading
+from typing import Optional
+
+import httpx
+from ollama import Client
+
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def shared_client() -> Client:
+    """
+    Ollama client of this worker process - its connections are kept alive and reused by every
+    request. Created on first use, so each forked worker process gets its own connection pool.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = client_from_env()
+        return _client
+
+
+def client_from_env() -> Client:
+    """
+    OLLAMA_HOST - Ollama server, read by the ollama package (default http://localhost:11434)
+    OLLAMA_TIMEOUT - seconds to wait for a response chunk, upload or free connection (default 180)
+    OLLAMA_CONNECT_TIMEOUT - seconds to wait for a connection (default OLLAMA_TIMEOUT)
+    OLLAMA_MAX_CONNECTIONS - open connections to the server (default 10)
+    OLLAMA_KEEPALIVE_EXPIRY - seconds an idle connection is kept open (default 60)
+    """
+    timeout = float(os.getenv('OLLAMA_TIMEOUT', '180'))
+    connect_timeout = float(os.getenv('OLLAMA_CONNECT_TIMEOUT', str(timeout)))
+    max_connections = int(os.getenv('OLLAMA_MAX_CONNECTIONS', '10'))
+    return Client(
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                            keepalive_expiry=float(os.getenv('OLLAMA_KEEPALIVE_EXPIRY', '60'))),
+    )
@@ -0,0 +1,125 @@
+"""
+ONNX Runtime execution of EasyOCR models on CPU. The CRAFT detector and the recognizer of a
+reader are exported to ONNX once, cached on disk and run by ONNX Runtime sessions with full
+graph optimizations; the torch modules of the reader are swapped for thin shims, so EasyOCR's
+own pre- and post-processing (and therefore the text output) stays the same.
+
+Requires the `onnx` extra: pip install "text_extract_api[onnx]"
+
+ONNX_CACHE_PATH - directory of the exported models
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Optional
+
+import torch
+
+DETECTOR_INPUT = (1, 3, 640, 640)
+# Recognizer input height is fixed by EasyOCR (imgH), the width depends on the text box
+RECOGNIZER_INPUT = (1, 1, 64, 256)
+OPSET = 17
+
+_export_lock = threading.Lock()
+
+
+def onnx_reader(reader, threads: Optional[int] = None):
+    """ Swaps the detector and recognizer of a CPU easyocr.Reader for ONNX Runtime sessions """
+    import easyocr
+
+    cache_path = os.getenv('ONNX_CACHE_PATH', os.path.join(tempfile.gettempdir(), 'text_extract_api', 'onnx'))
+    os.makedirs(cache_path, exist_ok=True)
+    key = f"easyocr-{easyocr.__version__}-{_model_key(reader)}"
+
+    detector_path = os.path.join(cache_path, f"{key}-detector.onnx")
+    recognizer_path = os.path.join(cache_path, f"{key}-recognizer.onnx")
+    with _export_lock:
+        if not os.path.isfile(detector_path):
+            _export(reader.detector, DETECTOR_INPUT, detector_path, ['y', 'feature'],
+                    {'input': {0: 'batch', 2: 'height', 3: 'width'}})
+        if not os.path.isfile(recognizer_path):
+            _export(_RecognizerImageOnly(reader.recognizer), RECOGNIZER_INPUT, recognizer_path, ['preds'],
+                    {'input': {0: 'batch', 3: 'width'}})
+
+    reader.detector = _OnnxModule(_session(detector_path, threads), reader.detector)
+    reader.recognizer = _OnnxModule(_session(recognizer_path, threads), reader.recognizer)
+    return reader
+
+
+def _model_key(reader) -> str:
+    """ Exports are shared by readers with the same weights (e.g. all Latin languages) """
+    digest = hashlib.sha1()
+    for model in (reader.detector, reader.recognizer):
+        for name, tensor in model.state_dict().items():
+            digest.update(name.encode('utf-8'))
+            digest.update(str(tuple(tensor.shape)).encode('utf-8'))
+            # A sample of the weights tells models of the same architecture apart
+            digest.update(tensor.flatten()[:64].cpu().numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def _export(model, input_shape, path: str, output_names, dynamic_axes) -> None:
+    print(f"Exporting {type(model).__name__} to {path}")
+    model.eval()
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    os.close(fd)
+    try:
+        with torch.no_grad():
+            torch.onnx.export(model, torch.zeros(*input_shape), temp_path, input_names=['input'],
+                              output_names=output_names, dynamic_axes=dynamic_axes, opset_version=OPSET)
+        # Renamed when complete - other workers exporting the same model never load a partial file
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def _session(path: str, threads: Optional[int]):
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    if threads:
+        options.intra_op_num_threads = threads
+        options.inter_op_num_threads = 1
+    return onnxruntime.InferenceSession(path, options, providers=['CPUExecutionProvider'])
+
+
+class _RecognizerImageOnly(torch.nn.Module):
+    """ The EasyOCR recognizer takes an unused `text` argument (CTC decoding) - exported without it """
+
+    def __init__(self, recognizer):
+        super().__init__()
+        self.recognizer = recognizer
+
+    def forward(self, image):
+        return self.recognizer(image, None)
+
+
+class _OnnxModule(torch.nn.Module):
+    """
+    Stands in for a torch module inside EasyOCR: takes and returns torch tensors, the inference
+    runs in ONNX Runtime. Extra positional arguments (the recognizer `text`) are ignored by the
+    session. When the session fails (e.g. an input shape the export doesn't handle), the
+    original torch `module` takes over for the lifetime of the reader.
+    """
+
+    def __init__(self, session, module: torch.nn.Module):
+        super().__init__()
+        self.session = session
+        self.module = module
+        self.input_name = session.get_inputs()[0].name
+
+    def forward(self, image, *args):
+        if self.session is not None:
+            try:
+                outputs = self.session.run(None, {self.input_name: image.detach().cpu().numpy().astype('float32')})
+            except Exception as e:
+                print(f"ONNX Runtime failed, running {type(self.module).__name__} on torch: {e}")
+                self.session = None
+            else:
+                tensors = tuple(torch.from_numpy(output) for output in outputs)
+                return tensors[0] if len(tensors) == 1 else tensors
+        return self.module(image, *args)
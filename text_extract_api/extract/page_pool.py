@@ -0,0 +1,160 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from text_extract_api.extract.inference import InferenceProfile
+from text_extract_api.extract.reader_pool import ReaderPool
+from text_extract_api.extract.tiling import TiledOCR
+from text_extract_api.files.shared_pages import PageBufferPool, SharedPage
+
+
+class PageOCRPool:
+    """
+    OCRs the pages of one document concurrently in a pool of processes, each holding its own
+    EasyOCR readers (ReaderPool of the process), and returns the results in page order. Gives
+    a single task - e.g. a `--pool=solo` worker - the whole CPU allocation of the worker.
+
+    The processes are kept for the lifetime of the worker; the CPUs are split between them, so
+    each runs torch with `cpus // processes` threads. Pages are passed in shared memory when the
+    task has page buffers (see PageBufferPool) and they fit, pickled otherwise.
+
+    Configured per strategy in `config/strategies.yaml`:
+
+        process_pool:
+           enabled: true
+           processes: auto   # or a number; auto - a process per CPU of the worker
+    """
+    _executor: Optional[ProcessPoolExecutor] = None
+
+    def __init__(self, processes: Optional[int] = None, profile: Optional[InferenceProfile] = None):
+        self.profile = profile
+        self.processes = max(1, processes or self.worker_cpus())
+
+    def worker_cpus(self) -> int:
+        """ CPUs of this worker - the threads of its inference profile, else its share of the host """
+        if self.profile and self.profile.threads:
+            return self.profile.threads
+        return InferenceProfile().threads
+
+    @classmethod
+    def from_config(cls, config: Union[bool, Dict, None],
+                    profile: Optional[InferenceProfile] = None) -> Optional["PageOCRPool"]:
+        """ Returns None when disabled, or when there is a single CPU to use """
+        if isinstance(config, bool) or config is None:
+            pool = cls(profile=profile) if config else None
+        elif not config.get('enabled', True):
+            pool = None
+        else:
+            processes = config.get('processes', 'auto')
+            pool = cls(None if processes == 'auto' else int(processes), profile)
+        return pool if pool and pool.processes > 1 else None
+
+    def readtext(self, images: Iterable[np.ndarray], language: str, backend: str = 'torch',
+                 tiling_config: Union[bool, Dict, None] = None,
+                 page_buffers: Optional[PageBufferPool] = None) -> Iterator[List[str]]:
+        """ `reader.readtext(image, detail=0)` of every image, in order; images are consumed lazily """
+        options = (language, backend, tiling_config)
+        # Pages in flight - enough to keep every process busy while results are collected in order
+        window: Deque[Tuple[np.ndarray, Optional[SharedPage], ProcessPoolExecutor, Future]] = deque()
+        try:
+            for image in images:
+                window.append(self._submit(image, options, page_buffers))
+                if len(window) >= 2 * self.processes:
+                    yield self._result(window.popleft(), options, page_buffers)
+            while window:
+                yield self._result(window.popleft(), options, page_buffers)
+        finally:
+            # Consumer stopped early or OCR failed - unlinked segments stay mapped in the processes still reading them
+            for _, page, _, future in window:
+                future.cancel()
+                if page:
+                    page_buffers.release(page)
+
+    def warm_up(self, language: str, backend: str = 'torch') -> None:
+        """ Loads the readers in the pool processes - best effort, a busy process may take two jobs """
+        executor = self._get_executor()
+        wait([executor.submit(warm_up_process, language, backend) for _ in range(self.processes)])
+
+    def _submit(self, image: np.ndarray, options: Tuple, page_buffers: Optional[PageBufferPool]):
+        page = None
+        if page_buffers is not None:
+            try:
+                page = page_buffers.put(image)
+            except OSError as e:
+                # /dev/shm is full - the page is pickled instead
+                print(f"Passing the page to the OCR process without shared memory: {e}")
+        try:
+            executor, future = self._submit_to_pool(image, page, options)
+        except BrokenProcessPool:
+            # Broke since the last page was collected - later pages go to a new pool
+            self._reset_executor(PageOCRPool._executor)
+            executor, future = self._submit_to_pool(image, page, options)
+        return image, page, executor, future
+
+    def _submit_to_pool(self, image: np.ndarray, page: Optional[SharedPage], options: Tuple):
+        executor = self._get_executor()
+        if page is not None:
+            return executor, executor.submit(ocr_shared_page, page, *options)
+        return executor, executor.submit(ocr_page, image, *options)
+
+    def _result(self, entry, options: Tuple, page_buffers: Optional[PageBufferPool]) -> List[str]:
+        image, page, executor, future = entry
+        try:
+            return future.result()
+        except (BrokenProcessPool, CancelledError) as e:
+            # A process died (e.g. killed for memory) - the page is read here. Only the pool the
+            # page was sent to is replaced: pages in flight on a new pool must not be cancelled.
+            print(f"OCR process pool broke, reading the page in the worker: {e!r}")
+            self._reset_executor(executor)
+            return ocr_page(image, *options)
+        finally:
+            if page:
+                page_buffers.release(page)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Kept for the lifetime of the worker - loading readers per document would cost more than it saves
+        if PageOCRPool._executor is None:
+            threads = max(1, self.worker_cpus() // self.processes)
+            profile = self.profile or InferenceProfile()
+            child_profile = InferenceProfile(threads=threads, interop_threads=1,
+                                             inference_mode=profile.inference_mode, quantize=profile.quantize)
+            PageOCRPool._executor = ProcessPoolExecutor(max_workers=self.processes,
+                                                        mp_context=multiprocessing.get_context("spawn"),
+                                                        initializer=child_profile.apply)
+        return PageOCRPool._executor
+
+    @staticmethod
+    def _reset_executor(executor: Optional[ProcessPoolExecutor]) -> None:
+        """ Drops the broken `executor` - unless it was replaced already """
+        if executor is None or executor is not PageOCRPool._executor:
+            return
+        PageOCRPool._executor = None
+        # Futures of a broken pool have failed already - nothing left to cancel
+        executor.shutdown(wait=False)
+
+
+def ocr_page(image: np.ndarray, language: str, backend: str = 'torch',
+             tiling_config: Union[bool, Dict, None] = None) -> List[str]:
+    """ OCR of one page with the reader of this process; module level, so it can run in the pool """
+    reader = ReaderPool.shared().get(language, backend=backend)
+    tiling = TiledOCR.from_config(tiling_config)
+    with InferenceProfile.context_of(InferenceProfile.current()):
+        if tiling:
+            return tiling.readtext(reader, image)
+        return reader.readtext(image, detail=0)
+
+
+def ocr_shared_page(page: SharedPage, language: str, backend: str = 'torch',
+                    tiling_config: Union[bool, Dict, None] = None) -> List[str]:
+    """ ocr_page of a page in shared memory, read in place """
+    with page.attach() as image:
+        return ocr_page(image, language, backend, tiling_config)
+
+
+def warm_up_process(language: str, backend: str = 'torch') -> None:
+    with InferenceProfile.context_of(InferenceProfile.current()):
+        ReaderPool.shared().warm_up(language, backend=backend)
@@ -0,0 +1,169 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterable, Optional, Tuple, Union
+
+import cv2
+import numpy as np
+
+from text_extract_api.extract.inference import InferenceProfile
+
+# (languages, gpu, backend)
+ReaderKey = Tuple[Tuple[str, ...], bool, str]
+# Execution backends of the readers, CPU only except `torch`: `torch_int8` has dynamically quantized
+# models (EasyOCR's `quantize`), `onnx` runs detector and recognizer in ONNX Runtime (see onnx_backend.py)
+BACKENDS = ('torch', 'torch_int8', 'onnx')
+
+
+class ReaderPool:
+    """
+    EasyOCR readers kept alive in the worker between tasks, keyed by the language set,
+    device and execution backend. Loading the detector and recognizer weights takes seconds, so a reader is built
+    once per key and reused; the least recently used readers are dropped when there are more
+    than `max_readers` of them or their parameters take more than `max_bytes`.
+
+    Shared by all EasyOCR based strategies of the process:
+
+        reader = ReaderPool.shared().get("en,de", gpu=True)
+    """
+    _shared: Optional["ReaderPool"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_readers: int = 4, max_bytes: Optional[int] = None,
+                 factory: Optional[Callable[[Tuple[str, ...], bool, str], Any]] = None,
+                 sizer: Optional[Callable[[Any], int]] = None):
+        self.max_readers = max(1, max_readers)
+        self.max_bytes = max_bytes
+        self._factory = factory or self._create_reader
+        self._sizer = sizer or self._parameter_bytes
+        self._readers: "OrderedDict[ReaderKey, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "ReaderPool":
+        """
+        EASYOCR_READER_POOL_SIZE - readers kept per worker process (default 4)
+        EASYOCR_READER_POOL_MAX_MB - limit of the estimated reader memory, empty for none
+        """
+        max_mb = os.getenv('EASYOCR_READER_POOL_MAX_MB', '')
+        return cls(
+            max_readers=int(os.getenv('EASYOCR_READER_POOL_SIZE', '4')),
+            max_bytes=int(float(max_mb) * 1024 * 1024) if max_mb else None,
+        )
+
+    @classmethod
+    def shared(cls) -> "ReaderPool":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls.from_env()
+            return cls._shared
+
+    @staticmethod
+    def normalize_languages(languages: Union[str, Iterable[str]]) -> Tuple[str, ...]:
+        """ "de, en" and ["en", "de"] are the same reader """
+        if isinstance(languages, str):
+            languages = languages.split(',')
+        normalized = tuple(sorted({language.strip().lower() for language in languages if language.strip()}))
+        return normalized or ('en',)
+
+    @staticmethod
+    def backend_for(strategy) -> str:
+        """
+        Backend of the strategy readers: the `backend` of its config, otherwise an int8 recognizer
+        when its inference profile quantizes
+        """
+        backend = strategy.get_config('backend')
+        if backend:
+            return str(backend).lower()
+        profile = strategy.inference_profile()
+        return 'torch_int8' if profile and profile.quantize else 'torch'
+
+    def get(self, languages: Union[str, Iterable[str]], gpu: bool = False, backend: str = 'torch'):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown EasyOCR backend '{backend}'. Available: {', '.join(BACKENDS)}")
+        if gpu and backend != 'torch':
+            # Quantized and ONNX readers run on CPU only - GPU readers stay on torch
+            backend = 'torch'
+        key = (self.normalize_languages(languages), bool(gpu), backend)
+        # Readers are built under the lock - concurrent tasks asking for the same languages
+        # wait for the one being loaded instead of loading it again
+        with self._lock:
+            if key in self._readers:
+                self._readers.move_to_end(key)
+                return self._readers[key][0]
+
+            print(f"Loading EasyOCR reader languages={list(key[0])}, gpu={key[1]}, backend={key[2]}")
+            reader = self._factory(*key)
+            self._readers[key] = (reader, self._sizer(reader))
+            self._evict()
+            return reader
+
+    def warm_up(self, languages: Union[str, Iterable[str]], gpu: bool = False, backend: str = 'torch'):
+        """ Loads the reader and reads a line of text, so detector and recognizer both run once """
+        reader = self.get(languages, gpu, backend)
+        image = np.full((64, 320), 255, np.uint8)
+        cv2.putText(image, "Warm up 123", (8, 44), cv2.FONT_HERSHEY_SIMPLEX, 1.2, 0, 2)
+        reader.readtext(image, detail=0)
+        return reader
+
+    def clear(self) -> None:
+        with self._lock:
+            self._readers.clear()
+        self._release_gpu_memory()
+
+    def __len__(self) -> int:
+        return len(self._readers)
+
+    def __contains__(self, key: ReaderKey) -> bool:
+        return key in self._readers
+
+    def _evict(self) -> None:
+        """ Drops the least recently used readers; the one just added always stays """
+        evicted = False
+        while len(self._readers) > 1 and (
+                len(self._readers) > self.max_readers
+                or (self.max_bytes is not None and self._total_bytes() > self.max_bytes)):
+            (languages, gpu, backend), _ = self._readers.popitem(last=False)
+            print(f"Evicting EasyOCR reader languages={list(languages)}, gpu={gpu}, backend={backend}")
+            evicted = evicted or gpu
+        if evicted:
+            self._release_gpu_memory()
+
+    def _total_bytes(self) -> int:
+        return sum(size for _, size in self._readers.values())
+
+    @staticmethod
+    def _create_reader(languages: Tuple[str, ...], gpu: bool, backend: str):
+        import easyocr
+        # EasyOCR quantizes CPU models by default - only `torch_int8` readers get int8 weights
+        reader = easyocr.Reader(list(languages), gpu=gpu, quantize=(backend == 'torch_int8'))
+        if backend == 'onnx':
+            # Exported from the float models of the reader (not quantized above) - int8 modules don't export
+            try:
+                from text_extract_api.extract.onnx_backend import onnx_reader
+                profile = InferenceProfile.current()
+                reader = onnx_reader(reader, threads=profile.threads if profile else None)
+            except Exception as e:
+                # Missing `onnx` extra or a model that doesn't export - the torch reader gives the same text
+                print(f"Warning: ONNX Runtime backend unavailable for EasyOCR languages={list(languages)}, "
+                      f"running on torch: {type(e).__name__}: {e}")
+        return reader
+
+    @staticmethod
+    def _parameter_bytes(reader) -> int:
+        """ Estimated memory of the reader: the size of the detector and recognizer weights """
+        size = 0
+        for model in (getattr(reader, 'detector', None), getattr(reader, 'recognizer', None)):
+            parameters = getattr(model, 'parameters', None)
+            if callable(parameters):
+                size += sum(p.numel() * p.element_size() for p in parameters())
+        return size
+
+    @staticmethod
+    def _release_gpu_memory() -> None:
+        try:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except ImportError:
+            pass
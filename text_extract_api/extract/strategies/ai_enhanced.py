@@ -16,13 +16,17 @@ except ImportError:
     TORCH_AVAILABLE = False
 
 from text_extract_api.extract.extract_result import ExtractResult
+from text_extract_api.extract.inference import InferenceProfile
+from text_extract_api.extract.reader_pool import ReaderPool
 from text_extract_api.extract.strategies.strategy import Strategy
 from text_extract_api.files.file_formats.file_format import FileFormat
 from text_extract_api.files.file_formats.image import ImageFileFormat
 
 class AIEnhancedStrategy(Strategy):
     """AI-powered text extraction with GPU acceleration support"""
-    
+    ACCEPTED_FORMATS = (ImageFileFormat,)
+    PAGE_SEPARATOR = '\n\n--- PAGE BREAK ---\n\n'
+
     def __init__(self):
         self.device = self._setup_device()
         self.model = None
@@ -69,6 +73,12 @@ class AIEnhancedStrategy(Strategy):
                 return_all_scores=True
             )
             
+            profile = self.inference_profile()
+            if profile and profile.quantize and self.device == "cpu":
+                # int8 weights of the linear layers - most of the compute of a transformer on CPU
+                self.model.model = torch.quantization.quantize_dynamic(
+                    self.model.model, {torch.nn.Linear}, dtype=torch.qint8)
+            
             print("✅ AI model loaded successfully")
             
         except ImportError:
@@ -117,57 +127,55 @@ class AIEnhancedStrategy(Strategy):
             print(f"⚠️  AI enhancement failed: {e}")
             return {"enhanced_text": text, "confidence": 0.5, "analysis": {"error": str(e)}}
     
-    def _extract_with_easyocr(self, images) -> str:
+    def _extract_with_easyocr(self, images, language: str = 'en') -> str:
         """Fallback to EasyOCR for basic text extraction"""
         try:
-            import easyocr
-            
-            # Use GPU if available for EasyOCR
+            # Use GPU if available for EasyOCR; the reader is shared with the EasyOCR strategies
             use_gpu = self.device in ["cuda", "mps"]
-            reader = easyocr.Reader(['en'], gpu=use_gpu)
+            reader = ReaderPool.shared().get(language, gpu=use_gpu, backend=ReaderPool.backend_for(self))
             
             all_text = []
             for image_format in images:
-                import io
-                from PIL import Image
-                import numpy as np
-                
-                pil_image = Image.open(io.BytesIO(image_format.binary))
-                np_image = np.array(pil_image)
-                
+                np_image = image_format.to_numpy()
+
                 # Extract text
-                result = reader.readtext(np_image, detail=0)
+                with InferenceProfile.context_of(self.inference_profile()):
+                    result = reader.readtext(np_image, detail=0)
                 if result:
                     page_text = '\n'.join(result)
                     all_text.append(page_text)
             
-            return '\n\n--- PAGE BREAK ---\n\n'.join(all_text)
+            return self.PAGE_SEPARATOR.join(all_text)
             
         except ImportError:
             return "EasyOCR not available for text extraction"
         except Exception as e:
             return f"Error in text extraction: {e}"
     
+    def warmup(self) -> None:
+        self._load_ai_model()
+        if self.model is not None:
+            self.model("Warm up")
+        for language in self.warmup_languages():
+            ReaderPool.shared().warm_up(language, gpu=self.device in ["cuda", "mps"],
+                                        backend=ReaderPool.backend_for(self))
+
     def extract_text(self, file_format: FileFormat, language: str = 'en') -> ExtractResult:
         """
         Extract text using AI-enhanced processing with GPU acceleration
         """
         start_time = time.time()
         
-        # Ensure we can process the file
-        if (not isinstance(file_format, ImageFileFormat) 
-            and not file_format.can_convert_to(ImageFileFormat)):
-            raise TypeError(f"AI Enhanced - format {file_format.mime_type} not supported")
-        
-        # Convert to images
-        images = FileFormat.convert_to(file_format, ImageFileFormat)
+        # Convert to images, lazily (TypeError if the format can't be)
+        pages = []
+        images = self.page_images(file_format, pages)
         
         # Load AI model if not already loaded
         self._load_ai_model()
         
         # Extract basic text
-        print(f"🔤 Extracting text from {len(images)} image(s)...")
-        raw_text = self._extract_with_easyocr(images)
+        print("🔤 Extracting text from the page images...")
+        raw_text = self._extract_with_easyocr(images, language)
         
         # Enhance with AI
         print("🧠 Enhancing text with AI analysis...")
@@ -183,12 +191,13 @@ class AIEnhancedStrategy(Strategy):
             'ai_enhanced': self.model is not None,
             'confidence_score': enhanced_result['confidence'],
             'processing_time': round(processing_time, 3),
-            'pages_processed': len(images),
+            'pages_processed': len(pages),
             'language': language,
-            'analysis': enhanced_result['analysis']
+            'analysis': enhanced_result['analysis'],
+            'pages': pages
         }
         
-        return ExtractResult(enhanced_result['enhanced_text'], metadata)
+        return ExtractResult(enhanced_result['enhanced_text'], metadata=metadata)
 
 # Demonstration function
 def demo_ai_gpu_benefits():
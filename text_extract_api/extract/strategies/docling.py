@@ -1,5 +1,6 @@
 import tempfile
 
+from docling.datamodel.base_models import InputFormat
 from docling.document_converter import DocumentConverter
 from docling_core.types.doc.document import (  # Assuming a compatible Docling library or module
     DoclingDocument,
@@ -14,10 +15,20 @@ class DoclingStrategy(Strategy):
     Extraction strategy for processing PDF documents using Docling.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._converter = None
+
     @classmethod
     def name(cls) -> str:
         return "docling"
 
+    def warmup(self) -> None:
+        # Layout and table models of the PDF pipeline are loaded when it is initialized
+        converter = self._get_converter()
+        if hasattr(converter, 'initialize_pipeline'):
+            converter.initialize_pipeline(InputFormat.PDF)
+
     def extract_text(
         self, file_format: FileFormat, language: str = "en"
     ) -> ExtractResult:
@@ -56,12 +67,17 @@ class DoclingStrategy(Strategy):
         """
         # Placeholder for actual conversion logic using the Docling API
         try:
-            converter = DocumentConverter()
-            docling_document = converter.convert(file_path).document
+            docling_document = self._get_converter().convert(file_path).document
             return docling_document
         except Exception as e:
             raise RuntimeError(f"Failed to convert document using Docling: {e}")
 
+    def _get_converter(self) -> DocumentConverter:
+        """ Kept for the life of the worker - pipelines and their models are loaded once """
+        if self._converter is None:
+            self._converter = DocumentConverter()
+        return self._converter
+
     def _save_to_temp_file(self, file_format: FileFormat) -> str:
         """
         Saves the content of a FileFormat instance to a temporary file.
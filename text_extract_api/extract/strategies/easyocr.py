@@ -1,59 +1,78 @@
-import io
-import numpy as np
-from PIL import Image
-import easyocr
+from typing import Optional
 
-from extract.extract_result import ExtractResult
+from text_extract_api.extract.extract_result import ExtractResult
+from text_extract_api.extract.inference import InferenceProfile
+from text_extract_api.extract.page_pool import PageOCRPool
+from text_extract_api.extract.reader_pool import ReaderPool
 from text_extract_api.extract.strategies.strategy import Strategy
+from text_extract_api.extract.tiling import TiledOCR
 from text_extract_api.files.file_formats.file_format import FileFormat
 from text_extract_api.files.file_formats.image import ImageFileFormat
 
 
 class EasyOCRStrategy(Strategy):
+    ACCEPTED_FORMATS = (ImageFileFormat,)
+
     @classmethod
     def name(cls) -> str:
         return "easyocr"
 
+    def warmup(self) -> None:
+        profile = self.inference_profile()
+        page_pool = self.page_pool()
+        for language in self.warmup_languages():
+            if page_pool:
+                # Pages are read in the pool processes - their readers are the ones to load
+                page_pool.warm_up(language, backend=ReaderPool.backend_for(self))
+                continue
+            with InferenceProfile.context_of(profile):
+                ReaderPool.shared().warm_up(language, backend=ReaderPool.backend_for(self))
+
+    def page_pool(self) -> Optional[PageOCRPool]:
+        return PageOCRPool.from_config(self.get_config('process_pool'), self.inference_profile())
+
     def extract_text(self, file_format: FileFormat, language: str = 'en') -> ExtractResult:
         """
         Extract text using EasyOCR after converting the input file to images
         (if not already an ImageFileFormat). 
         """
 
-        # Ensure we can actually convert the input file to ImageFileFormat
-        if (
-            not isinstance(file_format, ImageFileFormat) 
-            and not file_format.can_convert_to(ImageFileFormat)
-        ):
-            raise TypeError(
-                f"EasyOCR - format {file_format.mime_type} is not supported (yet?)"
-            )
+        # Convert the input file to ImageFileFormat pages, lazily (TypeError if it can't be)
+        pages = []
+        images = self.page_images(file_format, pages)
 
-        # Convert the input file to a list of ImageFileFormat objects
-        images = FileFormat.convert_to(file_format, ImageFileFormat)
+        backend = ReaderPool.backend_for(self)
+        page_pool = self.page_pool()
+        if page_pool:
+            # Pages are OCR'd concurrently in processes with their own readers, results come in page order
+            ocr_results = page_pool.readtext((image_format.to_numpy() for image_format in images), language,
+                                             backend, self.get_config('tiling'), self._page_buffers)
+        else:
+            ocr_results = self._readtext(images, language, backend)
 
-        # Initialize the EasyOCR Reader
-        # Add or change languages to your needs, e.g., ['en', 'fr']
-        reader = easyocr.Reader(language.split(','))
+        # Combine all lines into a single string for each image/page
+        all_extracted_text = ["\n".join(ocr_result) for ocr_result in ocr_results]
 
-        # Process each image, extracting text
-        all_extracted_text = []
-        for image_format in images:
-            # Convert the in-memory bytes to a PIL Image
-            pil_image = Image.open(io.BytesIO(image_format.binary))
-            
-            # Convert PIL image to numpy array for EasyOCR
-            np_image = np.array(pil_image)
+        # Join text from all images/pages
+        full_text = self.PAGE_SEPARATOR.join(all_extracted_text)
 
-            # Perform OCR; with `detail=0`, we get just text, no bounding boxes
-            ocr_result = reader.readtext(np_image, detail=0) # TODO: addd bounding boxes support as described in #37
 
-            # Combine all lines into a single string for that image/page
-            extracted_text = "\n".join(ocr_result)
-            all_extracted_text.append(extracted_text)
+        return ExtractResult.from_text(full_text, metadata={'pages': pages})
 
-        # Join text from all images/pages
-        full_text = "\n\n".join(all_extracted_text)
+    def _readtext(self, images, language: str, backend: str):
+        # EasyOCR Reader for the languages, e.g. 'en,fr' - loaded once per worker and reused
+        reader = ReaderPool.shared().get(language, backend=backend)
+        profile = self.inference_profile()
+        # Oversized pages are OCR'd as overlapping tiles when `tiling` is configured
+        tiling = TiledOCR.from_config(self.get_config('tiling'))
 
+        for image_format in images:
+            # Pixels for EasyOCR - rendered pages are handed over without an encode/decode pass
+            np_image = image_format.to_numpy()
 
-        return ExtractResult.from_text(full_text)
+            # Perform OCR; with `detail=0`, we get just text, no bounding boxes
+            with InferenceProfile.context_of(profile):
+                if tiling:
+                    yield tiling.readtext(reader, np_image)
+                else:
+                    yield reader.readtext(np_image, detail=0) # TODO: addd bounding boxes support as described in #37
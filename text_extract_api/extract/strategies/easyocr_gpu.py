@@ -4,24 +4,26 @@ GPU-optimized EasyOCR Strategy
 Enhanced version with GPU acceleration support
 """
 
-import io
-import numpy as np
-from PIL import Image
 import easyocr
 import os
-from typing import List, Optional
+from itertools import islice
 
-from extract.extract_result import ExtractResult
+from text_extract_api.extract.extract_result import ExtractResult
+from text_extract_api.extract.batching import BatchPlanner, readtext_batched
+from text_extract_api.extract.inference import InferenceProfile
+from text_extract_api.extract.reader_pool import ReaderPool
 from text_extract_api.extract.strategies.strategy import Strategy
+from text_extract_api.extract.tiling import TiledOCR
 from text_extract_api.files.file_formats.file_format import FileFormat
 from text_extract_api.files.file_formats.image import ImageFileFormat
 
 
 class EasyOCRGPUStrategy(Strategy):
     """GPU-optimized EasyOCR Strategy with batch processing"""
-    
+    ACCEPTED_FORMATS = (ImageFileFormat,)
+    PAGE_SEPARATOR = '\n\n--- PAGE BREAK ---\n\n'
+
     def __init__(self):
-        self._reader = None
         self._use_gpu = self._detect_gpu_support()
         
     @classmethod
@@ -58,92 +60,61 @@ class EasyOCRGPUStrategy(Strategy):
         return gpu_available
 
     def _get_reader(self, language: str = 'en') -> easyocr.Reader:
-        """Get or create EasyOCR reader with GPU support"""
-        if self._reader is None:
-            languages = language.split(',') if ',' in language else [language]
-            
-            print(f"Initializing EasyOCR with GPU={self._use_gpu}, languages={languages}")
-            
+        """Get the pooled EasyOCR reader for the languages, with GPU support"""
+        backend = ReaderPool.backend_for(self)
+        if self._use_gpu:
             try:
-                self._reader = easyocr.Reader(
-                    languages, 
-                    gpu=self._use_gpu,
-                    download_enabled=True
-                )
+                return ReaderPool.shared().get(language, gpu=True, backend=backend)
             except Exception as e:
                 print(f"Failed to initialize GPU reader, falling back to CPU: {e}")
-                self._reader = easyocr.Reader(languages, gpu=False)
                 self._use_gpu = False
-                
-        return self._reader
-
-    def _process_image_batch(self, images: List[np.ndarray], batch_size: int = 4) -> List[List[str]]:
-        """Process multiple images in batches for better GPU utilization"""
-        if not self._use_gpu or len(images) <= 1:
-            # Process individually for CPU or single images
-            return [self._reader.readtext(img, detail=0) for img in images]
-        
-        results = []
-        for i in range(0, len(images), batch_size):
-            batch = images[i:i + batch_size]
-            batch_results = []
-            
-            for img in batch:
-                try:
-                    result = self._reader.readtext(img, detail=0)
-                    batch_results.append(result)
-                except Exception as e:
-                    print(f"Error processing image in batch: {e}")
-                    batch_results.append([])
-                    
-            results.extend(batch_results)
-            
-        return results
+
+        return ReaderPool.shared().get(language, gpu=False, backend=backend)
+
+    def warmup(self) -> None:
+        for language in self.warmup_languages():
+            # Resolves the device first - falls back to CPU when the GPU reader can't be built
+            self._get_reader(language)
+            with InferenceProfile.context_of(self.inference_profile()):
+                ReaderPool.shared().warm_up(language, gpu=self._use_gpu, backend=ReaderPool.backend_for(self))
 
     def extract_text(self, file_format: FileFormat, language: str = 'en') -> ExtractResult:
         """
         Extract text using GPU-optimized EasyOCR with batch processing
         """
 
-        # Ensure we can actually convert the input file to ImageFileFormat
-        if (
-            not isinstance(file_format, ImageFileFormat) 
-            and not file_format.can_convert_to(ImageFileFormat)
-        ):
-            raise TypeError(
-                f"EasyOCR GPU - format {file_format.mime_type} is not supported"
-            )
-
-        # Convert the input file to a list of ImageFileFormat objects
-        images = FileFormat.convert_to(file_format, ImageFileFormat)
+        # Convert the input file to ImageFileFormat pages, lazily (TypeError if it can't be)
+        pages = []
+        images = self.page_images(file_format, pages)
 
         # Get the EasyOCR Reader with GPU support
         reader = self._get_reader(language)
 
-        # Convert all images to numpy arrays
-        np_images = []
-        for image_format in images:
-            # Convert the in-memory bytes to a PIL Image
-            pil_image = Image.open(io.BytesIO(image_format.binary))
-            
-            # Convert PIL image to numpy array for EasyOCR
-            np_image = np.array(pil_image)
-            np_images.append(np_image)
-
-        # Get batch size from environment or use default
-        batch_size = int(os.getenv('GPU_BATCH_SIZE', '4'))
-        
-        # Process images in batches for better GPU utilization
-        print(f"Processing {len(np_images)} images with batch size {batch_size}")
-        
-        if len(np_images) > 1 and self._use_gpu:
-            ocr_results = self._process_image_batch(np_images, batch_size)
-        else:
-            # Process individually
-            ocr_results = []
-            for np_image in np_images:
-                result = reader.readtext(np_image, detail=0)
-                ocr_results.append(result)
+        # Pages detected in one forward pass are grouped by size within the free memory,
+        # text boxes of a page are recognized GPU_RECOGNITION_BATCH_SIZE at a time
+        planner = BatchPlanner.from_env(gpu=self._use_gpu)
+        recognition_batch_size = int(os.getenv('GPU_RECOGNITION_BATCH_SIZE', '16'))
+
+        # Oversized pages are OCR'd as overlapping tiles, the rest in batches
+        tiling = TiledOCR.from_config(self.get_config('tiling'))
+
+        # Pages are planned into batches a window at a time - a long document is never held at once
+        window_size = max(1, int(os.getenv('GPU_BATCH_WINDOW', str(4 * planner.max_batch_size))))
+        print(f"Processing pages in windows of {window_size} within a batch memory budget of "
+              f"{planner.memory_budget // (1024 * 1024)} MB")
+        ocr_results = []
+        while True:
+            # Pixels for EasyOCR - rendered pages are handed over without an encode/decode pass
+            np_images = [image_format.to_numpy() for image_format in islice(images, window_size)]
+            if not np_images:
+                break
+            tiled = [bool(tiling) and max(np_image.shape[:2]) > tiling.max_side for np_image in np_images]
+            with InferenceProfile.context_of(self.inference_profile()):
+                batched_results = iter(readtext_batched(
+                    reader, [np_image for np_image, tile in zip(np_images, tiled) if not tile],
+                    planner, recognition_batch_size))
+                ocr_results.extend(tiling.readtext(reader, np_image) if tile else next(batched_results)
+                                   for np_image, tile in zip(np_images, tiled))
 
         # Combine all text results
         all_extracted_text = []
@@ -153,29 +124,21 @@ class EasyOCRGPUStrategy(Strategy):
                 all_extracted_text.append(page_text)
 
         # Join all pages with page separators
-        final_text = '\n\n--- PAGE BREAK ---\n\n'.join(all_extracted_text)
+        final_text = self.PAGE_SEPARATOR.join(all_extracted_text)
         
         # Create metadata with GPU info
         metadata = {
             'strategy': self.name(),
             'gpu_used': self._use_gpu,
             'language': language,
-            'pages_processed': len(images),
-            'batch_size': batch_size if self._use_gpu else 1,
-            'total_text_blocks': sum(len(result) for result in ocr_results)
+            'pages_processed': len(pages),
+            'batch_size': planner.max_batch_size,
+            'total_text_blocks': sum(len(result) for result in ocr_results),
+            'pages': pages
         }
 
-        return ExtractResult(final_text, metadata)
+        return ExtractResult(final_text, metadata=metadata)
 
     def cleanup(self):
-        """Clean up GPU resources"""
-        if self._reader is not None:
-            # Clear GPU memory if using GPU
-            if self._use_gpu:
-                try:
-                    import torch
-                    if torch.cuda.is_available():
-                        torch.cuda.empty_cache()
-                except ImportError:
-                    pass
-            self._reader = None
+        """Drop the pooled readers and clear GPU memory"""
+        ReaderPool.shared().clear()
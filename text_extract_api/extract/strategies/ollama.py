@@ -1,18 +1,20 @@
 import os
-import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-import httpx
-from ollama import Client
+from ollama import ResponseError
 
-from extract.extract_result import ExtractResult
+from text_extract_api.extract.extract_result import ExtractResult
+from text_extract_api.extract.ollama_client import shared_client
 from text_extract_api.extract.strategies.strategy import Strategy
 from text_extract_api.files.file_formats.file_format import FileFormat
-from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.file_formats.image import ImageFileFormat, ImageTarget
 
 
 class OllamaStrategy(Strategy):
     """Ollama models OCR strategy"""
+    ACCEPTED_FORMATS = (ImageFileFormat,)
 
     @classmethod
     def name(cls) -> str:
@@ -20,53 +22,87 @@ class OllamaStrategy(Strategy):
 
     def extract_text(self, file_format: FileFormat, language: str = 'en') -> ExtractResult:
 
-        if (
-                not isinstance(file_format, ImageFileFormat)
-                and not file_format.can_convert_to(ImageFileFormat)
-        ):
-            raise TypeError(
-                f"Ollama OCR - format {file_format.mime_type} is not supported (yet?)"
-            )
-        images = FileFormat.convert_to(file_format, ImageFileFormat)
-        extracted_text = ""
-        start_time = time.time()
-        ocr_percent_done = 0
-        num_pages = len(images)
-        for i, image in enumerate(images):
-
-            with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as temp_file:
-                temp_file.write(image.binary)
-                temp_filename = temp_file.name
-
-            # Generate text using the specified model
-            try:
-                timeout = httpx.Timeout(connect=180.0, read=180.0, write=180.0, pool=180.0) # @todo move those values to .env
-                ollama = Client(timeout=timeout)
-                response = ollama.chat(self._strategy_config.get('model'), [{
-                    'role': 'user',
-                    'content': self._strategy_config.get('prompt'),
-                    'images': [temp_filename]
-                }], stream=True)
-                os.remove(temp_filename)
-                num_chunk = 1
-                for chunk in response:
-                    meta = {
-                        'progress': str(30 + ocr_percent_done),
-                        'status': 'OCR Processing'
-                                  + '(page ' + str(i + 1) + ' of ' + str(num_pages) + ')'
-                                  + ' chunk no: ' + str(num_chunk),
-                        'start_time': start_time,
-                        'elapsed_time': time.time() - start_time}
-                    self.update_state_callback(state='PROGRESS', meta=meta)
-                    num_chunk += 1
-                    extracted_text += chunk['message']['content']
-
-                ocr_percent_done += int(
-                    20 / num_pages)  # 20% of work is for OCR - just a stupid assumption from tasks.py
-            except ollama.ResponseError as e:
-                print('Error:', e.error)
-                raise Exception("Failed to generate text with Ollama model " + self._strategy_config.get('model'))
-
-            print(response)
-
-        return ExtractResult.from_text(extracted_text)
+        pages = []
+        # Vision pages are compressed (see `render_profile: vision`), keeping them is cheap - the
+        # progress reports the page count and the pages are handed out to the concurrent requests
+        images = list(self.page_images(file_format, pages))
+        progress = _PageProgress(self.update_state, len(images))
+        # Pages are sent at the resolution the model works at (`image` of the strategy config)
+        image_target = self.image_target()
+
+        # Up to `concurrency` pages are in flight - match OLLAMA_NUM_PARALLEL of the server
+        concurrency = max(1, int(self.get_config('concurrency', os.getenv('OLLAMA_CONCURRENCY', '1'))))
+        if concurrency == 1 or len(images) < 2:
+            page_texts = [self._read_page(i, image, progress, image_target) for i, image in enumerate(images)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(concurrency, len(images))) as executor:
+                futures = [executor.submit(self._read_page, i, image, progress, image_target)
+                           for i, image in enumerate(images)]
+                try:
+                    # Pages finish in any order, the text is joined in page order
+                    page_texts = [future.result() for future in futures]
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+        extracted_text = "".join(page_texts)
+        return ExtractResult.from_text(extracted_text, metadata={'pages': pages})
+
+    def image_target(self) -> ImageTarget:
+        config = self.get_config('image')
+        if config:
+            return ImageTarget.from_dict(config)
+        # Models without a target get RGB JPEGs of at most IMAGE_MAX_SIDE
+        return ImageTarget(max_side=int(os.getenv('IMAGE_MAX_SIDE', '3000')), quality=90)
+
+    def _read_page(self, i: int, image: ImageFileFormat, progress: "_PageProgress",
+                   image_target: ImageTarget) -> str:
+        image = image_target.apply(image)
+
+        # Generate text using the specified model
+        try:
+            # The image is sent from memory (base64 encoded by the client), over a kept-alive connection
+            response = shared_client().chat(self._strategy_config.get('model'), [{
+                'role': 'user',
+                'content': self._strategy_config.get('prompt'),
+                'images': [image.binary]
+            }], stream=True)
+            page_text = []
+            for num_chunk, chunk in enumerate(response, start=1):
+                progress.chunk(i, num_chunk)
+                page_text.append(chunk['message']['content'])
+        except ResponseError as e:
+            print('Error:', e.error)
+            raise Exception("Failed to generate text with Ollama model " + self._strategy_config.get('model'))
+
+        progress.page_done()
+        return "".join(page_text)
+
+
+class _PageProgress:
+    """ Progress of the pages read concurrently, reported one update at a time """
+
+    def __init__(self, update_state, num_pages: int):
+        self.update_state = update_state
+        self.num_pages = num_pages
+        self.pages_done = 0
+        self.start_time = time.time()
+        self._lock = threading.Lock()
+
+    def chunk(self, i: int, num_chunk: int) -> None:
+        with self._lock:
+            # 20% of work is for OCR - just a stupid assumption from tasks.py
+            ocr_percent_done = int(20 * self.pages_done / self.num_pages)
+            meta = {
+                'progress': str(30 + ocr_percent_done),
+                'status': 'OCR Processing'
+                          + '(page ' + str(i + 1) + ' of ' + str(self.num_pages) + ')'
+                          + ' chunk no: ' + str(num_chunk),
+                'start_time': self.start_time,
+                'elapsed_time': time.time() - self.start_time}
+            self.update_state(state='PROGRESS', meta=meta)
+
+    def page_done(self) -> None:
+        with self._lock:
+            self.pages_done += 1
@@ -2,8 +2,7 @@ import os
 import tempfile
 import time
 
-from extract.extract_result import ExtractResult
-
+from text_extract_api.extract.extract_result import ExtractResult
 from text_extract_api.extract.strategies.strategy import Strategy
 from text_extract_api.files.file_formats.file_format import FileFormat
 from text_extract_api.files.file_formats.image import ImageFileFormat
@@ -13,37 +12,39 @@ import requests
 
 class RemoteStrategy(Strategy):
     """Remote API Strategy"""
+    ACCEPTED_FORMATS = (PdfFileFormat,)
+    # The whole document is uploaded in one request
+    SPLIT_PAGES = False
 
     @classmethod
     def name(cls) -> str:
         return "remote"
 
-    def extract_text(self, file_format: FileFormat, language: str = 'en') -> ExtractResult:
+    def accepted_formats(self):
+        # Images are wrapped into a PDF unless the backend is known to take them (`accept_images: true`)
+        if self.get_config('accept_images', False):
+            return self.ACCEPTED_FORMATS + (ImageFileFormat,)
+        return self.ACCEPTED_FORMATS
 
-        if (
-                not isinstance(file_format, PdfFileFormat)
-                and not file_format.can_convert_to(PdfFileFormat)
-        ):
-            raise TypeError(
-                f"Marker PDF - format {file_format.mime_type} is not supported (yet?)"
-            )
+    def extract_text(self, file_format: FileFormat, language: str = 'en') -> ExtractResult:
 
-        pdf_files = FileFormat.convert_to(file_format, PdfFileFormat)
+        input_files = list(self.prepare_input(file_format))
         extracted_text = ""
         start_time = time.time()
         ocr_percent_done = 0
         
-        if len(pdf_files) > 1:
-            raise ValueError("Only one PDF file is supported.")
+        if len(input_files) > 1:
+            raise ValueError("Only one input file is supported.")
         
-        if len(pdf_files) == 0:
-            raise ValueError("No PDF file found - conversion error.")
+        if len(input_files) == 0:
+            raise ValueError("No input file found - conversion error.")
 
         try: 
             url = os.getenv("REMOTE_API_URL", self._strategy_config.get("url"))
             if not url:
                 raise Exception('Please do set the REMOTE_API_URL environment variable: export REMOTE_API_URL=http://...')
-            files = {'file': ('document.pdf', pdf_files[0].binary, 'application/pdf')}
+            input_file = input_files[0]
+            files = {'file': (input_file.filename, input_file.binary, input_file.mime_type)}
             data = {
                 'page_range': None,
                 'languages': language,
@@ -61,7 +62,7 @@ class RemoteStrategy(Strategy):
 
             response = requests.post(url, files=files, data=data)
             if response.status_code != 200:
-                raise Exception(f"Failed to upload PDF file: {response.content}")
+                raise Exception(f"Failed to upload file: {response.content}")
 
             extracted_text = response.json().get('output', '')
         except Exception as e:
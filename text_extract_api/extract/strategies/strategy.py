@@ -3,16 +3,31 @@ import os
 import yaml
 import importlib
 import pkgutil
-from typing import Type, Dict
+from typing import Iterator, Type, Dict, List, Optional, Tuple
 
 from pydantic.v1.typing import get_class
 
-from extract.extract_result import ExtractResult
+from text_extract_api.extract.extract_result import ExtractResult
+from text_extract_api.extract.inference import InferenceProfile
+from text_extract_api.files.converters.conversion_graph import ConversionGraph
+from text_extract_api.files.converters.render_profile import RenderProfile
 from text_extract_api.files.file_formats.file_format import FileFormat
+from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.page_processors.pipeline import PagePipeline
+from text_extract_api.files.shared_pages import PageBufferPool
 
 class Strategy:
     _strategies: Dict[str, Strategy] = {}
     _strategy_config: Dict[str, Dict] = {}
+    _render_profiles: Dict[str, RenderProfile] = {}
+    _render_profile_name: Optional[str] = None
+    _page_buffers: Optional[PageBufferPool] = None
+    # Formats `extract_text` works on - other files are converted along the cheapest path (see ConversionGraph)
+    ACCEPTED_FORMATS: Tuple[Type[FileFormat], ...] = (FileFormat,)
+    # False - the strategy needs the whole document in a single file, pageable formats are never split into pages
+    SPLIT_PAGES: bool = True
+    # Joins the text of consecutive pages - also of pages taken from a PDF text layer (see TextLayerExtractor)
+    PAGE_SEPARATOR: str = "\n\n"
 
     def __init__(self):
         self.update_state_callback = None
@@ -21,13 +36,101 @@ class Strategy:
     def set_strategy_config(self, config: Dict):
         self._strategy_config = config
 
+    def get_config(self, key: str, default=None):
+        return (self._strategy_config or {}).get(key, default)
+
     def set_update_state_callback(self, callback):
         self.update_state_callback = callback
 
+    def set_render_profile(self, name: Optional[str]):
+        """ Per request override of the render profile; None restores the strategy default """
+        self._render_profile_name = name
+
+    def set_page_buffers(self, page_buffers: Optional[PageBufferPool]):
+        """ Shared memory for page rasters of the current task (see PageBufferPool), None - pickle pages """
+        self._page_buffers = page_buffers
+
+    def inference_profile(self) -> Optional[InferenceProfile]:
+        """ Threads, inference mode and quantization of torch models (`inference` config), None - defaults """
+        return InferenceProfile.from_config(self.get_config('inference'))
+
+    def warmup_config(self) -> Optional[Dict]:
+        """ The `warmup` config of the strategy (`true` or options), None when not warmed up """
+        config = self.get_config('warmup')
+        if isinstance(config, bool) or config is None:
+            return {} if config else None
+        return config if config.get('enabled', True) else None
+
+    def warmup_languages(self) -> List[str]:
+        """ Language sets to preload, in the `language` request parameter format, e.g. ['en', 'en,de'] """
+        languages = (self.warmup_config() or {}).get('languages', ['en'])
+        return [languages] if isinstance(languages, str) else list(languages)
+
+    def warmup(self) -> None:
+        """
+        Loads the models and runs a tiny inference at worker start (see extract/warmup.py),
+        so the first task doesn't pay for it. Strategies without local models do nothing.
+        """
+        pass
+
     def update_state(self, state, meta):
         if self.update_state_callback:
             self.update_state_callback(state, meta)
 
+    def render_profile(self) -> RenderProfile:
+        """
+        Resolves the profile used to rasterize pages for this strategy, in order:
+        the per request override, the `render_profile` of the strategy config (a profile
+        name or inline options), the `default` profile, built-in RenderProfile defaults.
+        """
+        if self._render_profile_name:
+            return self.get_render_profile(self._render_profile_name)
+
+        config = self.get_config('render_profile')
+        if isinstance(config, dict):
+            return RenderProfile.from_dict(config)
+        if config:
+            return self.get_render_profile(config)
+
+        if 'default' not in self._render_profiles:
+            self.load_render_profiles_from_config()
+        return self._render_profiles.get('default') or RenderProfile()
+
+    def accepted_formats(self) -> Tuple[Type[FileFormat], ...]:
+        return self.ACCEPTED_FORMATS
+
+    def prepare_input(self, file_format: FileFormat, **options) -> Iterator[FileFormat]:
+        """
+        Converts the file to formats accepted by the strategy, lazily. Files already
+        accepted are passed through as they are.
+
+        Raises:
+            TypeError: If no accepted format can be reached from the file format.
+        """
+        path = ConversionGraph.cheapest_path(type(file_format), self.accepted_formats(), self.SPLIT_PAGES)
+        if path is None:
+            raise TypeError(f"{self.name()} - format {file_format.mime_type} is not supported (yet?)")
+        return ConversionGraph.convert(file_format, path, **options)
+
+    def page_images(self, file_format: FileFormat,
+                    pages_metadata: Optional[List[Dict]] = None) -> Iterator[ImageFileFormat]:
+        """
+        Converts the file to page images with the strategy render profile and runs them
+        through the page pipeline configured for the strategy (see PagePipeline).
+
+        Pages are yielded one by one as they are processed - strategies should not keep them
+        after use. What the page processors recorded about each page yielded (e.g. `rotation`)
+        is appended to `pages_metadata`, for ExtractResult metadata.
+        """
+        # Pages are handed to the pipeline as they are rendered/decoded, not all at once
+        images = self.prepare_input(file_format, render_profile=self.render_profile(),
+                                    page_buffers=self._page_buffers)
+        pipeline = PagePipeline.from_config(self._strategy_config)
+        for image in (pipeline.process(images) if pipeline else images):
+            if pages_metadata is not None:
+                pages_metadata.append(dict(getattr(image, 'metadata', {}), page=image.filename))
+            yield image
+
     @classmethod
     def name(cls) -> str:
         raise NotImplementedError("Strategy subclasses must implement name")
@@ -65,6 +168,25 @@ class Strategy:
 
         return cls._strategies[name]
 
+    @classmethod
+    def get_render_profile(cls, name: str) -> RenderProfile:
+        """
+        Fetches a named render profile from the `render_profiles` section of the config.
+
+        Raises:
+            ValueError: If the profile is not defined.
+        """
+        name = name.lower().strip()
+
+        if name not in cls._render_profiles:
+            cls.load_render_profiles_from_config()
+
+        if name not in cls._render_profiles:
+            available = ', '.join(cls._render_profiles.keys())
+            raise ValueError(f"Unknown render profile '{name}'. Available: {available}")
+
+        return cls._render_profiles[name]
+
     @classmethod
     def register_strategy(cls, strategy, name: str = None, override: bool = False):
         # Handle both strategy instances and strategy classes
@@ -88,14 +210,7 @@ class Strategy:
     @classmethod
     def load_strategies_from_config(cls, path: str = os.getenv('OCR_CONFIG_PATH', 'config/strategies.yaml')):
         strategies = cls._strategies
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(path)))
-        config_file_path = os.path.join(project_root, path)
-
-        if not os.path.isfile(config_file_path):
-            raise FileNotFoundError(f"Config file not found at path: {config_file_path}")
-
-        with open(config_file_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config_file_path, config = cls._read_config(path)
 
         if 'strategies' not in config or not isinstance(config['strategies'], dict):
             raise ValueError(f"Missing or invalid 'strategies' section in the {config_file_path} file")
@@ -119,6 +234,30 @@ class Strategy:
 
         return strategies
 
+    @classmethod
+    def load_render_profiles_from_config(cls, path: str = os.getenv('OCR_CONFIG_PATH', 'config/strategies.yaml')):
+        config_file_path, config = cls._read_config(path)
+
+        profiles = config.get('render_profiles') or {}
+        if not isinstance(profiles, dict):
+            raise ValueError(f"Invalid 'render_profiles' section in the {config_file_path} file")
+
+        for profile_name, profile_config in profiles.items():
+            cls._render_profiles[profile_name.lower()] = RenderProfile.from_dict(profile_config or {})
+
+        return cls._render_profiles
+
+    @staticmethod
+    def _read_config(path: str):
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(path)))
+        config_file_path = os.path.join(project_root, path)
+
+        if not os.path.isfile(config_file_path):
+            raise FileNotFoundError(f"Config file not found at path: {config_file_path}")
+
+        with open(config_file_path, 'r') as f:
+            return config_file_path, yaml.safe_load(f)
+
     @classmethod
     def autodiscover_strategies(cls) -> Dict[str, Type]:
         strategies = cls._strategies
@@ -0,0 +1,186 @@
+import csv
+import io
+import json
+import mimetypes
+import re
+import unicodedata
+from html.parser import HTMLParser
+from typing import Iterator, List, Optional
+
+from text_extract_api.extract.extract_result import ExtractResult
+from text_extract_api.extract.strategies.strategy import Strategy
+from text_extract_api.files.file_formats.file_format import FileFormat
+from text_extract_api.files.file_formats.text import TextFileFormat
+
+# Control characters other than tab and newline (form feeds, NULs of broken exports, ...)
+CONTROL_CHARACTERS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+CHUNK_SIZE = 1 << 16
+DELIMITERS = ",;\t|"
+
+
+class TextStrategy(Strategy):
+    """
+    Fast path for formats that already contain the text (plain text, Markdown, CSV, JSON, HTML):
+    decoded and normalized in-process, streaming through the file instead of loading a document
+    converter. Selected automatically for these formats unless the requested strategy accepts
+    them itself.
+    """
+    ACCEPTED_FORMATS = (TextFileFormat,)
+
+    @classmethod
+    def name(cls) -> str:
+        return "text"
+
+    def extract_text(self, file_format: FileFormat, language: str = 'en') -> ExtractResult:
+        input_file = next(iter(self.prepare_input(file_format)))
+        encoding = input_file.encoding
+        kind = self.kind(input_file)
+
+        if kind == "csv":
+            lines = self.csv_to_markdown(self.stream(input_file, encoding, newline=''))
+        elif kind == "json":
+            lines = self.json_to_markdown(self.stream(input_file, encoding))
+        elif kind == "html":
+            lines = self.html_to_markdown(self.stream(input_file, encoding))
+        else:
+            lines = self.stream(input_file, encoding)
+
+        text = "\n".join(self.normalize(line) for line in lines).strip("\n")
+        return ExtractResult.from_text(text, metadata={'format': kind, 'encoding': encoding})
+
+    @staticmethod
+    def kind(file_format: FileFormat) -> str:
+        mime_type = file_format.mime_type
+        if mime_type == "text/plain":
+            # libmagic reports most Markdown and many CSV files as plain text
+            mime_type = mimetypes.guess_type(file_format.filename)[0] or mime_type
+        if mime_type.endswith("csv"):
+            return "csv"
+        if mime_type.endswith("json"):
+            return "json"
+        if mime_type == "text/html":
+            return "html"
+        if mime_type.endswith("markdown"):
+            return "markdown"
+        return "plain"
+
+    @staticmethod
+    def stream(file_format: FileFormat, encoding: str, newline: Optional[str] = None) -> io.TextIOWrapper:
+        """
+        Lines decoded incrementally - the decoded text never exists as a whole. Undecodable bytes
+        past the sniffed sample are replaced rather than failing the task.
+        """
+        return io.TextIOWrapper(io.BytesIO(file_format.binary), encoding=encoding, errors="replace",
+                                newline=newline)
+
+    @staticmethod
+    def normalize(line: str) -> str:
+        line = unicodedata.normalize("NFC", line.rstrip("\r\n"))
+        return CONTROL_CHARACTERS.sub("", line).rstrip()
+
+    @staticmethod
+    def csv_to_markdown(lines: io.TextIOWrapper) -> Iterator[str]:
+        # The delimiter most used in the header line - csv.Sniffer is easily confused by ragged rows
+        header = lines.readline()
+        delimiter = max(DELIMITERS, key=header.count)
+        lines.seek(0)
+
+        columns = 0
+        for row_number, row in enumerate(csv.reader(lines, delimiter=delimiter)):
+            if not row:
+                continue
+            if row_number == 0:
+                # The header fixes the width of the table; longer rows extend the last column
+                columns = len(row)
+            elif len(row) > columns:
+                row = row[:columns - 1] + [" ".join(row[columns - 1:])]
+            cells = [cell.replace("|", "\\|").replace("\n", " ").strip() for cell in row]
+            yield "| " + " | ".join(cells + [""] * (columns - len(cells))) + " |"
+            if row_number == 0:
+                yield "|" + "---|" * columns
+
+    @staticmethod
+    def json_to_markdown(lines: io.TextIOWrapper) -> Iterator[str]:
+        try:
+            document = json.load(lines)
+        except json.JSONDecodeError:
+            # Not valid JSON after all (e.g. JSON lines) - keep it as it is
+            lines.seek(0)
+            yield from lines
+            return
+        yield "```json"
+        yield from json.dumps(document, indent=2, ensure_ascii=False).splitlines()
+        yield "```"
+
+    @staticmethod
+    def html_to_markdown(lines: io.TextIOWrapper) -> Iterator[str]:
+        parser = _HtmlText()
+        while True:
+            chunk = lines.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            yield from parser.flush()
+        parser.close()
+        yield from parser.flush(final=True)
+
+
+class _HtmlText(HTMLParser):
+    """ Visible text of an HTML page, with headings, list items and paragraphs kept as Markdown """
+    SKIPPED = {"script", "style", "head", "template", "noscript", "svg"}
+    BLOCKS = {"p", "div", "section", "article", "header", "footer", "main", "nav", "aside", "table",
+              "ul", "ol", "blockquote", "pre", "form", "figure", "hr", "dl"}
+    LINES = {"br", "tr", "dt", "dd", "li"}
+    HEADINGS = {"h1": "#", "h2": "##", "h3": "###", "h4": "####", "h5": "#####", "h6": "######"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._skipping = 0
+        self._line: List[str] = []
+        self._lines: List[str] = []
+        self._after_text = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIPPED:
+            self._skipping += 1
+        elif tag in self.HEADINGS:
+            self._break(paragraph=True)
+            self._line.append(self.HEADINGS[tag] + " ")
+        elif tag == "li":
+            self._break()
+            self._line.append("- ")
+        elif tag in ("td", "th"):
+            self._line.append(" ")
+        elif tag in self.BLOCKS or tag in self.LINES:
+            self._break()
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIPPED:
+            self._skipping = max(0, self._skipping - 1)
+        elif tag in self.HEADINGS or tag in self.BLOCKS:
+            self._break(paragraph=True)
+        elif tag in self.LINES:
+            self._break()
+
+    def handle_data(self, data):
+        if not self._skipping:
+            # Whitespace at the edges separates words of neighbouring inline elements
+            self._line.append(re.sub(r"\s+", " ", data))
+
+    def flush(self, final: bool = False) -> List[str]:
+        """ Lines completed since the last call """
+        if final:
+            self._break()
+        lines, self._lines = self._lines, []
+        return lines
+
+    def _break(self, paragraph: bool = False):
+        line = re.sub(r" {2,}", " ", "".join(self._line)).strip()
+        self._line = []
+        if line and line not in ("-", *self.HEADINGS.values()):
+            self._lines.append(line)
+            self._after_text = True
+        if paragraph and self._after_text:
+            # One blank line between blocks
+            self._lines.append("")
+            self._after_text = False
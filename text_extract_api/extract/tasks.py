@@ -2,12 +2,16 @@ import os
 import time
 from typing import Optional
 
-import ollama
 import redis
 
 from text_extract_api.celery_app import app as celery_app
+from text_extract_api.extract import warmup  # noqa - connects the worker start signals
+from text_extract_api.extract.ollama_client import shared_client
 from text_extract_api.extract.strategies.strategy import Strategy
+from text_extract_api.extract.text_layer import TextLayerExtractor
 from text_extract_api.files.file_formats.file_format import FileFormat
+from text_extract_api.files.file_formats.text import TextFileFormat
+from text_extract_api.files.shared_pages import PageBufferPool
 from text_extract_api.files.storage_manager import StorageManager
 
 # Connect to Redis
@@ -28,6 +32,7 @@ def ocr_task(
         language: Optional[str] = None,
         storage_profile: Optional[str] = None,
         storage_filename: Optional[str] = None,
+        render_profile: Optional[str] = None,
 ):
     """
     Celery task to perform OCR processing on a PDF/Office/image file.
@@ -36,6 +41,7 @@ def ocr_task(
 
     strategy = Strategy.get_strategy(strategy_name)
     strategy.set_update_state_callback(self.update_state)
+    strategy.set_render_profile(render_profile)
 
     self.update_state(state='PROGRESS', status="File uploaded successfully",
                       meta={'progress': 10})  # Example progress update
@@ -52,8 +58,24 @@ def ocr_task(
         self.update_state(state='PROGRESS',
                           meta={'progress': 30, 'status': 'Extracting text from file', 'start_time': start_time,
                                 'elapsed_time': time.time() - start_time})  # Example progress update
-        extract_result = strategy.extract_text(FileFormat.from_binary(binary_content), language)
-        extracted_text = extract_result.text
+        file_format = FileFormat.from_binary(binary_content, filename=filename)
+        if isinstance(file_format, TextFileFormat) and TextFileFormat not in strategy.accepted_formats():
+            # The text is already there - decode it in-process instead of OCR or a document converter
+            strategy = Strategy.get_strategy('text')
+            strategy.set_update_state_callback(self.update_state)
+            print(f"Text file, extracting with strategy: {strategy.name()}")
+        text_layer = TextLayerExtractor.from_config(strategy.get_config('text_layer'))
+        # Page rasters passed between processes live in shared memory, released once consumed or when the task ends
+        with PageBufferPool() as page_buffers:
+            strategy.set_page_buffers(page_buffers)
+            try:
+                if text_layer:
+                    extract_result = text_layer.extract_text(strategy, file_format, language)
+                else:
+                    extract_result = strategy.extract_text(file_format, language)
+                extracted_text = extract_result.text
+            finally:
+                strategy.set_page_buffers(None)
 
     else:
         print("Using cached result...")
@@ -72,7 +94,7 @@ def ocr_task(
         print(f"Transforming text using LLM (prompt={prompt}, model={model}) ...")
         self.update_state(state='PROGRESS', meta={'progress': 75, 'status': 'Processing LLM', 'start_time': start_time,
                                                   'elapsed_time': time.time() - start_time})  # Example progress update
-        llm_resp = ollama.generate(model, prompt + extracted_text, stream=True)
+        llm_resp = shared_client().generate(model, prompt + extracted_text, stream=True)
         num_chunk = 1
         extracted_text = ''  # will be filled with chunks from llm
         for chunk in llm_resp:
@@ -0,0 +1,123 @@
+import os
+import tempfile
+import unicodedata
+from typing import Dict, List, Optional, Union
+
+from text_extract_api.extract.extract_result import ExtractResult
+from text_extract_api.files.file_formats.file_format import FileFormat
+from text_extract_api.files.file_formats.pdf import PdfFileFormat
+
+
+class TextLayerExtractor:
+    """
+    Uses the embedded text of born-digital PDF pages and sends only the pages without
+    usable text through the OCR strategy.
+
+    Configured per strategy in `config/strategies.yaml`:
+
+        text_layer:
+           enabled: true
+           min_score: 0.7   # minimal page quality score (0..1) to trust the text layer
+           min_chars: 50    # pages with less text are always OCR'd
+
+    The result metadata lists the `pages` of the document with their `page_number` and
+    `source` - `text_layer` or `ocr` (along with what the strategy recorded about them).
+    """
+
+    def __init__(self, min_score: float = 0.7, min_chars: int = 50):
+        self.min_score = min_score
+        self.min_chars = min_chars
+
+    @classmethod
+    def from_config(cls, config: Union[bool, Dict, None]) -> Optional["TextLayerExtractor"]:
+        """ Returns None when the text layer stage is disabled """
+        if isinstance(config, bool) or config is None:
+            return cls() if config else None
+        if not config.get('enabled', True):
+            return None
+        return cls(
+            min_score=float(config.get('min_score', 0.7)),
+            min_chars=int(config.get('min_chars', 50)),
+        )
+
+    def extract_text(self, strategy, file_format: FileFormat, language: str = 'en') -> ExtractResult:
+        if not isinstance(file_format, PdfFileFormat):
+            return strategy.extract_text(file_format, language)
+
+        try:
+            page_texts = self.page_texts(file_format)
+        except Exception as e:
+            print(f"Text layer extraction failed, falling back to OCR: {e}")
+            return strategy.extract_text(file_format, language)
+
+        usable = [self.score(text) >= self.min_score for text in page_texts]
+        print(f"Text layer usable on {sum(usable)} of {len(page_texts)} pages")
+
+        if not any(usable):
+            result = strategy.extract_text(file_format, language)
+            result.metadata['pages'] = self._ocr_pages(result, 0, len(page_texts))
+            return result
+
+        texts = []
+        pages = []
+        page = 0
+        while page < len(page_texts):
+            if usable[page]:
+                texts.append(page_texts[page].strip())
+                pages.append({'page_number': page + 1, 'source': 'text_layer'})
+                page += 1
+                continue
+            # OCR each run of consecutive pages without usable text in one strategy call
+            run_end = page
+            while run_end < len(page_texts) and not usable[run_end]:
+                run_end += 1
+            result = strategy.extract_text(file_format.extract_pages(range(page, run_end)), language)
+            texts.append(result.text)
+            pages.extend(self._ocr_pages(result, page, run_end))
+            page = run_end
+
+        # Pages are joined the way the strategy joins the pages it OCRs
+        return ExtractResult.from_text(strategy.PAGE_SEPARATOR.join(text for text in texts if text),
+                                       metadata={'pages': pages})
+
+    @staticmethod
+    def _ocr_pages(result: ExtractResult, first_page: int, end_page: int) -> List[Dict]:
+        """ What the strategy recorded about the OCR'd pages, numbered as pages of the whole document """
+        ocr_pages = result.metadata.get('pages') or []
+        if len(ocr_pages) != end_page - first_page:
+            # Strategies without per page metadata, or sending the pages as one document
+            ocr_pages = [{}] * (end_page - first_page)
+        return [dict(metadata, page_number=first_page + i + 1, source='ocr') for i, metadata in enumerate(ocr_pages)]
+
+    @staticmethod
+    def page_texts(file_format: PdfFileFormat) -> List[str]:
+        from pdftext.extraction import paginated_plain_text_output
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_file.write(file_format.binary)
+            temp_filename = temp_file.name
+        try:
+            return paginated_plain_text_output(temp_filename, sort=True)
+        finally:
+            os.remove(temp_filename)
+
+    def score(self, text: str) -> float:
+        """
+        Rough quality of an embedded text layer: share of readable characters times share
+        of word-like tokens. Broken font encodings (cid glyphs, private use or replacement
+        characters, control codes) push it towards zero.
+        """
+        stripped = text.strip()
+        if len(stripped) < self.min_chars or "(cid:" in stripped:
+            return 0.0
+
+        chars = [c for c in stripped if not c.isspace()]
+        readable = sum(
+            1 for c in chars
+            if c != "\ufffd" and unicodedata.category(c)[0] in "LNPS" and unicodedata.category(c) != "Co"
+        )
+
+        words = stripped.split()
+        word_like = sum(1 for word in words if len(word) <= 30 and any(c.isalnum() for c in word))
+
+        return (readable / len(chars)) * (word_like / len(words))
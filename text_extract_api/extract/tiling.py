@@ -0,0 +1,117 @@
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+# (x0, y0, x1, y1) in page pixels
+Box = Tuple[int, int, int, int]
+
+
+class TiledOCR:
+    """
+    OCRs images larger than `max_side` (engineering drawings, panoramas, high DPI scans)
+    as overlapping tiles, instead of handing the whole array to the reader.
+    Peak memory of the reader is bounded by the tile size, and EasyOCR detects text on
+    the tile at full resolution (it shrinks larger inputs to its 2560 px canvas).
+
+    Tiles are read word by word; a word is kept by the tile whose core (the tile minus
+    half of each overlap with a neighbour) contains its center, so words in the overlap
+    are neither lost nor duplicated as long as `overlap` is wider than the longest word.
+    Words are then joined back into lines in reading order.
+
+    Tiles are read one after another: every call already runs torch on all the threads of
+    the worker (see InferenceProfile), and a reader is not safe to share between threads.
+
+    Configured per strategy in `config/strategies.yaml`:
+
+        tiling:
+           enabled: true
+           max_side: 4096    # images with a longer side are tiled
+           tile_size: 2560   # px, EasyOCR detection canvas size
+           overlap: 384      # px shared by neighbouring tiles
+    """
+
+    def __init__(self, max_side: int = 4096, tile_size: int = 2560, overlap: int = 384):
+        if overlap * 2 >= tile_size:
+            raise ValueError("Tiling overlap must be less than half of the tile size")
+        self.max_side = max(max_side, tile_size)
+        self.tile_size = tile_size
+        self.overlap = overlap
+
+    @classmethod
+    def from_config(cls, config: Union[bool, Dict, None]) -> Optional["TiledOCR"]:
+        """ Returns None when tiling is disabled """
+        if isinstance(config, bool) or config is None:
+            return cls() if config else None
+        if not config.get('enabled', True):
+            return None
+        return cls(
+            max_side=int(config.get('max_side', 4096)),
+            tile_size=int(config.get('tile_size', 2560)),
+            overlap=int(config.get('overlap', 384)),
+        )
+
+    def readtext(self, reader, image: np.ndarray) -> List[str]:
+        """ Drop-in for `reader.readtext(image, detail=0)` """
+        height, width = image.shape[:2]
+        if max(height, width) <= self.max_side:
+            return reader.readtext(image, detail=0)
+
+        tiles = self.tiles(width, height)
+        print(f"Tiling {width}x{height} image into {len(tiles)} tiles")
+
+        def read_tile(tile: Box) -> List[Tuple[Box, str]]:
+            x0, y0, x1, y1 = tile
+            # width_ths=0 - words are not merged into lines, lines crossing tiles are rebuilt below
+            detections = reader.readtext(image[y0:y1, x0:x1], detail=1, width_ths=0.0)
+            return [(self._offset_box(points, x0, y0), text) for points, text, _ in detections]
+
+        words = []
+        for tile, core in tiles:
+            words.extend((box, text) for box, text in read_tile(tile) if self._center_in(box, core))
+        return self.join_lines(words)
+
+    def tiles(self, width: int, height: int) -> List[Tuple[Box, Box]]:
+        """
+        (tile, core) pairs covering the image. Cores split every overlap in the middle,
+        so each pixel belongs to exactly one core.
+        """
+        return [
+            ((x0, y0, x1, y1), (cx0, cy0, cx1, cy1))
+            for y0, y1, cy0, cy1 in self._spans(height)
+            for x0, x1, cx0, cx1 in self._spans(width)
+        ]
+
+    @staticmethod
+    def join_lines(words: List[Tuple[Box, str]]) -> List[str]:
+        """ Groups words whose vertical centers are within half a word height into lines, left to right """
+        lines: List[List[Tuple[Box, str]]] = []
+        for box, text in sorted(words, key=lambda word: (word[0][1] + word[0][3]) / 2):
+            center = (box[1] + box[3]) / 2
+            if lines:
+                last = lines[-1][-1][0]
+                if abs(center - (last[1] + last[3]) / 2) <= (last[3] - last[1]) / 2:
+                    lines[-1].append((box, text))
+                    continue
+            lines.append([(box, text)])
+        return [" ".join(text for _, text in sorted(line, key=lambda word: word[0][0])) for line in lines]
+
+    def _spans(self, length: int) -> List[Tuple[int, int, int, int]]:
+        """ (start, end, core start, core end) of the tiles along one axis """
+        if length <= self.tile_size:
+            return [(0, length, 0, length)]
+        step = self.tile_size - self.overlap
+        starts = list(range(0, length - self.tile_size, step)) + [length - self.tile_size]
+        ends = [start + self.tile_size for start in starts]
+        bounds = [0] + [(ends[i] + starts[i + 1]) // 2 for i in range(len(starts) - 1)] + [length]
+        return [(start, end, bounds[i], bounds[i + 1]) for i, (start, end) in enumerate(zip(starts, ends))]
+
+    @staticmethod
+    def _offset_box(points, dx: int, dy: int) -> Box:
+        xs = [point[0] for point in points]
+        ys = [point[1] for point in points]
+        return int(min(xs)) + dx, int(min(ys)) + dy, int(max(xs)) + dx, int(max(ys)) + dy
+
+    @staticmethod
+    def _center_in(box: Box, area: Box) -> bool:
+        cx, cy = (box[0] + box[2]) / 2, (box[1] + box[3]) / 2
+        return area[0] <= cx < area[2] and area[1] <= cy < area[3]
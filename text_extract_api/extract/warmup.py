@@ -0,0 +1,104 @@
+"""
+Inference profiles and model warm-up at worker start. Every fresh worker process - after a deploy, and after each
+`worker_max_memory_per_child` recycle - preloads the models of its strategies and runs a
+tiny inference before taking tasks, instead of the first task paying for it.
+
+Strategies are warmed up when they have `warmup` in `config/strategies.yaml`:
+
+    easyocr:
+       warmup:
+          languages: [en, "en,de"]   # language sets to preload, default [en]
+
+The `inference` profiles (threads, inference mode, quantization - see InferenceProfile) of the
+configured strategies are applied first, before any model is loaded.
+
+WARMUP_STRATEGIES - comma separated strategies to warm up in this worker instead (e.g. the
+    ones routed to its queue), empty - none; only their inference profiles are applied then
+WORKER_READY_FILE - file written when warm-up is done, e.g. for a container readiness probe
+"""
+
+import json
+import os
+import time
+from typing import Dict, List, Optional
+
+from celery.signals import worker_init, worker_process_init
+
+from text_extract_api.extract.strategies.strategy import Strategy
+
+
+def warmup_strategy_names() -> List[str]:
+    names = os.getenv('WARMUP_STRATEGIES')
+    if names is not None:
+        return [name.strip().lower() for name in names.split(',') if name.strip()]
+
+    Strategy.load_strategies_from_config()
+    return [name for name, strategy in Strategy._strategies.items() if strategy.warmup_config() is not None]
+
+
+def apply_inference_profiles() -> None:
+    names = os.getenv('WARMUP_STRATEGIES')
+    if names is not None:
+        strategies = [Strategy.get_strategy(name.strip()) for name in names.split(',') if name.strip()]
+    else:
+        Strategy.load_strategies_from_config()
+        strategies = list(Strategy._strategies.values())
+
+    for strategy in strategies:
+        profile = strategy.inference_profile()
+        if profile:
+            profile.apply()
+
+
+def prepare_worker() -> None:
+    try:
+        apply_inference_profiles()
+    except Exception as e:
+        print(f"Applying inference profiles failed: {e}")
+    warm_up()
+
+
+def warm_up(names: Optional[List[str]] = None) -> Dict[str, float]:
+    """ Warms up the strategies; returns seconds spent per strategy, failures don't stop the worker """
+    timings = {}
+    failed = []
+    for name in warmup_strategy_names() if names is None else names:
+        start_time = time.time()
+        try:
+            Strategy.get_strategy(name).warmup()
+        except Exception as e:
+            print(f"Warm-up of strategy {name} failed: {e}")
+            failed.append(name)
+            continue
+        timings[name] = round(time.time() - start_time, 3)
+        print(f"Warmed up strategy {name} in {timings[name]}s")
+
+    report_ready(timings, failed)
+    return timings
+
+
+def report_ready(timings: Dict[str, float], failed: List[str]) -> None:
+    print(f"Worker process {os.getpid()} ready (warmed up: {', '.join(timings) or 'none'})")
+    ready_file = os.getenv('WORKER_READY_FILE')
+    if not ready_file:
+        return
+    try:
+        with open(ready_file, 'w') as f:
+            json.dump({'pid': os.getpid(), 'ready_at': time.time(), 'warmed_up': timings, 'failed': failed}, f)
+    except OSError as e:
+        print(f"Could not write the worker ready file {ready_file}: {e}")
+
+
+@worker_process_init.connect
+def warm_up_pool_process(**kwargs):
+    prepare_worker()
+
+
+@worker_init.connect
+def warm_up_worker(sender=None, **kwargs):
+    # Solo and thread pools run tasks in the worker process itself, where worker_process_init
+    # is never sent; prefork children warm up on their own (the models are not inherited)
+    pool = getattr(sender, 'pool_cls', None) or 'prefork'
+    pool_name = pool if isinstance(pool, str) else pool.__module__
+    if 'prefork' not in pool_name and 'processes' not in pool_name:
+        prepare_worker()
@@ -0,0 +1,65 @@
+import heapq
+from itertools import count
+from typing import Iterable, Iterator, List, Optional, Tuple, Type
+
+from text_extract_api.files.converters.converter import Converter
+from text_extract_api.files.file_formats.file_format import FileFormat
+
+# One hop of a conversion path - the format produced and the converter producing it
+Step = Tuple[Type[FileFormat], Type[Converter]]
+
+
+class ConversionGraph:
+    """
+    Conversions between file formats as a graph: formats are nodes, the converters
+    returned by `FileFormat.convertible_to()` are edges weighted by `Converter.COST`.
+    Finds the cheapest chain of converters from a file to any of the formats a consumer
+    (e.g. a strategy) accepts - no conversion at all when the file is accepted as is.
+    """
+
+    @staticmethod
+    def cheapest_path(source: Type[FileFormat], accepted: Iterable[Type[FileFormat]],
+                      split_pages: bool = True) -> Optional[List[Step]]:
+        """
+        Dijkstra over the formats reachable from `source`. Returns the steps to take
+        ([] - source already accepted) or None when no accepted format can be reached.
+        With `split_pages=False` a pageable document is never split into separate pages,
+        for consumers that need the whole document in a single file.
+        """
+        accepted = tuple(accepted)
+        tie_breaker = count()
+        queue = [(0.0, next(tie_breaker), source, [])]
+        visited = set()
+
+        while queue:
+            cost, _, file_format, path = heapq.heappop(queue)
+            if issubclass(file_format, accepted):
+                return path
+            if file_format in visited:
+                continue
+            visited.add(file_format)
+
+            for target, converter in file_format.convertible_to().items():
+                if target in visited:
+                    continue
+                if not split_pages and file_format.is_pageable() and not target.is_pageable():
+                    continue
+                heapq.heappush(queue, (cost + converter.COST, next(tie_breaker), target,
+                                       path + [(target, converter)]))
+        return None
+
+    @staticmethod
+    def convert(file_format: FileFormat, path: List[Step], **options) -> Iterator[FileFormat]:
+        """
+        Runs the converters of `path` lazily; every file produced by one step (e.g. each
+        rendered page) is passed through the remaining steps before the next one is made.
+        """
+        files = iter([file_format])
+        for _, converter in path:
+            files = ConversionGraph._convert_all(files, converter, options)
+        return files
+
+    @staticmethod
+    def _convert_all(files: Iterator[FileFormat], converter: Type[Converter], options) -> Iterator[FileFormat]:
+        for file in files:
+            yield from converter.convert(file, **options)
@@ -3,15 +3,18 @@ from typing import Iterator, List, Type
 from text_extract_api.files.file_formats.file_format import FileFormat
 
 class Converter:
+    # Relative cost estimate of the conversion, used to choose between conversion paths (see ConversionGraph)
+    COST: float = 1.0
+
     @staticmethod
-    def convert(file_format: Type["FileFormat"]) -> Iterator["FileFormat"]:
+    def convert(file_format: Type["FileFormat"], **options) -> Iterator["FileFormat"]:
         raise NotImplementedError("Subclasses must implement the `convert` method.")
 
     @classmethod
-    def convert_to_list(cls, file_format: Type["FileFormat"]) -> List["FileFormat"]:
-        return list(cls.convert(file_format))
+    def convert_to_list(cls, file_format: Type["FileFormat"], **options) -> List["FileFormat"]:
+        return list(cls.convert(file_format, **options))
 
     @classmethod
-    def convert_force_single(cls, file_format: Type["FileFormat"]) -> Type["FileFormat"]:
+    def convert_force_single(cls, file_format: Type["FileFormat"], **options) -> Type["FileFormat"]:
         """ Warning - this will return only first page """
-        return next(cls.convert(file_format), None)
+        return next(cls.convert(file_format, **options), None)
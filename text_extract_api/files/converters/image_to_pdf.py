@@ -1,15 +1,18 @@
 from io import BytesIO
-from typing import Iterator, Type
+from typing import Iterator, Type, Union
 from PIL import Image
-from files.converters.converter import Converter
-from files.file_formats.image import ImageFileFormat
-from files.file_formats.pdf import PdfFileFormat
+from text_extract_api.files.converters.converter import Converter
+from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.file_formats.multi_frame_image import MultiFrameImageFileFormat
+from text_extract_api.files.file_formats.pdf import PdfFileFormat
 
 
 class ImageToPdfConverter(Converter):
+    # Re-wraps the image data, no rendering
+    COST = 2.0
 
     @staticmethod
-    def convert(file_format: ImageFileFormat) -> Iterator[Type["PdfFileFormat"]]:
+    def convert(file_format: Union[ImageFileFormat, MultiFrameImageFileFormat], **options) -> Iterator[Type["PdfFileFormat"]]:
 
         image = Image.open(BytesIO(file_format.binary))
         pdf_bytes = ImageToPdfConverter._image_to_pdf_bytes(image)
@@ -23,5 +26,6 @@ class ImageToPdfConverter(Converter):
     def _image_to_pdf_bytes(image: Image) -> bytes:
 
         buffer = BytesIO()
-        image.save(buffer, format="PDF")
+        # Multi-frame TIFF/GIF - one PDF page per frame
+        image.save(buffer, format="PDF", save_all=getattr(image, "n_frames", 1) > 1)
         return buffer.getvalue()
\ No newline at end of file
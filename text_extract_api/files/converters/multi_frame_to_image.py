@@ -0,0 +1,51 @@
+from io import BytesIO
+from typing import Iterator, Optional, Type
+
+import numpy as np
+from PIL import Image, ImageSequence
+
+from text_extract_api.files.converters.converter import Converter
+from text_extract_api.files.converters.render_profile import RenderProfile
+from text_extract_api.files.file_formats.image import ImageProcessor
+from text_extract_api.files.file_formats.multi_frame_image import MultiFrameImageFileFormat
+from text_extract_api.files.file_formats.raster_image import RasterImageFileFormat
+
+
+class MultiFrameToImageConverter(Converter):
+    # Decoding only - frames are already raster images
+    COST = 3.0
+
+    @staticmethod
+    def convert(file_format: MultiFrameImageFileFormat, render_profile: Optional[RenderProfile] = None,
+                **options) -> Iterator[Type["RasterImageFileFormat"]]:
+        """
+        Yields every frame of a TIFF/GIF as a separate page. Frames are decoded one at a
+        time as the consumer asks for the next page, so a long fax is never held in memory
+        as a whole. Of the render profile only `grayscale` and the maximum size apply -
+        frames are otherwise kept at full size, large drawings are tiled by the OCR strategies.
+        """
+        render_profile = render_profile or RenderProfile()
+
+        with Image.open(BytesIO(file_format.binary)) as image:
+            for index, frame in enumerate(ImageSequence.Iterator(image), start=1):
+                page = MultiFrameToImageConverter._prepare_frame(frame, render_profile)
+                yield RasterImageFileFormat(np.asarray(page), f"{file_format.filename}_page_{index}.png")
+
+    @staticmethod
+    def _prepare_frame(frame: Image.Image, render_profile: RenderProfile) -> Image.Image:
+        # Grayscale frames stay grayscale, 16 bit ones scaled down to 8 bit
+        page = ImageProcessor.to_8bit(frame)
+        if render_profile.grayscale and page.mode != "L":
+            page = page.convert("L")
+        elif page is frame:
+            # The sequence reuses one image for every frame - resized below in place
+            page = frame.copy()
+
+        # Fax "normal" resolution is 204x98 dpi - stretch to square pixels or text looks squashed
+        x_dpi, y_dpi = (float(dpi) for dpi in frame.info.get("dpi", (0, 0)))
+        if x_dpi and y_dpi and abs(x_dpi - y_dpi) > 1:
+            page = page.resize((page.width, round(page.height * x_dpi / y_dpi)), Image.Resampling.BILINEAR)
+
+        if render_profile.max_size:
+            page.thumbnail(render_profile.max_size)
+        return page
@@ -1,29 +1,244 @@
 from __future__ import annotations
-from typing import Iterator, Type
-from pdf2image import convert_from_bytes
+import multiprocessing
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Iterator, List, Optional, Type, Union
+
+import numpy as np
+from pdf2image import convert_from_path, pdfinfo_from_path
+from PIL import Image
 
 from text_extract_api.files.converters.converter import Converter
+from text_extract_api.files.converters.render_cache import RenderCache
+from text_extract_api.files.converters.render_profile import RenderFormat, RenderProfile
 from text_extract_api.files.file_formats.image import ImageFileFormat
 from text_extract_api.files.file_formats.pdf import PdfFileFormat
+from text_extract_api.files.file_formats.raster_image import RasterImageFileFormat
+from text_extract_api.files.shared_pages import PageBufferPool, SharedPage
+from text_extract_api.resources import available_cpu_count
 
 class PdfToJpegConverter(Converter):
+    # Rasterizing every page is by far the most expensive conversion
+    COST = 10.0
+    _executor: Optional[ProcessPoolExecutor] = None
+
+    @staticmethod
+    def convert(file_format: PdfFileFormat, render_profile: Optional[RenderProfile] = None,
+                page_buffers: Optional[PageBufferPool] = None, **options) -> Iterator[Type["ImageFileFormat"]]:
+        """
+        Renders the PDF in windows of PDF_RENDER_WINDOW_SIZE pages, so at most a window
+        of rasterized pages is in flight at a time instead of the whole document.
+        With PDF_RENDER_PROCESSES > 1 the window is split into one page range per render
+        process, rendered ahead in a process pool and yielded in page order. Pages found
+        in the render cache (see RenderCache) are not rendered again.
+        Despite the name, the output encoding follows `render_profile` (JPEG by default);
+        the RAW format yields RasterImageFileFormat pages without any encoding. Given
+        `page_buffers`, RAW pages rendered in the process pool are passed back in shared
+        memory instead of being pickled (unless /dev/shm is full). A page's segment is
+        released once the consumer asks for the next page - its memory is freed as soon
+        as the consumer drops the page.
+        """
+        render_profile = render_profile or RenderProfile()
+        window_size = max(1, int(os.getenv('PDF_RENDER_WINDOW_SIZE', '10')))
+        thread_count = max(1, int(os.getenv('PDF_RENDER_THREADS', '4')))
+        render_cache = RenderCache.shared()
+        if render_cache and render_profile.format == RenderFormat.RAW and not render_cache.cache_raw:
+            render_cache = None
+        file_hash = file_format.hash if render_cache else None
+
+        with tempfile.TemporaryDirectory(prefix="pdf_to_jpeg_") as work_dir:
+            # Written once - pdf2image would otherwise copy the bytes to a new temp file on every call
+            pdf_path = os.path.join(work_dir, "document.pdf")
+            with open(pdf_path, "wb") as pdf_file:
+                pdf_file.write(file_format.binary)
+
+            page_count = pdfinfo_from_path(pdf_path).get("Pages", 0)
+            if not page_count:
+                raise ValueError("No pages found in the PDF.")
+
+            processes = min(PdfToJpegConverter._render_processes(), page_count, window_size)
+            if processes > 1:
+                # The window is shared by the processes - pages in flight stay within it however many
+                # CPUs there are. Short documents still get spread over all processes.
+                window_size = min(window_size // processes, -(-page_count // processes))
+                processes = min(processes, -(-page_count // window_size))
+            window_starts = iter(range(1, page_count + 1, window_size))
+            executor = PdfToJpegConverter._get_executor() if processes > 1 else None
+            lookahead = processes if executor else 1
+            shared = bool(executor and page_buffers is not None and render_profile.format == RenderFormat.RAW)
+            pending = deque()
+
+            try:
+                while True:
+                    while len(pending) < lookahead:
+                        first_page = next(window_starts, None)
+                        if first_page is None:
+                            break
+                        last_page = min(first_page + window_size - 1, page_count)
+                        pages = {
+                            i: render_cache.get(file_hash, i, render_profile) if render_cache else None
+                            for i in range(first_page, last_page + 1)
+                        }
+                        missing = [i for i, binary in pages.items() if binary is None]
+                        job = None
+                        if missing and executor:
+                            try:
+                                job = executor.submit(render_pages_shared if shared else render_pages, pdf_path,
+                                                      missing[0], missing[-1], render_profile, work_dir, 1)
+                            except BrokenProcessPool:
+                                # Broke on an earlier window - the rest of the document is rendered here
+                                PdfToJpegConverter._reset_executor(executor)
+                                executor = None
+                        pending.append((pages, missing, job))
+
+                    if not pending:
+                        break
+
+                    pages, missing, job = pending.popleft()
+                    handles = {}
+                    if missing:
+                        rendered = None
+                        if job:
+                            try:
+                                rendered = job.result()
+                            except BrokenProcessPool as e:
+                                # A render process died (e.g. killed for memory) - the next document gets a new pool
+                                print(f"PDF render pool broke, rendering pages {missing[0]}-{missing[-1]} here: {e}")
+                                PdfToJpegConverter._reset_executor(executor)
+                                executor = None
+                        if rendered is None:
+                            rendered = render_pages(pdf_path, missing[0], missing[-1], render_profile, work_dir,
+                                                    thread_count)
+                        for i, page in zip(range(missing[0], missing[-1] + 1), rendered):
+                            if isinstance(page, SharedPage):
+                                handles[i] = page_buffers.adopt(page)
+                                page = page_buffers.view(page)
+                            if pages[i] is None:
+                                pages[i] = page
+                                if render_cache:
+                                    render_cache.put(file_hash, i, render_profile,
+                                                     PdfToJpegConverter._page_to_bytes(page, render_profile))
+
+                    for i, page in pages.items():
+                        filename = f"{file_format.filename}_page_{i}.{render_profile.extension}"
+                        if render_profile.format == RenderFormat.RAW:
+                            if isinstance(page, bytes):
+                                with Image.open(BytesIO(page)) as cached_page:
+                                    page = np.asarray(cached_page)
+                            yield RasterImageFileFormat(page, filename)
+                            if i in handles:
+                                # The consumer moved on - the view keeps the pixels mapped while it holds the page
+                                page_buffers.release(handles.pop(i))
+                        else:
+                            yield ImageFileFormat.from_binary(
+                                binary=page,
+                                filename=filename,
+                                mime_type=render_profile.mime_type
+                            )
+            finally:
+                # Consumer stopped early or rendering failed - let running jobs finish before work_dir is removed
+                jobs = [job for _, _, job in pending if job and not job.cancel()]
+                wait(jobs)
+                if shared:
+                    # Pages nobody will read - owned by the pool, so they are unlinked with it
+                    for job in jobs:
+                        if not job.exception():
+                            for page in job.result():
+                                if isinstance(page, SharedPage):
+                                    page_buffers.adopt(page)
 
     @staticmethod
-    def convert(file_format: PdfFileFormat) -> Iterator[Type["ImageFileFormat"]]:
-        pages = convert_from_bytes(file_format.binary)
-        if not pages:
-            raise ValueError("No pages found in the PDF.")
-        for i, page in enumerate(pages, start=1):
-            yield ImageFileFormat.from_binary(
-                binary=PdfToJpegConverter._image_to_bytes(page),
-                filename=f"{file_format.filename}_page_{i}.jpg",
-                mime_type="image/jpeg"
-            )
+    def _render_processes() -> int:
+        """ PDF_RENDER_PROCESSES - number or `auto` (default) for the CPUs available to the worker """
+        processes = os.getenv('PDF_RENDER_PROCESSES', 'auto')
+        if processes == 'auto':
+            return available_cpu_count()
+        return max(1, int(processes))
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        # Kept for the lifetime of the worker - spawning interpreters per document would cost more than it saves
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor(max_workers=cls._render_processes(),
+                                                mp_context=multiprocessing.get_context("spawn"))
+        return cls._executor
+
+    @classmethod
+    def _reset_executor(cls, executor: Optional[ProcessPoolExecutor]) -> None:
+        """ Drops the broken `executor` - unless it was replaced already """
+        if executor is None or executor is not cls._executor:
+            return
+        cls._executor = None
+        executor.shutdown(wait=False)
 
     @staticmethod
-    def _image_to_bytes(image) -> bytes:
-        from io import BytesIO
+    def _image_to_bytes(image, render_profile: Optional[RenderProfile] = None) -> bytes:
+        render_profile = render_profile or RenderProfile()
+        if render_profile.max_size:
+            image.thumbnail(render_profile.max_size)
 
         buffer = BytesIO()
-        image.save(buffer, format="JPEG")
+        image.save(buffer, **render_profile.save_options())
         return buffer.getvalue()
+
+    @staticmethod
+    def _prepare_page(image, render_profile: RenderProfile) -> Union[bytes, np.ndarray]:
+        """ Encoded page, or decoded pixels for the RAW render format """
+        if render_profile.format != RenderFormat.RAW:
+            return PdfToJpegConverter._image_to_bytes(image, render_profile)
+
+        if render_profile.max_size:
+            image.thumbnail(render_profile.max_size)
+        return np.asarray(image)
+
+    @staticmethod
+    def _page_to_bytes(page: Union[bytes, np.ndarray], render_profile: RenderProfile) -> bytes:
+        if isinstance(page, bytes):
+            return page
+        return PdfToJpegConverter._image_to_bytes(Image.fromarray(page), render_profile)
+
+
+def render_pages(pdf_path: str, first_page: int, last_page: int, render_profile: RenderProfile,
+                 output_folder: str, thread_count: int = 1) -> List[Union[bytes, np.ndarray]]:
+    """
+    Renders and encodes a page range (RAW pages are returned as arrays).
+    Module level, so it can run in the render process pool.
+    """
+    page_paths = convert_from_path(
+        pdf_path,
+        dpi=render_profile.dpi,
+        grayscale=render_profile.grayscale,
+        first_page=first_page,
+        last_page=last_page,
+        output_folder=output_folder,
+        paths_only=True,
+        thread_count=min(thread_count, last_page - first_page + 1)
+    )
+    pages = []
+    for page_path in page_paths:
+        with Image.open(page_path) as page:
+            pages.append(PdfToJpegConverter._prepare_page(page, render_profile))
+        os.remove(page_path)
+    return pages
+
+
+def render_pages_shared(pdf_path: str, first_page: int, last_page: int, render_profile: RenderProfile,
+                        output_folder: str, thread_count: int = 1) -> List[Union[SharedPage, np.ndarray]]:
+    """
+    render_pages for RAW profiles, returning the pages in shared memory - only the handles are pickled.
+    Pages not fitting into the free shared memory are returned as arrays, pickled as before.
+    """
+    pages = render_pages(pdf_path, first_page, last_page, render_profile, output_folder, thread_count)
+    return [_share(page) for page in pages]
+
+
+def _share(page: np.ndarray) -> Union[SharedPage, np.ndarray]:
+    try:
+        return SharedPage.write(page)
+    except OSError as e:
+        print(f"Passing the rendered page without shared memory: {e}")
+        return page
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import threading
+import time
+from hashlib import sha1
+from typing import Dict, Optional, Tuple
+
+from text_extract_api.files.converters.render_profile import RenderProfile
+
+
+class RenderCache:
+    """
+    Disk cache of rendered PDF pages keyed by (file hash, page number, render profile).
+
+    Entries are plain files. The modification time is the time of the write and bounds the
+    retention: rendered pages hold the content of the uploaded documents, so entries older
+    than the TTL are never served and are removed. The access time is bumped on every hit,
+    so evicting the least recently accessed files first gives LRU order. The directory may
+    be shared by several workers - the size accounting is per process and therefore approximate.
+
+    RAW renders are not cached by default: they would have to be PNG encoded in the task
+    process, on the way to OCR - re-rendering a page costs about the same as decoding it.
+    """
+    _shared: Dict[Tuple, "RenderCache"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str, max_bytes: int, cache_raw: bool = False, ttl: float = 0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.cache_raw = cache_raw
+        self.ttl = ttl
+        self._size: Optional[int] = None
+        self._next_purge = 0.0
+        os.makedirs(self.path, exist_ok=True)
+
+    @classmethod
+    def shared(cls) -> Optional["RenderCache"]:
+        """ Cache of this process - created once, so the size accounting holds across documents """
+        cache = cls.from_env()
+        if cache is None:
+            return None
+        key = (cache.path, cache.max_bytes, cache.cache_raw, cache.ttl)
+        with cls._shared_lock:
+            return cls._shared.setdefault(key, cache)
+
+    @classmethod
+    def from_env(cls) -> Optional["RenderCache"]:
+        """
+        RENDER_CACHE_PATH - cache directory, the cache is disabled unless it is set
+        RENDER_CACHE_MAX_MB - size limit (default 1024)
+        RENDER_CACHE_TTL_HOURS - pages are kept at most this long after rendering (default 24, 0 - no limit)
+        RENDER_CACHE_RAW - cache pages of RAW render profiles too, PNG encoded (default false)
+        """
+        path = os.getenv('RENDER_CACHE_PATH', '')
+        if not path:
+            return None
+        return cls(path, int(float(os.getenv('RENDER_CACHE_MAX_MB', '1024')) * 1024 * 1024),
+                   cache_raw=os.getenv('RENDER_CACHE_RAW', '').lower() in ('true', '1', 'yes'),
+                   ttl=float(os.getenv('RENDER_CACHE_TTL_HOURS', '24')) * 3600)
+
+    def get(self, file_hash: str, page: int, render_profile: RenderProfile) -> Optional[bytes]:
+        entry_path = self._entry_path(file_hash, page, render_profile)
+        try:
+            with open(entry_path, 'rb') as entry:
+                written = os.fstat(entry.fileno()).st_mtime
+                if self._expired(written, time.time()):
+                    os.remove(entry_path)
+                    return None
+                binary = entry.read()
+            # Keeps the write time, the TTL counts from it
+            os.utime(entry_path, (time.time(), written))
+            return binary
+        except OSError:
+            return None
+
+    def put(self, file_hash: str, page: int, render_profile: RenderProfile, binary: bytes):
+        entry_path = self._entry_path(file_hash, page, render_profile)
+        try:
+            # Write and rename, so concurrent readers never see a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as entry:
+                entry.write(binary)
+            os.replace(temp_path, entry_path)
+        except OSError as e:
+            print(f"Render cache write failed: {e}")
+            return
+
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += len(binary)
+
+        # Expired entries of documents nobody asks for again are removed here too
+        if self._size > self.max_bytes or (self.ttl and time.time() >= self._next_purge):
+            self._evict()
+
+    def _evict(self):
+        """
+        Removes expired entries, then least recently used ones until the cache is at 90% of its limit
+        """
+        now = time.time()
+        self._next_purge = now + self.ttl / 10
+        entries = []
+        for entry in os.scandir(self.path):
+            if entry.is_file() and entry.name.endswith('.page'):
+                stat = entry.stat()
+                entries.append((not self._expired(stat.st_mtime, now), stat.st_atime, stat.st_size, entry.path))
+        entries.sort()
+
+        size = sum(entry_size for _, _, entry_size, _ in entries)
+        target = self.max_bytes * 0.9
+        for fresh, _, entry_size, entry_path in entries:
+            if fresh and size <= target:
+                break
+            try:
+                os.remove(entry_path)
+                size -= entry_size
+            except OSError:
+                continue
+        self._size = size
+
+    def _expired(self, written: float, now: float) -> bool:
+        return bool(self.ttl) and now - written > self.ttl
+
+    def _scan_size(self) -> int:
+        return sum(
+            entry.stat().st_size for entry in os.scandir(self.path)
+            if entry.is_file() and entry.name.endswith('.page')
+        )
+
+    def _entry_path(self, file_hash: str, page: int, render_profile: RenderProfile) -> str:
+        key = sha1(f"{file_hash}:{page}:{render_profile!r}".encode('utf-8')).hexdigest()
+        return os.path.join(self.path, f"{key}.page")
@@ -0,0 +1,64 @@
+import sys
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional
+
+
+class RenderFormat(Enum):
+    JPEG = "JPEG"
+    PNG = "PNG"
+    # Decoded pixels handed over as RasterImageFileFormat, PNG encoded only on demand
+    RAW = "RAW"
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """
+    Describes how PDF pages are rasterized for a strategy.
+
+    Attributes:
+        dpi (int): Rendering resolution.
+        grayscale (bool): Render single channel (L) pages instead of RGB.
+        format (RenderFormat): Encoding of the rendered pages; RAW keeps decoded pixels.
+        quality (int): JPEG quality (ignored for other formats).
+        max_width (Optional[int]): Pages wider than this are downscaled (aspect ratio kept).
+        max_height (Optional[int]): Pages higher than this are downscaled (aspect ratio kept).
+    """
+    dpi: int = 200
+    grayscale: bool = False
+    format: RenderFormat = RenderFormat.JPEG
+    quality: int = 75
+    max_width: Optional[int] = None
+    max_height: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, config: Dict) -> "RenderProfile":
+        unknown = set(config) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown render profile options: {', '.join(sorted(unknown))}")
+
+        options = dict(config)
+        if 'format' in options:
+            options['format'] = RenderFormat(str(options['format']).upper())
+        return cls(**options)
+
+    @property
+    def mime_type(self) -> str:
+        return "image/jpeg" if self.format == RenderFormat.JPEG else "image/png"
+
+    @property
+    def extension(self) -> str:
+        return "jpg" if self.format == RenderFormat.JPEG else "png"
+
+    @property
+    def max_size(self) -> Optional[tuple]:
+        if self.max_width is None and self.max_height is None:
+            return None
+        return self.max_width or sys.maxsize, self.max_height or sys.maxsize
+
+    def save_options(self) -> Dict:
+        """ Keyword arguments for PIL `Image.save`; RAW pages are stored (e.g. cached) as PNG """
+        if self.format == RenderFormat.JPEG:
+            return {"format": "JPEG", "quality": self.quality}
+        # Fastest zlib level - pages are short-lived, size matters less than encode time
+        return {"format": "PNG", "compress_level": 1}
@@ -7,3 +7,6 @@ from .file_format import FileFormat
 from .docling import DoclingFileFormat
 from .pdf import PdfFileFormat
 from .image import ImageFileFormat
+from .multi_frame_image import MultiFrameImageFileFormat
+from .raster_image import RasterImageFileFormat
+from .text import TextFileFormat
@@ -1,4 +1,4 @@
-from typing import Type, Dict, Callable, Iterator
+from typing import Type, Dict
 from text_extract_api.files.file_formats.file_format import FileFormat
 
 
@@ -11,9 +11,6 @@ class DoclingFileFormat(FileFormat):
         return [
             "application/vnd.docling",  # Docling documents
             # Do not put all formats handled by docling here - only those that are not supported by dedicated file formats"
-            "text/plain",
-            "text/markdown",
-            "text/html",
             "application/msword",
             "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
             "application/vnd.oasis.opendocument.text",
@@ -21,8 +18,6 @@ class DoclingFileFormat(FileFormat):
             "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             "application/vnd.ms-powerpoint",
             "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-            "text/csv",
-            "application/json",
             "application/xml",
         ]
 
@@ -35,7 +30,7 @@ class DoclingFileFormat(FileFormat):
         return cls
 
     @staticmethod
-    def convertible_to() -> Dict[Type["FileFormat"], Callable[[], Iterator["FileFormat"]]]:
+    def convertible_to() -> Dict[Type["FileFormat"], Type["Converter"]]:
         # No specific converters needed as the strategy will handle conversion
         return {}
 
@@ -1,6 +1,6 @@
 import base64
 from hashlib import md5
-from typing import Type, Iterator, Optional, Dict, Callable, List, TypedDict
+from typing import Type, Iterator, Optional, Dict, List, TypedDict
 
 import magic
 
@@ -155,25 +155,40 @@ class FileFormat:
         raise NotImplementedError("Subclasses must implement is_pageable.")
 
     def can_convert_to(self, target_format: "FileFormat") -> bool:
-        convertible_keys = self.convertible_to().keys()
-        return any(target_format is key for key in convertible_keys)
+        from text_extract_api.files.converters.conversion_graph import ConversionGraph
+        return ConversionGraph.cheapest_path(type(self), [target_format]) is not None
 
-    def convert_to(self, target_format: Type["FileFormat"]) -> List["FileFormat"]:
-        if isinstance(self, target_format):
-            return [self]
+    def convert_to(self, target_format: Type["FileFormat"], **options) -> List["FileFormat"]:
+        """
+        Converts the file to `target_format`, possibly in several steps - the cheapest
+        chain of converters is used (see ConversionGraph).
+
+        Args:
+            target_format (Type[FileFormat]): The desired file format.
+            **options: Passed to the converter, e.g. `render_profile` for PDF rasterization.
+                Converters ignore options they do not understand.
+        """
+        return list(self.convert_iter(target_format, **options))
+
+    def convert_iter(self, target_format: Type["FileFormat"], **options) -> Iterator["FileFormat"]:
+        """
+        Lazy `convert_to` - pages of pageable formats are produced one by one as they are
+        consumed, so the caller decides how many of them are held in memory.
+        """
+        from text_extract_api.files.converters.conversion_graph import ConversionGraph
 
-        converters = self.convertible_to()
-        if target_format not in converters:
+        path = ConversionGraph.cheapest_path(type(self), [target_format])
+        if path is None:
             raise ValueError(f"Cannot convert to {target_format}. Conversion not supported.")
 
-        return list(converters[target_format](self))
+        return ConversionGraph.convert(self, path, **options)
 
     @staticmethod
-    def convertible_to() -> Dict[Type["FileFormat"], Callable[[Type["FileFormat"]], Iterator[Type["Converter"]]]]:
+    def convertible_to() -> Dict[Type["FileFormat"], Type["Converter"]]:
         """
-        Defines what formats this file type can be converted to.
-        Returns a dictionary where keys are target formats and values are functions
-        that produce FileFormat instances.
+        Defines what formats this file type can be converted to directly.
+        Returns a dictionary where keys are target formats and values are the Converter
+        classes producing them. Multi-step conversions are derived from these (see ConversionGraph).
 
         :return: A dictionary of convertible formats and their converters.
         """
@@ -198,7 +213,9 @@ class FileFormat:
     def _get_file_format_class(mime_type: str) -> Type["FileFormat"]:
         import text_extract_api.files.file_formats.pdf  # noqa - its not unused import @todo autodiscover
         import text_extract_api.files.file_formats.image  # noqa - its not unused import @todo autodiscover
+        import text_extract_api.files.file_formats.multi_frame_image  # noqa - its not unused import @todo autodiscover
         import text_extract_api.files.file_formats.docling  # noqa - its not unused import @todo autodiscover
+        import text_extract_api.files.file_formats.text  # noqa - its not unused import @todo autodiscover
         for subclass in FileFormat.__subclasses__():
             if mime_type in subclass.accepted_mime_types():
                 return subclass
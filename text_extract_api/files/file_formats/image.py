@@ -1,10 +1,15 @@
+import os
+from dataclasses import dataclass
 from enum import Enum
-from typing import Callable, Dict, Iterator, Type
+from typing import Dict, Optional, Type
 from io import BytesIO
-from PIL import Image
+import numpy as np
+from PIL import Image, ImageOps
 
 from text_extract_api.files.file_formats.file_format import FileFormat
 
+EXIF_ORIENTATION_TAG = 0x0112
+
 class ImageSupportedExportFormats(Enum):
     JPEG = "JPEG"
     PNG = "PNG"
@@ -16,15 +21,16 @@ class ImageFileFormat(FileFormat):
 
     @staticmethod
     def accepted_mime_types() -> list[str]:
-        return ["image/jpeg", "image/png", "image/bmp", "image/gif", "image/tiff"]
+        # TIFF and GIF may hold several frames - see MultiFrameImageFileFormat
+        return ["image/jpeg", "image/png", "image/bmp"]
     
     @staticmethod
-    def convertible_to() -> Dict[Type["FileFormat"], Callable[[], Iterator["FileFormat"]]]:
+    def convertible_to() -> Dict[Type["FileFormat"], Type["Converter"]]:
         from text_extract_api.files.file_formats.pdf import PdfFileFormat
         from text_extract_api.files.converters.image_to_pdf import ImageToPdfConverter
 
         return {
-            PdfFileFormat: ImageToPdfConverter.convert
+            PdfFileFormat: ImageToPdfConverter
         }    
 
     @staticmethod
@@ -35,9 +41,32 @@ class ImageFileFormat(FileFormat):
     def default_iterator_file_format(cls) -> Type["ImageFileFormat"]:
         return cls
 
+    def to_numpy(self, max_side: Optional[int] = None) -> np.ndarray:
+        """
+        Decoded pixels, as expected by EasyOCR: upright (EXIF orientation applied), 8 bit
+        grayscale or RGB - lossless uploads reach OCR without JPEG artifacts.
+        Images with a side longer than `max_side` (default: OCR_IMAGE_MAX_SIDE env or 4000,
+        0 - no limit) are downscaled while decoding - a JPEG photo is decoded directly at
+        1/2, 1/4 or 1/8 scale instead of at its full 48 MP.
+        """
+        if max_side is None:
+            max_side = int(os.getenv('OCR_IMAGE_MAX_SIDE', '4000'))
+
+        with Image.open(BytesIO(self.binary)) as image:
+            if max_side and max(image.size) > max_side:
+                scale = max_side / max(image.size)
+                target_size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+                # JPEG is decoded at the smallest of 1/2, 1/4 or 1/8 scale not below target_size -
+                # thumbnail alone drafts at twice the target, too late for a 48 MP photo
+                image.draft(image.mode, target_size)
+                image.thumbnail(target_size)
+            return np.array(ImageProcessor.to_8bit(ImageOps.exif_transpose(image)))
+
     def unify(self) -> "FileFormat":
         unified_image = ImageProcessor.unify_image(self.binary, ImageSupportedExportFormats.JPEG)
-        return ImageFileFormat.from_binary(unified_image, self.filename, self.mime_type)
+        if unified_image is self.binary:
+            return self
+        return ImageFileFormat.from_binary(unified_image, self.filename, "image/jpeg")
 
     @staticmethod
     def validate(binary_file_content: bytes):
@@ -49,23 +78,107 @@ class ImageFileFormat(FileFormat):
 
 class ImageProcessor:
     @staticmethod
-    def unify_image(image_bytes: bytes, target_format: ImageSupportedExportFormats = "JPEG",
-                    convert_to_rgb: bool = True) -> bytes:
+    def to_8bit(image: Image.Image) -> Image.Image:
+        """
+        L or RGB version of the image. 16 and 32 bit grayscale (e.g. scanner TIFFs) is scaled
+        down to 8 bit - `convert("L")` would clip it, leaving a 16 bit scan almost white.
+        The scale follows the bits actually used: 10, 12 or 14 bit sensor data stored in 16 bit
+        samples (brightest pixel 4095 for 12 bit) would otherwise end up almost black.
+        """
+        if image.mode in ("L", "RGB"):
+            return image
+        if image.mode.startswith("I"):
+            pixels = np.clip(np.asarray(image), 0, 65535).astype(np.uint16)
+            bits = max(8, int(pixels.max(initial=0)).bit_length())
+            return Image.fromarray((pixels >> (bits - 8)).astype(np.uint8))
+        if image.mode in ("1", "LA", "F"):
+            return image.convert("L")
+        # Palette (P), RGBA, CMYK...
+        return image.convert("RGB")
+
+    @staticmethod
+    def unify_image(image_bytes: bytes,
+                    target_format: ImageSupportedExportFormats = ImageSupportedExportFormats.JPEG,
+                    convert_to_rgb: bool = True, max_side: Optional[int] = None, quality: int = 90) -> bytes:
         """
         Prepares an image for OCR by unifying its format and color mode.
         - Converts image to the desired format (e.g., JPEG).
         - Converts grayscale, CMYK, etc., to RGB (if required).
+        - Applies the EXIF orientation and downscales images larger than `max_side`.
+        Images already in the target format and mode, within the size limit, are returned
+        untouched (the very same bytes object) - differences in metadata only are ignored.
         :param image_bytes: Input image in bytes.
         :param target_format: Desired format for the output image (default: JPEG)
         :param convert_to_rgb: Convert to RGB format if not already (default: True).
+        :param max_side: Longest allowed side in pixels (default: IMAGE_MAX_SIDE env or 3000, 0 - no limit).
+        :param quality: JPEG quality of re-encoded images (default: 90).
         :return:Image bytes in the new format.
         """
+        if max_side is None:
+            max_side = int(os.getenv('IMAGE_MAX_SIDE', '3000'))
+
+        # Only the header is read here - pixels are decoded on first access
         image = Image.open(BytesIO(image_bytes))
 
+        needs_rgb = convert_to_rgb and image.mode != "RGB"
+        needs_resize = bool(max_side) and max(image.size) > max_side
+        orientation = image.getexif().get(EXIF_ORIENTATION_TAG, 1)
+
+        if image.format == target_format.value and not needs_rgb and not needs_resize and orientation == 1:
+            return image_bytes
+
+        if needs_resize:
+            scale = max_side / max(image.size)
+            target_size = (max(1, int(image.width * scale)), max(1, int(image.height * scale)))
+            # JPEG can be decoded directly at 1/2, 1/4 or 1/8 scale - never below target_size
+            image.draft("RGB" if convert_to_rgb else image.mode, target_size)
+            image.thumbnail(target_size)
+
+        if orientation != 1:
+            image = ImageOps.exif_transpose(image)
+
         # We need RGB - problem occurred when P (png) was sent
         if convert_to_rgb and image.mode != "RGB":
-            image = image.convert("RGB")
+            image = ImageProcessor.to_8bit(image).convert("RGB")
 
         buffered = BytesIO()
-        image.save(buffered, format=target_format.value)
+        if target_format == ImageSupportedExportFormats.JPEG:
+            image.save(buffered, format=target_format.value, quality=quality)
+        else:
+            image.save(buffered, format=target_format.value)
         return buffered.getvalue()
+
+
+@dataclass(frozen=True)
+class ImageTarget:
+    """
+    Size and encoding a consumer wants images in - e.g. vision models resizing their input to
+    fixed tiles gain nothing from larger images, they only cost transfer and decoding time.
+
+    Attributes:
+        max_side (int): Images with a longer side are downscaled (aspect ratio kept), 0 - no limit.
+        format (ImageSupportedExportFormats): Encoding of the images sent.
+        quality (int): JPEG quality (ignored for other formats).
+    """
+    max_side: int = 0
+    format: ImageSupportedExportFormats = ImageSupportedExportFormats.JPEG
+    quality: int = 85
+
+    @classmethod
+    def from_dict(cls, config: Dict) -> "ImageTarget":
+        unknown = set(config) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown image target options: {', '.join(sorted(unknown))}")
+
+        options = dict(config)
+        if 'format' in options:
+            options['format'] = ImageSupportedExportFormats(str(options['format']).upper())
+        return cls(**options)
+
+    def apply(self, image: ImageFileFormat) -> ImageFileFormat:
+        """ The image fitted to the target; images already fitting are returned as they are """
+        binary = ImageProcessor.unify_image(image.binary, self.format, max_side=self.max_side, quality=self.quality)
+        if binary is image.binary:
+            return image
+        return ImageFileFormat(binary_file_content=binary, filename=image.filename,
+                               mime_type=f"image/{self.format.value.lower()}")
@@ -0,0 +1,54 @@
+from io import BytesIO
+from typing import Dict, Type
+
+from PIL import Image
+
+from text_extract_api.files.file_formats.file_format import FileFormat
+
+
+class MultiFrameImageFileFormat(FileFormat):
+    """
+    TIFF and GIF images - possibly multi-page (fax TIFFs) or animated. Pageable like a PDF:
+    every frame becomes a separate page image, decoded one at a time while the pages
+    are consumed.
+    """
+    DEFAULT_FILENAME: str = "image.tiff"
+    DEFAULT_MIME_TYPE: str = "image/tiff"
+
+    @staticmethod
+    def accepted_mime_types() -> list[str]:
+        return ["image/tiff", "image/gif"]
+
+    @staticmethod
+    def is_pageable() -> bool:
+        return True
+
+    @classmethod
+    def default_iterator_file_format(cls) -> Type[FileFormat]:
+        from text_extract_api.files.file_formats.image import ImageFileFormat
+        return ImageFileFormat
+
+    @staticmethod
+    def convertible_to() -> Dict[Type["FileFormat"], Type["Converter"]]:
+        from text_extract_api.files.file_formats.image import ImageFileFormat
+        from text_extract_api.files.file_formats.pdf import PdfFileFormat
+        from text_extract_api.files.converters.image_to_pdf import ImageToPdfConverter
+        from text_extract_api.files.converters.multi_frame_to_image import MultiFrameToImageConverter
+
+        return {
+            ImageFileFormat: MultiFrameToImageConverter,
+            PdfFileFormat: ImageToPdfConverter,
+        }
+
+    @property
+    def frame_count(self) -> int:
+        with Image.open(BytesIO(self.binary)) as image:
+            return getattr(image, "n_frames", 1)
+
+    @staticmethod
+    def validate(binary_file_content: bytes):
+        try:
+            with Image.open(BytesIO(binary_file_content)) as img:
+                img.verify()
+        except OSError as e:
+            raise ValueError("Corrupted image file content") from e
@@ -1,4 +1,5 @@
-from typing import Type, Callable, Dict, Iterator
+from io import BytesIO
+from typing import Type, Dict, Iterable
 
 from text_extract_api.files.file_formats.file_format import FileFormat
 
@@ -20,14 +21,37 @@ class PdfFileFormat(FileFormat):
         return ImageFileFormat
 
     @staticmethod
-    def convertible_to() -> Dict[Type["FileFormat"], Callable[[], Iterator["FileFormat"]]]:
+    def convertible_to() -> Dict[Type["FileFormat"], Type["Converter"]]:
         from text_extract_api.files.file_formats.image import ImageFileFormat
         from text_extract_api.files.converters.pdf_to_jpeg import PdfToJpegConverter
 
         return {
-            ImageFileFormat: PdfToJpegConverter.convert
+            ImageFileFormat: PdfToJpegConverter
         }
 
+    def extract_pages(self, page_indices: Iterable[int]) -> "PdfFileFormat":
+        """
+        Builds a new PDF with only the given (zero-based) pages, keeping their order.
+        """
+        import pypdfium2 as pdfium
+
+        page_indices = list(page_indices)
+        source = pdfium.PdfDocument(self.binary)
+        target = pdfium.PdfDocument.new()
+        try:
+            target.import_pages(source, page_indices)
+            buffer = BytesIO()
+            target.save(buffer)
+        finally:
+            target.close()
+            source.close()
+
+        return PdfFileFormat.from_binary(
+            binary=buffer.getvalue(),
+            filename=f"{self.filename}_pages_{page_indices[0] + 1}-{page_indices[-1] + 1}.pdf",
+            mime_type="application/pdf"
+        )
+
     @staticmethod
     def validate(binary_file_content: bytes):
         if not binary_file_content.startswith(b'%PDF'):
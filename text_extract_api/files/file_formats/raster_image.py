@@ -0,0 +1,53 @@
+from io import BytesIO
+from typing import Dict, Optional
+
+import numpy as np
+from PIL import Image
+
+from text_extract_api.files.file_formats.image import ImageFileFormat
+
+
+class RasterImageFileFormat(ImageFileFormat):
+    """
+    Decoded page image kept in memory as a NumPy array (HxW grayscale or HxWxC RGB).
+
+    Rasterizers hand pages over in this format, so strategies working on pixels
+    (EasyOCR) skip an encode/decode pass per page. The lossless PNG encoding is only
+    produced when a consumer asks for `binary`.
+
+    `metadata` keeps what page processors found out about the page (e.g. the applied
+    rotation) so strategies can report it with the result.
+    """
+    DEFAULT_FILENAME: str = "image.png"
+    DEFAULT_MIME_TYPE: str = "image/png"
+
+    def __init__(self, image: np.ndarray, filename: Optional[str] = None, metadata: Optional[Dict] = None) -> None:
+        if image is None or image.size == 0:
+            raise ValueError(f"{self.__class__.__name__} missing image data.")
+
+        self.image: np.ndarray = image
+        self.filename: str = filename or self.DEFAULT_FILENAME
+        self.mime_type: str = self.DEFAULT_MIME_TYPE
+        self.metadata: Dict = dict(metadata or {})
+        self._binary_cache: Optional[bytes] = None
+
+    @classmethod
+    def from_pil(cls, image: Image.Image, filename: Optional[str] = None) -> "RasterImageFileFormat":
+        return cls(np.asarray(image), filename)
+
+    @property
+    def binary_file_content(self) -> bytes:
+        if self._binary_cache is None:
+            buffer = BytesIO()
+            Image.fromarray(self.image).save(buffer, format="PNG", compress_level=1)
+            self._binary_cache = buffer.getvalue()
+        return self._binary_cache
+
+    def to_numpy(self, max_side: Optional[int] = None) -> np.ndarray:
+        """ The rendered pixels - pages are already sized by their render profile, `max_side` is not applied """
+        return self.image
+
+    def __repr__(self) -> str:
+        return (
+            f"<RasterImageFileFormat(filename='{self.filename}', shape={self.image.shape}, dtype={self.image.dtype})>"
+        )
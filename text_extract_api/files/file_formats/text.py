@@ -0,0 +1,64 @@
+import codecs
+from typing import Dict, Type
+
+from text_extract_api.files.file_formats.file_format import FileFormat
+
+# Byte order marks, longest first (UTF-32 LE starts with the UTF-16 LE mark)
+BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+class TextFileFormat(FileFormat):
+    """
+    Formats that already contain the text - no OCR or document conversion is needed,
+    they are handled by the `text` strategy.
+    """
+    DEFAULT_FILENAME: str = "document.txt"
+    DEFAULT_MIME_TYPE: str = "text/plain"
+
+    @staticmethod
+    def accepted_mime_types() -> list[str]:
+        return [
+            "text/plain",
+            "text/markdown",
+            "text/x-markdown",
+            "text/csv",
+            "application/csv",
+            "application/json",
+            "text/html",
+        ]
+
+    @staticmethod
+    def is_pageable() -> bool:
+        return False
+
+    @staticmethod
+    def convertible_to() -> Dict[Type["FileFormat"], Type["Converter"]]:
+        return {}
+
+    @property
+    def encoding(self) -> str:
+        """
+        Byte order mark if present, UTF-8 if the beginning of the file decodes as such,
+        Windows-1252 otherwise. Only a sample is decoded - the file is read in a stream later.
+        """
+        sample = self.binary[:65536]
+        for bom, encoding in BOMS:
+            if sample.startswith(bom):
+                return encoding
+        try:
+            # Not final - a multi-byte character cut at the end of the sample is fine
+            codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+            return "utf-8"
+        except UnicodeDecodeError:
+            return "cp1252"
+
+    @staticmethod
+    def validate(binary_file_content: bytes):
+        if not binary_file_content:
+            raise ValueError("Empty file content")
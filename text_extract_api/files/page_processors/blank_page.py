@@ -0,0 +1,45 @@
+from typing import Optional
+
+import numpy as np
+
+from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.page_processors.page_processor import PageProcessor
+
+
+class BlankPageDetector(PageProcessor):
+    """
+    Drops blank pages (separator sheets, empty back sides of duplex scans) so they never
+    reach the OCR engine or the vision model. Works on a small downscaled copy: a page is
+    blank when almost no pixels are clearly darker than the paper.
+
+        skip_blank_pages:
+           max_ink_ratio: 0.002   # share of ink pixels below which the page is blank
+           ink_contrast: 40       # how much darker than the paper a pixel must be to count as ink
+           margin: 0.05           # share of each edge ignored (scanner borders, punch holes)
+    """
+    CONFIG_KEY = "skip_blank_pages"
+    ANALYSIS_SIDE = 400
+
+    def __init__(self, max_ink_ratio: float = 0.002, ink_contrast: int = 40, margin: float = 0.05):
+        self.max_ink_ratio = max_ink_ratio
+        self.ink_contrast = ink_contrast
+        self.margin = margin
+
+    def process(self, page: ImageFileFormat) -> Optional[ImageFileFormat]:
+        if self.is_blank(page.to_numpy()):
+            print(f"Skipping blank page {page.filename}")
+            return None
+        return page
+
+    def is_blank(self, image: np.ndarray) -> bool:
+        gray = self.to_grayscale(self.downscale(image, self.ANALYSIS_SIDE))
+
+        height, width = gray.shape
+        dy, dx = int(height * self.margin), int(width * self.margin)
+        gray = gray[dy:height - dy, dx:width - dx]
+        if gray.size == 0:
+            return True
+
+        paper = np.median(gray)
+        ink_ratio = np.count_nonzero(gray < paper - self.ink_contrast) / gray.size
+        return ink_ratio < self.max_ink_ratio
@@ -0,0 +1,99 @@
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.file_formats.raster_image import RasterImageFileFormat
+from text_extract_api.files.page_processors.page_processor import PageProcessor
+
+
+class OrientationDetector(PageProcessor):
+    """
+    Turns sideways and upside down pages upright before OCR. CPU only heuristics on a
+    downscaled ink mask:
+
+    - 0 vs 90 degrees: letters closed along the text direction merge into wide word blobs,
+      closed across it they stay glyph sized,
+    - 0 vs 180 degrees: in Latin-like scripts ascenders (b, d, h, capitals, digits) put more
+      ink above the x-height band than descenders (g, p, y) put below it.
+
+    The applied rotation (degrees counterclockwise) is recorded in the page metadata.
+
+        orientation:
+           min_ratio: 1.5    # how much one reading must beat the other before the page is rotated
+    """
+    CONFIG_KEY = "orientation"
+    ANALYSIS_SIDE = 1500
+
+    def __init__(self, min_ratio: float = 1.5):
+        self.min_ratio = min_ratio
+
+    def process(self, page: ImageFileFormat) -> Optional[ImageFileFormat]:
+        image = page.to_numpy()
+        turns = self.detect(image)
+        if not turns:
+            return page
+
+        print(f"Rotating page {page.filename} by {turns * 90} degrees")
+        metadata = dict(getattr(page, 'metadata', {}), rotation=turns * 90)
+        return RasterImageFileFormat(np.ascontiguousarray(np.rot90(image, turns)), page.filename, metadata)
+
+    def detect(self, image: np.ndarray) -> int:
+        """ Number of 90 degree counterclockwise turns that make the page upright (0-3) """
+        ink = self.ink_mask(self.to_grayscale(self.downscale(image, self.ANALYSIS_SIDE)))
+        if not ink.any():
+            return 0
+
+        turns = 0
+        horizontal, vertical = self.word_aspect(ink), self.word_aspect(np.ascontiguousarray(ink.T))
+        if vertical > horizontal * self.min_ratio:
+            turns = 1
+            ink = np.rot90(ink)
+
+        ascenders, descenders = self.ascender_balance(ink)
+        if descenders > ascenders * self.min_ratio:
+            turns += 2
+        return turns % 4
+
+    @classmethod
+    def word_aspect(cls, ink: np.ndarray) -> float:
+        """ Median width/height of the blobs left after closing the gaps between letters along the rows """
+        glyph_size = max(cls._median_height(ink), cls._median_height(np.ascontiguousarray(ink.T)))
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (max(3, int(glyph_size * 0.6)), 1))
+        closed = cv2.morphologyEx(ink, cv2.MORPH_CLOSE, kernel)
+
+        _, _, stats, _ = cv2.connectedComponentsWithStats(closed, connectivity=8)
+        widths = stats[1:, cv2.CC_STAT_WIDTH].astype(np.float64)
+        heights = stats[1:, cv2.CC_STAT_HEIGHT].astype(np.float64)
+        keep = (widths >= 3) | (heights >= 3)
+        if not keep.any():
+            return 0.0
+        return float(np.median(widths[keep] / heights[keep]))
+
+    @staticmethod
+    def ascender_balance(ink: np.ndarray) -> Tuple[float, float]:
+        """
+        Ink above and below the x-height band summed over all text lines. The band of
+        a line is where its row profile reaches half of the line's peak.
+        """
+        profile = ink.sum(axis=1, dtype=np.float64)
+        in_line = (profile > profile.max() * 0.02).astype(np.int8)
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], in_line, [0]])))
+
+        ascenders = descenders = 0.0
+        for start, end in zip(edges[::2], edges[1::2]):
+            line = profile[start:end]
+            if len(line) < 5:
+                continue
+            band = np.flatnonzero(line >= line.max() * 0.5)
+            ascenders += line[:band[0]].sum()
+            descenders += line[band[-1] + 1:].sum()
+        return ascenders, descenders
+
+    @staticmethod
+    def _median_height(ink: np.ndarray) -> float:
+        _, _, stats, _ = cv2.connectedComponentsWithStats(ink, connectivity=8)
+        heights = stats[1:, cv2.CC_STAT_HEIGHT]
+        heights = heights[heights >= 3]
+        return float(np.median(heights)) if len(heights) else 0.0
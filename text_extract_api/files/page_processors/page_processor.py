@@ -0,0 +1,58 @@
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+from text_extract_api.files.file_formats.image import ImageFileFormat
+
+
+class PageProcessor:
+    """
+    Transforms a single rendered page before it is passed to a strategy.
+
+    Each processor reads its own `CONFIG_KEY` section of the strategy config
+    (`config/strategies.yaml`) and is skipped when the section is missing or disabled.
+    """
+    CONFIG_KEY: str = ""
+
+    @classmethod
+    def from_config(cls, strategy_config: Dict) -> Optional["PageProcessor"]:
+        config = (strategy_config or {}).get(cls.CONFIG_KEY)
+        if not config:
+            return None
+        if config is True:
+            config = {}
+        if not config.get('enabled', True):
+            return None
+        return cls(**{key: value for key, value in config.items() if key != 'enabled'})
+
+    def process(self, page: ImageFileFormat) -> Optional[ImageFileFormat]:
+        """
+        Returns the processed page, or None when the page should not be passed to the strategy at all.
+        """
+        raise NotImplementedError("Subclasses must implement the `process` method.")
+
+    @staticmethod
+    def to_grayscale(image: np.ndarray) -> np.ndarray:
+        if image.dtype == bool:
+            # Bilevel (mode "1") images, e.g. fax TIFFs
+            return image.astype(np.uint8) * 255
+        if image.ndim == 2:
+            return image
+        if image.shape[2] == 4:
+            return cv2.cvtColor(image, cv2.COLOR_RGBA2GRAY)
+        return cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+
+    @staticmethod
+    def downscale(image: np.ndarray, max_side: int) -> np.ndarray:
+        """ Cheap working copy for statistics - never upscales """
+        scale = max_side / max(image.shape[:2])
+        if scale >= 1:
+            return image
+        return cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    @staticmethod
+    def ink_mask(gray: np.ndarray) -> np.ndarray:
+        """ 1 for ink, 0 for paper (Otsu threshold) """
+        _, mask = cv2.threshold(gray, 0, 1, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+        return mask
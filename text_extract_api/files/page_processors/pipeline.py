@@ -0,0 +1,36 @@
+from typing import Dict, Iterable, Iterator, List
+
+from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.page_processors.blank_page import BlankPageDetector
+from text_extract_api.files.page_processors.orientation import OrientationDetector
+from text_extract_api.files.page_processors.page_processor import PageProcessor
+from text_extract_api.files.page_processors.preprocessor import Preprocessor
+
+
+class PagePipeline:
+    """
+    Chain of page processors run on every page between the converters and a strategy.
+    """
+    # Order matters - cheap checks that can drop a page go first, pages are upright before deskew
+    PROCESSORS = [BlankPageDetector, OrientationDetector, Preprocessor]
+
+    def __init__(self, processors: List[PageProcessor]):
+        self.processors = processors
+
+    @classmethod
+    def from_config(cls, strategy_config: Dict) -> "PagePipeline":
+        processors = [processor_class.from_config(strategy_config) for processor_class in cls.PROCESSORS]
+        return cls([processor for processor in processors if processor is not None])
+
+    def __bool__(self) -> bool:
+        return bool(self.processors)
+
+    def process(self, pages: Iterable[ImageFileFormat]) -> Iterator[ImageFileFormat]:
+        """ Yields each page once processed - pages are not kept, dropped pages are skipped """
+        for page in pages:
+            for processor in self.processors:
+                page = processor.process(page)
+                if page is None:
+                    break
+            if page is not None:
+                yield page
@@ -0,0 +1,140 @@
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from text_extract_api.files.file_formats.image import ImageFileFormat
+from text_extract_api.files.file_formats.raster_image import RasterImageFileFormat
+from text_extract_api.files.page_processors.page_processor import PageProcessor
+
+
+class Preprocessor(PageProcessor):
+    """
+    Cleans up scanned pages before OCR: deskew, border cropping, resize to a target text
+    height and adaptive binarization. Statistics are computed on a downscaled copy; only
+    the final geometric transform touches the full resolution page.
+
+        preprocessing:
+           deskew: true
+           max_skew: 5               # degrees searched in both directions
+           crop_borders: true
+           target_text_height: 32    # median glyph height in px after resize, 0 - keep size
+           binarize: false
+    """
+    CONFIG_KEY = "preprocessing"
+    ANALYSIS_SIDE = 1000
+
+    def __init__(self, deskew: bool = True, max_skew: float = 5.0, crop_borders: bool = True,
+                 target_text_height: int = 32, binarize: bool = False):
+        self.deskew = deskew
+        self.max_skew = max_skew
+        self.crop_borders = crop_borders
+        self.target_text_height = target_text_height
+        self.binarize = binarize
+
+    def process(self, page: ImageFileFormat) -> Optional[ImageFileFormat]:
+        image = self.to_grayscale(page.to_numpy())
+
+        if self.deskew:
+            angle = self.detect_skew(image)
+            if abs(angle) >= 0.1:
+                image = self.rotate(image, angle)
+
+        if self.crop_borders:
+            image = self.crop(image)
+
+        if self.target_text_height:
+            scale = self.text_scale(image)
+            if abs(scale - 1) > 0.15:
+                interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_CUBIC
+                image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=interpolation)
+
+        if self.binarize:
+            block_size = max(3, (min(image.shape[:2]) // 50) | 1)
+            image = cv2.adaptiveThreshold(image, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,
+                                          block_size, 15)
+
+        return RasterImageFileFormat(image, page.filename, getattr(page, 'metadata', None))
+
+    def detect_skew(self, image: np.ndarray) -> float:
+        """
+        Projection profile search: text lines aligned with the rows give the sharpest
+        row-to-row changes in ink. Returns the angle (degrees) that straightens the page.
+        """
+        ink = self.ink_mask(self.downscale(image, self.ANALYSIS_SIDE))
+        if not ink.any():
+            return 0.0
+
+        height, width = ink.shape
+        center = (width / 2, height / 2)
+        best_angle, best_score = 0.0, -1.0
+        for angle in np.arange(-self.max_skew, self.max_skew + 0.25, 0.5):
+            matrix = cv2.getRotationMatrix2D(center, float(angle), 1.0)
+            rotated = cv2.warpAffine(ink, matrix, (width, height), flags=cv2.INTER_NEAREST)
+            profile = rotated.sum(axis=1, dtype=np.float64)
+            score = float(np.square(np.diff(profile)).sum())
+            if score > best_score:
+                best_angle, best_score = float(angle), score
+        return best_angle
+
+    @staticmethod
+    def rotate(image: np.ndarray, angle: float) -> np.ndarray:
+        height, width = image.shape[:2]
+        matrix = cv2.getRotationMatrix2D((width / 2, height / 2), angle, 1.0)
+        return cv2.warpAffine(image, matrix, (width, height), flags=cv2.INTER_LINEAR,
+                              borderMode=cv2.BORDER_CONSTANT, borderValue=255)
+
+    def crop(self, image: np.ndarray, margin: int = 10) -> np.ndarray:
+        """
+        Drops dark scanner borders (rows/columns that are almost all ink at the page edges)
+        and empty margins around the content.
+        """
+        small = self.downscale(image, self.ANALYSIS_SIDE)
+        scale = image.shape[0] / small.shape[0]
+        ink = self.ink_mask(small)
+
+        rows = ink.mean(axis=1)
+        cols = ink.mean(axis=0)
+        top, bottom = self._border_span(rows)
+        left, right = self._border_span(cols)
+        content = ink[top:bottom, left:right]
+        if content.size == 0 or not content.any():
+            return image
+
+        ys = np.flatnonzero(content.any(axis=1))
+        xs = np.flatnonzero(content.any(axis=0))
+        y0 = max(0, int((top + ys[0]) * scale) - margin)
+        y1 = min(image.shape[0], int((top + ys[-1] + 1) * scale) + margin)
+        x0 = max(0, int((left + xs[0]) * scale) - margin)
+        x1 = min(image.shape[1], int((left + xs[-1] + 1) * scale) + margin)
+        return image[y0:y1, x0:x1]
+
+    def text_scale(self, image: np.ndarray) -> float:
+        """ Scale factor bringing the median glyph height to `target_text_height` """
+        small = self.downscale(image, self.ANALYSIS_SIDE * 2)
+        scale = image.shape[0] / small.shape[0]
+        count, _, stats, _ = cv2.connectedComponentsWithStats(self.ink_mask(small), connectivity=8)
+
+        heights = stats[1:, cv2.CC_STAT_HEIGHT]
+        widths = stats[1:, cv2.CC_STAT_WIDTH]
+        # Glyph-like components only - no specks, rules or pictures
+        glyphs = heights[(heights >= 4) & (heights < small.shape[0] * 0.1) & (widths < heights * 5)]
+        if len(glyphs) < 20:
+            return 1.0
+
+        text_height = float(np.median(glyphs)) * scale
+        return float(np.clip(self.target_text_height / text_height, 0.25, 2.0))
+
+    @staticmethod
+    def _border_span(profile: np.ndarray, threshold: float = 0.8):
+        start, end = 0, len(profile)
+        while start < end and profile[start] > threshold:
+            start += 1
+        while end > start and profile[end - 1] > threshold:
+            end -= 1
+        # The downscaled copy blends the edge of a border into the next line - dropped with the border
+        if start > 0:
+            start = min(start + 1, end)
+        if end < len(profile):
+            end = max(end - 1, start)
+        return start, end
@@ -0,0 +1,202 @@
+import errno
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+SHARED_MEMORY_PATH = '/dev/shm'
+# Left free for other users of the shared memory (e.g. torch DataLoader workers)
+SHARED_MEMORY_RESERVE = 16 * 1024 * 1024
+
+
+class _Segment(SharedMemory):
+    """ Mapping of an existing segment, viewed by NumPy arrays """
+
+    def __del__(self):
+        try:
+            self.close()
+        except BufferError:
+            # Arrays outlived the segment object (interpreter shutdown) - the OS unmaps it on exit
+            pass
+
+
+# Segments whose mapping could not be closed yet because arrays viewing them were still alive
+_orphans: List[SharedMemory] = []
+_orphans_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class SharedPage:
+    """
+    Handle of a page raster kept in a shared memory segment. Only this small handle is
+    pickled between processes - the pixels are written once and read in place.
+    """
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+    @classmethod
+    def write(cls, array: np.ndarray) -> "SharedPage":
+        """
+        Copies the array into a new segment, e.g. in a rasterizer process. The segment
+        outlives this process - a PageBufferPool has to adopt it and unlink it.
+
+        Raises OSError (ENOSPC) when the page does not fit into the free shared memory - callers
+        pass the array itself instead (e.g. pickled), a small Docker /dev/shm fills up quickly.
+        """
+        available = shared_memory_available()
+        if available is not None and array.nbytes + SHARED_MEMORY_RESERVE > available:
+            raise OSError(errno.ENOSPC, f"Page of {array.nbytes} bytes does not fit into {available} bytes "
+                                        f"of free shared memory")
+
+        segment = SharedMemory(create=True, size=max(1, array.nbytes))
+        try:
+            _allocate(segment)
+            np.ndarray(array.shape, array.dtype, buffer=segment.buf)[...] = array
+        except BaseException:
+            segment.close()
+            segment.unlink()
+            raise
+        segment.close()
+        return cls(segment.name, tuple(array.shape), array.dtype.str)
+
+    @contextmanager
+    def attach(self) -> Iterator[np.ndarray]:
+        """
+        Zero-copy view of the page for other processes (e.g. OCR workers). The view
+        is only valid inside the `with` block - copy what has to outlive it.
+        """
+        segment = _Segment(name=self.name)
+        try:
+            yield _as_array(segment, self)
+        finally:
+            _close(segment)
+
+
+class PageBufferPool:
+    """
+    Owns the shared memory segments holding page rasters of one task. Segments are
+    reference counted: a segment is unlinked when the last holder releases it, and at
+    the latest when the pool is closed at task end - even if the task failed halfway.
+
+        with PageBufferPool() as page_buffers:
+            page = page_buffers.adopt(future.result())  # written by a rasterizer process
+            image = page_buffers.view(page)
+            ...
+            page_buffers.release(page)
+    """
+
+    def __init__(self):
+        self._refs: Dict[str, int] = {}
+        # Mappings of segments viewed in this process
+        self._segments: Dict[str, SharedMemory] = {}
+        self._lock = threading.Lock()
+
+    def put(self, array: np.ndarray) -> SharedPage:
+        return self.adopt(SharedPage.write(array))
+
+    def adopt(self, page: SharedPage) -> SharedPage:
+        """ Takes over a segment created by another process, with one reference """
+        with self._lock:
+            self._refs[page.name] = self._refs.get(page.name, 0) + 1
+        return page
+
+    def retain(self, page: SharedPage) -> SharedPage:
+        with self._lock:
+            if page.name not in self._refs:
+                raise ValueError(f"Page buffer {page.name} is not owned by this pool")
+            self._refs[page.name] += 1
+        return page
+
+    def release(self, page: SharedPage) -> None:
+        with self._lock:
+            refs = self._refs.get(page.name, 0) - 1
+            if refs > 0:
+                self._refs[page.name] = refs
+                return
+            self._refs.pop(page.name, None)
+            self._unlink(page.name)
+
+    def view(self, page: SharedPage) -> np.ndarray:
+        """ Zero-copy array in this process, valid until the page is released """
+        with self._lock:
+            if page.name not in self._refs:
+                raise ValueError(f"Page buffer {page.name} is not owned by this pool")
+            segment = self._segments.get(page.name)
+            if segment is None:
+                segment = self._segments[page.name] = _Segment(name=page.name)
+        return _as_array(segment, page)
+
+    def close(self) -> None:
+        with self._lock:
+            names = list(self._refs)
+            self._refs.clear()
+            for name in names:
+                self._unlink(name)
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def __enter__(self) -> "PageBufferPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _unlink(self, name: str) -> None:
+        segment = self._segments.pop(name, None)
+        try:
+            segment = segment or SharedMemory(name=name)
+        except FileNotFoundError:
+            return
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+        _close(segment)
+
+
+def shared_memory_available() -> Optional[int]:
+    """ Free bytes of the shared memory filesystem, None where it can't be told (no /dev/shm) """
+    try:
+        stat = os.statvfs(SHARED_MEMORY_PATH)
+    except (AttributeError, OSError):
+        return None
+    return stat.f_bavail * stat.f_frsize
+
+
+def _allocate(segment: SharedMemory) -> None:
+    """
+    Reserves the memory of a new segment: a segment is created sparse, and writing to it once
+    the filesystem is full kills the process with SIGBUS - allocating fails with ENOSPC instead.
+    """
+    fd = getattr(segment, '_fd', -1)
+    if fd >= 0 and hasattr(os, 'posix_fallocate'):
+        os.posix_fallocate(fd, 0, segment.size)
+
+
+def _as_array(segment: SharedMemory, page: SharedPage) -> np.ndarray:
+    # frombuffer holds the buffer export, so the mapping can't be closed under a live array
+    # (np.ndarray(buffer=...) does not - closing would leave it pointing to unmapped memory)
+    dtype = np.dtype(page.dtype)
+    count = int(np.prod(page.shape, dtype=np.int64))
+    return np.frombuffer(segment.buf, dtype=dtype, count=count).reshape(page.shape)
+
+
+def _close(segment: SharedMemory) -> None:
+    """
+    Closes the mapping, or keeps it for later when arrays still view it - the memory of
+    an unlinked segment is freed once the last mapping is closed. Retries earlier ones.
+    """
+    with _orphans_lock:
+        pending = _orphans[:] + [segment]
+        _orphans.clear()
+        for candidate in pending:
+            try:
+                candidate.close()
+            except BufferError:
+                _orphans.append(candidate)
@@ -46,7 +46,8 @@ async def ocr_endpoint(
         ocr_cache: bool = Form(...),
         storage_profile: str = Form('default'),
         storage_filename: str = Form(None),
-        language: str = Form('en')
+        language: str = Form('en'),
+        render_profile: str = Form(None)
 ):
     """
     Endpoint to extract text from an uploaded PDF, Image or Office file using different OCR strategies.
@@ -55,7 +56,8 @@ async def ocr_endpoint(
     # Validate input
     try:
         OcrFormRequest(strategy=strategy, prompt=prompt, model=model, ocr_cache=ocr_cache,
-                       storage_profile=storage_profile, storage_filename=storage_filename, language=language)
+                       storage_profile=storage_profile, storage_filename=storage_filename, language=language,
+                       render_profile=render_profile)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -64,13 +66,13 @@ async def ocr_endpoint(
     file_format = FileFormat.from_binary(file_binary, filename, file.content_type)
 
     print(
-        f"Processing Document {file_format.filename} with strategy: {strategy}, ocr_cache: {ocr_cache}, model: {model}, storage_profile: {storage_profile}, storage_filename: {storage_filename}, language: {language}, will be saved as: {filename}")
+        f"Processing Document {file_format.filename} with strategy: {strategy}, ocr_cache: {ocr_cache}, model: {model}, storage_profile: {storage_profile}, storage_filename: {storage_filename}, language: {language}, render_profile: {render_profile}, will be saved as: {filename}")
 
     # Asynchronous processing using Celery
     task = ocr_task.apply_async(
         args=[file_format.binary, strategy, file_format.filename, file_format.hash, ocr_cache, prompt, model, language,
               storage_profile,
-              storage_filename])
+              storage_filename, render_profile])
     return {"task_id": task.id}
 
 
@@ -84,13 +86,15 @@ async def ocr_upload_endpoint(
         ocr_cache: bool = Form(...),
         storage_profile: str = Form('default'),
         storage_filename: str = Form(None),
-        language: str = Form('en')
+        language: str = Form('en'),
+        render_profile: str = Form(None)
 ):
     """
     Alias endpoint to extract text from an uploaded PDF/Office/Image file using different OCR strategies.
     Supports both synchronous and asynchronous processing.
     """
-    return await ocr_endpoint(strategy, prompt, model, file, ocr_cache, storage_profile, storage_filename, language)
+    return await ocr_endpoint(strategy, prompt, model, file, ocr_cache, storage_profile, storage_filename, language,
+                              render_profile)
 
 
 class OllamaGenerateRequest(BaseModel):
@@ -111,6 +115,7 @@ class OcrRequest(BaseModel):
     storage_profile: Optional[str] = Field('default', description="Storage profile to use")
     storage_filename: Optional[str] = Field(None, description="Storage filename to use")
     language: Optional[str] = Field('en', description="Language to use for OCR")
+    render_profile: Optional[str] = Field(None, description="Render profile to rasterize pages with")
 
     @field_validator('strategy')
     def validate_strategy(cls, v):
@@ -123,6 +128,12 @@ class OcrRequest(BaseModel):
             raise ValueError(f"Storage profile '{v}' does not exist.")
         return v
 
+    @field_validator('render_profile')
+    def validate_render_profile(cls, v):
+        if v:
+            Strategy.get_render_profile(v)
+        return v
+
 
 class OcrFormRequest(BaseModel):
     strategy: str = Field(..., description="OCR strategy to use")
@@ -132,6 +143,7 @@ class OcrFormRequest(BaseModel):
     storage_profile: Optional[str] = Field('default', description="Storage profile to use")
     storage_filename: Optional[str] = Field(None, description="Storage filename to use")
     language: Optional[str] = Field('en', description="Language to use for OCR")
+    render_profile: Optional[str] = Field(None, description="Render profile to rasterize pages with")
 
     @field_validator('strategy')
     def validate_strategy(cls, v):
@@ -146,6 +158,12 @@ class OcrFormRequest(BaseModel):
             raise ValueError(f"Storage profile '{v}' does not exist.")
         return v
 
+    @field_validator('render_profile')
+    def validate_render_profile(cls, v):
+        if v:
+            Strategy.get_render_profile(v)
+        return v
+
 
 @app.post("/ocr/request")
 async def ocr_request_endpoint(request: OcrRequest):
@@ -162,12 +180,13 @@ async def ocr_request_endpoint(request: OcrRequest):
         raise HTTPException(status_code=400, detail=str(e))
 
     print(
-        f"Processing {file.mime_type} with strategy: {request.strategy}, ocr_cache: {request.ocr_cache}, model: {request.model}, storage_profile: {request.storage_profile}, storage_filename: {request.storage_filename}, language: {request.language}")
+        f"Processing {file.mime_type} with strategy: {request.strategy}, ocr_cache: {request.ocr_cache}, model: {request.model}, storage_profile: {request.storage_profile}, storage_filename: {request.storage_filename}, language: {request.language}, render_profile: {request.render_profile}")
 
     # Asynchronous processing using Celery
     task = ocr_task.apply_async(
         args=[file.binary, request.strategy, file.filename, file.hash, request.ocr_cache, request.prompt,
-              request.model, request.language, request.storage_profile, request.storage_filename])
+              request.model, request.language, request.storage_profile, request.storage_filename,
+              request.render_profile])
     return {"task_id": task.id}
 
 
@@ -0,0 +1,105 @@
+import os
+from typing import Optional
+
+
+def available_cpu_count() -> int:
+    """
+    Number of CPUs this process may actually use: the scheduler affinity mask, further
+    limited by the cgroup CPU quota when running in a container (Docker/Kubernetes limits).
+    """
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        count = min(count, max(1, int(quota)))
+
+    return max(1, count)
+
+
+def _cgroup_cpu_quota():
+    # cgroup v2
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+        if quota != 'max':
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+
+    # cgroup v1
+    try:
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+            quota = int(f.read())
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+            period = int(f.read())
+        if quota > 0 and period > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+
+    return None
+
+
+def available_memory_bytes(gpu: bool = False) -> Optional[int]:
+    """
+    Memory available for new allocations: free memory of the current CUDA device with `gpu`,
+    otherwise MemAvailable of the host, further limited by the cgroup memory limit when running
+    in a container. None when it can't be determined.
+    """
+    if gpu:
+        try:
+            import torch
+            if torch.cuda.is_available():
+                free, _ = torch.cuda.mem_get_info()
+                return int(free)
+        except (ImportError, RuntimeError):
+            pass
+        return None
+
+    available = _meminfo_available()
+    headroom = _cgroup_memory_headroom()
+    if available is None or headroom is None:
+        return available if headroom is None else headroom
+    return min(available, headroom)
+
+
+def _meminfo_available() -> Optional[int]:
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _cgroup_memory_headroom() -> Optional[int]:
+    # cgroup v2
+    try:
+        with open('/sys/fs/cgroup/memory.max') as f:
+            limit = f.read().strip()
+        with open('/sys/fs/cgroup/memory.current') as f:
+            usage = int(f.read())
+        if limit != 'max':
+            return max(0, int(limit) - usage)
+        return None
+    except (OSError, ValueError):
+        pass
+
+    # cgroup v1 - "no limit" is reported as a huge number
+    try:
+        with open('/sys/fs/cgroup/memory/memory.limit_in_bytes') as f:
+            limit = int(f.read())
+        with open('/sys/fs/cgroup/memory/memory.usage_in_bytes') as f:
+            usage = int(f.read())
+        if limit < 1 << 60:
+            return max(0, limit - usage)
+    except (OSError, ValueError):
+        pass
+
+    return None